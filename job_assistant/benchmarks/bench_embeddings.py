@@ -0,0 +1,132 @@
+"""Benchmark: torch vs int8 ONNX embedding backends.
+
+Each backend runs in its own subprocess so peak RSS is measured in
+isolation. Reports load time, throughput on the knowledge base chunks,
+peak RSS, and recall@k of ONNX retrieval against the torch results.
+
+Usage:
+    py benchmarks/bench_embeddings.py [--repeats 3] [--k 5]
+
+The ONNX backend needs ``pip install optimum[onnxruntime]``.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import numpy as np
+from rich.console import Console
+from rich.table import Table
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from job_assistant.config import settings  # noqa: E402
+from job_assistant.rag.knowledge_base import load_knowledge_base  # noqa: E402
+
+console = Console()
+
+QUERIES = [
+    "experience with Python", "experience with SQL", "experience with Excel",
+    "experience with Power BI", "experience with IFRS", "financial reporting",
+    "budgeting and forecasting", "stakeholder management", "team leadership",
+    "process improvement", "customer service", "project management",
+    "professional profile experience achievements",
+    "professional profile achievements skills",
+]
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None  # Not available on Windows
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _worker(backend: str, repeats: int, out_dir: Path) -> None:
+    """Embed chunks and queries with one backend and report measurements."""
+    from job_assistant.rag.embeddings import get_embedding_function
+
+    settings.embedding_backend = backend
+    texts = [c["text"] for c in load_knowledge_base()]
+
+    start = time.perf_counter()
+    ef = get_embedding_function()
+    load_s = time.perf_counter() - start
+
+    ef(texts[:2])  # Warm up
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        chunk_vectors = ef(texts)
+        timings.append(time.perf_counter() - start)
+
+    np.save(out_dir / f"{backend}_chunks.npy", np.asarray(chunk_vectors, dtype=np.float32))
+    np.save(out_dir / f"{backend}_queries.npy", np.asarray(ef(QUERIES), dtype=np.float32))
+    print(json.dumps({
+        "load_s": load_s,
+        "texts_per_s": len(texts) / min(timings),
+        "rss_mb": _peak_rss_mb(),
+    }))
+
+
+def _top_k(out_dir: Path, backend: str, k: int) -> np.ndarray:
+    chunks = np.load(out_dir / f"{backend}_chunks.npy")
+    queries = np.load(out_dir / f"{backend}_queries.npy")
+    chunks /= np.linalg.norm(chunks, axis=1, keepdims=True)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    return np.argsort(-(queries @ chunks.T), axis=1)[:, :k]
+
+
+@click.command()
+@click.option("--repeats", default=3, show_default=True, help="Runs per measurement.")
+@click.option("--k", default=5, show_default=True, help="Cut-off for recall@k.")
+@click.option("--worker", default=None, hidden=True)
+@click.option("--out-dir", default=None, hidden=True)
+def main(repeats, k, worker, out_dir):
+    if worker:
+        _worker(worker, repeats, Path(out_dir))
+        return
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in ("torch", "onnx"):
+            proc = subprocess.run(
+                [sys.executable, __file__, "--worker", backend, "--out-dir", tmp,
+                 "--repeats", str(repeats)],
+                capture_output=True, text=True,
+            )
+            if proc.returncode != 0:
+                console.print(f"[red]{backend} backend failed:[/red]\n{proc.stderr[-2000:]}")
+                continue
+            results[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+
+        if "torch" in results and "onnx" in results:
+            reference = _top_k(Path(tmp), "torch", k)
+            candidate = _top_k(Path(tmp), "onnx", k)
+            overlap = [len(set(r) & set(c)) / k for r, c in zip(reference, candidate)]
+            results["onnx"]["recall"] = float(np.mean(overlap))
+            results["torch"]["recall"] = 1.0
+
+    table = Table(title=f"Embedding backends ({settings.embedding_model})")
+    table.add_column("Backend")
+    table.add_column("Load (s)", justify="right")
+    table.add_column("Texts/s", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column(f"Recall@{k} vs torch", justify="right")
+    for backend, r in results.items():
+        rss = f"{r['rss_mb']:.0f}" if r["rss_mb"] is not None else "n/a"
+        recall = f"{r['recall']:.3f}" if "recall" in r else "n/a"
+        table.add_row(backend, f"{r['load_s']:.2f}", f"{r['texts_per_s']:.0f}", rss, recall)
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark: fused writer+advisor call vs separate writer and advisor calls.
+
+For each synthetic posting the job and match analyses are produced once,
+then the application materials and advice are generated both ways: two
+concurrent calls (the default graph branches) and one fused call. Reports
+prompt/completion tokens, estimated cost and wall time per posting.
+
+With the default fake provider, token counts reflect the real prompts but
+latency is simulated (``--latency-ms`` per call). Use ``--provider gemini``
+(needs GOOGLE_API_KEY, uses quota) for real latencies.
+
+Usage:
+    py benchmarks/bench_fused.py [--postings 5] [--provider fake] [--latency-ms 200]
+
+Requires an indexed knowledge base (``py run.py --reindex``).
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+# Ensure the project root is on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_assistant.config import settings  # noqa: E402
+
+console = Console()
+
+SKILLS = [
+    "Python", "SQL", "Excel", "Power BI", "IFRS", "financial modelling",
+    "budgeting", "forecasting", "stakeholder management", "Xero", "payroll",
+]
+
+
+def _posting(i: int) -> str:
+    skills = ", ".join(SKILLS[(i + j) % len(SKILLS)] for j in range(5))
+    return (
+        f"Finance Analyst {i} at Example Ltd, Bristol (hybrid).\n"
+        f"Required: {skills}.\n"
+        "Responsibilities: monthly reporting, budgeting support, "
+        "process improvement and ad hoc analysis for senior stakeholders."
+    )
+
+
+async def _measure(make_calls) -> dict:
+    """Wall time and summed token usage of the agent calls ``make_calls()`` awaits."""
+    from job_assistant.utils.metrics import collect_agent_calls
+
+    with collect_agent_calls() as calls:
+        start = time.perf_counter()
+        # Created inside the collector, so gathered tasks inherit its context
+        await make_calls()
+        wall_ms = (time.perf_counter() - start) * 1000
+    return {
+        "wall_ms": wall_ms,
+        "calls": len(calls),
+        "prompt_tokens": sum(c["prompt_tokens"] for c in calls),
+        "completion_tokens": sum(c["completion_tokens"] for c in calls),
+        "cost_usd": sum(c["cost_usd"] for c in calls),
+    }
+
+
+async def _run(postings: int) -> dict[str, list[dict]]:
+    from job_assistant.agents.advisor import StrategyAdvisorAgent
+    from job_assistant.agents.analyzer import JobAnalyzerAgent
+    from job_assistant.agents.matcher import SkillMatcherAgent
+    from job_assistant.agents.registry import get_agent
+    from job_assistant.agents.writer import ContentWriterAgent
+    from job_assistant.agents.writer_advisor import WriterAdvisorAgent
+
+    writer = get_agent(ContentWriterAgent)
+    advisor = get_agent(StrategyAdvisorAgent)
+    fused = get_agent(WriterAdvisorAgent)
+
+    results: dict[str, list[dict]] = {"Two calls": [], "Fused": []}
+    for i in range(postings):
+        job_analysis = await get_agent(JobAnalyzerAgent).arun(job_text=_posting(i))
+        match_analysis = await get_agent(SkillMatcherAgent).arun(job_analysis=job_analysis)
+        inputs = {"job_analysis": job_analysis, "match_analysis": match_analysis}
+
+        results["Two calls"].append(await _measure(
+            lambda: asyncio.gather(writer.arun(**inputs), advisor.arun(**inputs))
+        ))
+        results["Fused"].append(await _measure(lambda: fused.arun(**inputs)))
+    return results
+
+
+@click.command()
+@click.option("--postings", default=5, show_default=True, help="Postings to generate for.")
+@click.option("--provider", type=click.Choice(["fake", "gemini"]), default="fake",
+              show_default=True, help="LLM provider to measure.")
+@click.option("--latency-ms", default=200.0, show_default=True,
+              help="Simulated latency of each call (fake provider only).")
+def main(postings, provider, latency_ms):
+    settings.llm_provider = provider
+    settings.fake_llm_latency_ms = latency_ms
+    settings.llm_cache_enabled = False
+    if provider == "fake":
+        settings.llm_requests_per_minute = 0
+        settings.llm_tokens_per_minute = 0
+    elif not settings.google_api_key:
+        console.print("[red]GOOGLE_API_KEY not set.[/red]")
+        raise SystemExit(1)
+
+    results = asyncio.run(_run(postings))
+
+    table = Table(title=f"Writer + advisor per posting ({provider}, {postings} postings)")
+    table.add_column("Path")
+    table.add_column("Calls", justify="right")
+    table.add_column("Prompt tokens", justify="right")
+    table.add_column("Completion tokens", justify="right")
+    table.add_column("Cost (USD)", justify="right")
+    table.add_column("Wall p50 ms", justify="right", style="bold green")
+
+    means = {}
+    for path, rows in results.items():
+        means[path] = {key: statistics.mean(r[key] for r in rows) for key in rows[0]}
+        table.add_row(
+            path,
+            f"{means[path]['calls']:.0f}",
+            f"{means[path]['prompt_tokens']:,.0f}",
+            f"{means[path]['completion_tokens']:,.0f}",
+            f"{means[path]['cost_usd']:.5f}",
+            f"{statistics.median(r['wall_ms'] for r in rows):.0f}",
+        )
+    console.print(table)
+
+    two, one = means["Two calls"], means["Fused"]
+    saved = two["prompt_tokens"] - one["prompt_tokens"]
+    share = saved / max(two["prompt_tokens"], 1)
+    console.print(
+        f"Fused saves {saved:,.0f} prompt tokens per posting ({share:.0%}) "
+        f"and {two['calls'] - one['calls']:.0f} request(s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark: end-to-end pipeline throughput and overhead with the fake LLM.
+
+Runs synthetic postings through the async pipeline using the offline fake
+provider, so everything except the model (retrieval, prompt building,
+orchestration, parsing, storage) is measured without network access or an
+API key. Results are written to a temporary directory, not data/ or output/.
+
+Usage:
+    py benchmarks/bench_pipeline.py [--postings 32] [--latency-ms 200]
+
+Requires an indexed knowledge base (``py run.py --reindex``).
+"""
+
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+# Ensure the project root is on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_assistant.config import settings  # noqa: E402
+
+console = Console()
+
+SKILLS = [
+    "Python", "SQL", "Excel", "Power BI", "IFRS", "financial modelling",
+    "budgeting", "forecasting", "stakeholder management", "Xero", "payroll",
+    "VAT returns", "process improvement", "team leadership", "Agile",
+]
+
+CONCURRENCY = (1, 4, 16)
+
+# LLM calls on the critical path: analyzer, matcher, then writer ∥ advisor
+_SEQUENTIAL_CALLS = 3
+
+
+def _posting(i: int) -> str:
+    """A synthetic job posting; distinct per ``i`` so nothing is cached."""
+    skills = ", ".join(SKILLS[(i + j) % len(SKILLS)] for j in range(5))
+    return (
+        f"Finance Analyst {i} at Example Ltd, Bristol (hybrid).\n"
+        f"Required: {skills}.\n"
+        "Responsibilities: monthly reporting, budgeting support, "
+        "process improvement and ad hoc analysis for senior stakeholders."
+    )
+
+
+async def _run_batch(postings: list[str], concurrency: int, graph) -> list[float]:
+    from job_assistant.orchestration.graph import arun_pipeline
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(text: str) -> float:
+        async with semaphore:
+            start = time.perf_counter()
+            state = await arun_pipeline({"job_text": text}, graph)
+            if state.get("error"):
+                raise RuntimeError(state["error"])
+            return (time.perf_counter() - start) * 1000
+
+    return await asyncio.gather(*(one(text) for text in postings))
+
+
+@click.command()
+@click.option("--postings", default=32, show_default=True, help="Postings per run.")
+@click.option("--latency-ms", default=200.0, show_default=True,
+              help="Simulated latency of each LLM call.")
+def main(postings, latency_ms):
+    settings.llm_provider = "fake"
+    settings.fake_llm_latency_ms = latency_ms
+    settings.llm_requests_per_minute = 0
+    settings.llm_tokens_per_minute = 0
+    settings.llm_cache_enabled = False
+
+    from job_assistant.orchestration.graph import build_graph
+    from job_assistant.storage import database, exporter
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="bench_pipeline_"))
+    database.DB_PATH = tmp_dir / "applications.db"
+    exporter.OUTPUT_DIR = tmp_dir / "output"
+
+    graph = build_graph()
+    # Warm up the embedding model, indexes and clients outside the timings
+    asyncio.run(_run_batch([_posting(-1)], 1, graph))
+
+    model_ms = _SEQUENTIAL_CALLS * latency_ms
+    table = Table(title=f"Pipeline with fake LLM ({latency_ms:.0f} ms per call)")
+    table.add_column("Concurrency", justify="right")
+    table.add_column("Postings/s", justify="right", style="bold green")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Overhead p50 ms", justify="right")
+
+    offset = 0
+    for concurrency in CONCURRENCY:
+        batch = [_posting(offset + i) for i in range(postings)]
+        offset += postings
+        start = time.perf_counter()
+        latencies = asyncio.run(_run_batch(batch, concurrency, graph))
+        elapsed = time.perf_counter() - start
+
+        p50 = statistics.median(latencies)
+        p95 = sorted(latencies)[max(int(len(latencies) * 0.95) - 1, 0)]
+        table.add_row(
+            str(concurrency),
+            f"{postings / elapsed:.1f}",
+            f"{p50:.0f}",
+            f"{p95:.0f}",
+            f"{p50 - model_ms:.0f}",
+        )
+
+    console.print(table)
+    console.print(
+        f"Overhead = p50 minus {_SEQUENTIAL_CALLS} sequential LLM calls "
+        f"({model_ms:.0f} ms). Results written to {tmp_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
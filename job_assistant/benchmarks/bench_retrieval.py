@@ -0,0 +1,133 @@
+"""Benchmark: per-query retrieval loop vs batched multi_query_retrieve.
+
+Both paths are timed twice. "Cold" runs start from empty query-embedding
+and retrieval-result caches every repeat, so they measure embedding and
+search cost (batching's benefit). "Warm" runs repeat queries already in
+those caches, the steady state for the same posting.
+
+Usage:
+    py benchmarks/bench_retrieval.py [--repeats 5]
+
+Requires an indexed knowledge base (``py run.py --reindex``).
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+# Ensure the project root is on the path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from job_assistant.config import settings  # noqa: E402
+from job_assistant.rag import retriever  # noqa: E402
+from job_assistant.utils.cache import SQLiteCache  # noqa: E402
+
+console = Console()
+
+SKILLS = [
+    "Python", "SQL", "Excel", "Power BI", "IFRS", "financial modelling",
+    "budgeting", "forecasting", "stakeholder management", "project management",
+    "data analysis", "reporting", "accounts payable", "accounts receivable",
+    "payroll", "VAT returns", "Xero", "Sage", "team leadership", "negotiation",
+    "customer service", "process improvement", "cloud platforms", "Agile",
+    "business development",
+]
+
+SIZES = (5, 25, 100)
+
+
+def _build_queries(n: int) -> list[str]:
+    """Build ``n`` matcher-style queries, cycling through the skill list."""
+    return [
+        f"experience with {SKILLS[i % len(SKILLS)]} ({i // len(SKILLS)})"
+        for i in range(n)
+    ]
+
+
+def _looped(queries: list[str]) -> list[dict]:
+    """The pre-batching behaviour: one retrieve() call per query."""
+    seen: set[str] = set()
+    out: list[dict] = []
+    for q in queries:
+        for r in retriever.retrieve(q, mode="vector"):
+            if r["text"] not in seen:
+                seen.add(r["text"])
+                out.append(r)
+    out.sort(key=lambda x: x["distance"])
+    return out
+
+
+def _empty_caches(directory: Path) -> None:
+    """Point the retriever at empty query-embedding and result caches."""
+    kb = retriever.get_retriever()
+    kb._query_embedding_fn._cache.close()
+    kb._result_cache.close()
+    directory = Path(tempfile.mkdtemp(dir=directory))
+    kb._query_embedding_fn._cache = SQLiteCache(
+        directory / "embeddings.db", "query_embeddings_lru", settings.embedding_cache_size
+    )
+    kb._result_cache = SQLiteCache(
+        directory / "retrieval.db", "query_results", settings.retrieval_cache_size
+    )
+
+
+def _time(fn, queries: list[str], repeats: int, cache_dir: Path, warm: bool) -> float:
+    """Median ms of ``fn(queries)`` from empty caches, or with them primed."""
+    timings = []
+    if warm:
+        _empty_caches(cache_dir)
+        fn(queries)
+    for _ in range(repeats):
+        if not warm:
+            _empty_caches(cache_dir)
+        start = time.perf_counter()
+        fn(queries)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def _batched(queries: list[str]) -> list[dict]:
+    return retriever.multi_query_retrieve(queries, mode="vector")
+
+
+@click.command()
+@click.option("--repeats", default=5, show_default=True, help="Runs per measurement.")
+def main(repeats):
+    # Warm up the model and the collection handle outside the timings
+    retriever.retrieve("warm up")
+
+    table = Table(title="multi_query_retrieve (median ms)")
+    table.add_column("Queries", justify="right")
+    table.add_column("Caches")
+    table.add_column("Looped", justify="right")
+    table.add_column("Batched", justify="right")
+    table.add_column("Speedup", justify="right", style="bold green")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SIZES:
+            queries = _build_queries(n)
+            for warm in (False, True):
+                looped = _time(_looped, queries, repeats, Path(tmp), warm)
+                batched = _time(_batched, queries, repeats, Path(tmp), warm)
+                table.add_row(
+                    str(n),
+                    "warm" if warm else "cold",
+                    f"{looped:.1f}",
+                    f"{batched:.1f}",
+                    f"{looped / batched:.1f}x",
+                )
+        # Release the temporary databases before the directory is removed
+        retriever.get_retriever()._query_embedding_fn._cache.close()
+        retriever.get_retriever()._result_cache.close()
+
+    console.print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Import-time budget check for the CLI entry point.
+
+Runs ``python -X importtime -c "import run"`` in a fresh interpreter and
+fails if the cumulative import time exceeds the budget, or if any of the
+heavy dependencies that should load lazily were imported. The same check
+runs with the test suite (``tests/test_import_time.py``), where the
+cumulative budget is opt-in (IMPORT_TIME_BUDGET_MS) because it depends on
+the machine; this script prints the measured times and takes other
+budgets and modules.
+
+Usage:
+    py benchmarks/check_import_time.py [--budget-ms 800] [--module run]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must not be imported just by loading the entry point
+LAZY_MODULES = (
+    "langgraph",
+    "langchain_google_genai",
+    "chromadb",
+    "sentence_transformers",
+)
+
+
+def measure_import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Return (self, cumulative) import times in microseconds for every module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative))
+    return timings
+
+
+def own_import_us(timings: dict[str, tuple[int, int]], module: str = "run") -> int:
+    """Self time of the entry point and the job_assistant package's modules.
+
+    This excludes third-party libraries, so it varies far less with the
+    machine than the cumulative time does.
+    """
+    return sum(
+        self_us
+        for name, (self_us, _) in timings.items()
+        if name == module or name == "job_assistant" or name.startswith("job_assistant.")
+    )
+
+
+@click.command()
+@click.option("--budget-ms", default=800, show_default=True,
+              help="Maximum cumulative import time.")
+@click.option("--module", default="run", show_default=True, help="Module to import.")
+def main(budget_ms, module):
+    times = measure_import_times(module)
+    total_ms = times[module][1] / 1000
+    leaked = sorted(m for m in LAZY_MODULES if m in times)
+
+    click.echo(f"import {module}: {total_ms:.0f} ms (budget {budget_ms} ms)")
+    click.echo(f"  of which {module} and job_assistant modules: "
+               f"{own_import_us(times, module) / 1000:.0f} ms")
+    failed = False
+    if leaked:
+        click.echo(f"FAIL: heavy modules imported eagerly: {', '.join(leaked)}")
+        failed = True
+    if total_ms > budget_ms:
+        click.echo("FAIL: import time over budget")
+        failed = True
+    if failed:
+        raise SystemExit(1)
+    click.echo("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,32 @@
 from typing import Any
 
 from job_assistant.agents.base import BaseAgent
+from job_assistant.config import settings
 from job_assistant.rag.retriever import retrieve
 from job_assistant.schemas.models import (
     AdvisorOutput,
     JobAnalysis,
     MatchAnalysis,
 )
+from job_assistant.utils.metrics import track_retrieval
 from job_assistant.utils.prompts import ADVISOR_PROMPT
 
 
 class StrategyAdvisorAgent(BaseAgent):
     def __init__(self):
-        super().__init__(output_schema=AdvisorOutput)
+        super().__init__(
+            output_schema=AdvisorOutput, model=settings.advisor_model, fast_tier=True
+        )
 
     def get_prompt(self, **kwargs: Any) -> str:
         analysis: JobAnalysis = kwargs["job_analysis"]
         match: MatchAnalysis = kwargs["match_analysis"]
 
         # Brief context for strategic advice
-        context_chunks = retrieve("professional profile achievements skills", top_k=5)
-        context = "\n\n---\n\n".join(c["text"] for c in context_chunks)
+        query = "professional profile achievements skills"
+        with track_retrieval():
+            context_chunks = retrieve(query, top_k=5)
+        context = self._pack_context(context_chunks, [query], settings.advisor_context_tokens)
 
         strong = ", ".join(m.skill for m in match.strong_matches)
         partial = ", ".join(m.skill for m in match.partial_matches)
@@ -1,38 +1,358 @@
-"""Base agent with ChatGoogleGenerativeAI and structured output."""
+"""Base agent with a shared chat model client and structured output."""
 
+import asyncio
+import hashlib
+import json
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Callable
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
-from job_assistant.config import settings
+from job_assistant.agents.registry import get_llm, get_rate_limiter
+from job_assistant.config import LLM_CACHE_PATH, settings
+from job_assistant.rag.context import estimate_tokens, pack_context
+from job_assistant.utils.cache import SQLiteCache
 from job_assistant.utils.logger import get_logger
+from job_assistant.utils.metrics import AgentCallMetrics, track_agent_call
+from job_assistant.utils.rate_limit import (
+    RETRYABLE_STATUSES,
+    backoff_delay,
+    retry_after,
+    status_code,
+)
 
 logger = get_logger(__name__)
 
+# Tokens reserved for the response before the real usage is known
+_COMPLETION_TOKEN_ESTIMATE = 1000
+
+
+def _parse_partial(text: str) -> dict | None:
+    """Parse incomplete streamed JSON into the fields generated so far."""
+    from langchain_core.utils.json import parse_partial_json
+
+    try:
+        partial = parse_partial_json(text)
+    except ValueError:
+        return None
+    return partial if isinstance(partial, dict) else None
+
+
+# Validated responses shared by all agents; only used if settings.llm_cache_enabled
+response_cache = SQLiteCache(
+    LLM_CACHE_PATH,
+    "llm_responses",
+    settings.llm_cache_size,
+    ttl_seconds=settings.llm_cache_ttl_hours * 3600,
+)
+
 
 class BaseAgent(ABC):
-    """Abstract base agent using Google Gemini with structured output."""
+    """Abstract base agent using the configured LLM provider with structured output."""
 
-    def __init__(self, output_schema: type[BaseModel]):
+    def __init__(
+        self,
+        output_schema: type[BaseModel],
+        model: str | None = None,
+        fast_tier: bool = False,
+    ):
+        """Set up the agent's output schema and model clients.
+
+        Args:
+            model: Model for this agent; defaults to ``settings.gemini_model``.
+            fast_tier: Route short prompts to ``settings.fast_model`` first
+                (see ``_routes_to_fast_tier``).
+        """
         self.output_schema = output_schema
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.gemini_model,
-            google_api_key=settings.google_api_key,
-            max_output_tokens=4096,
+        # One client per model is shared by every agent (see agents.registry)
+        self.llm = get_llm(model or settings.gemini_model)
+        self.structured_llm, self.json_llm = self._bind(self.llm)
+
+        self.fast_model = None
+        if fast_tier and settings.fast_model and settings.fast_model != self.llm.model:
+            self.fast_model = settings.fast_model
+            self._fast_structured_llm, self._fast_json_llm = self._bind(
+                get_llm(self.fast_model)
+            )
+        self._schema_json = json.dumps(output_schema.model_json_schema(), sort_keys=True)
+
+    def _bind(self, llm) -> tuple:
+        """Structured-output and streaming-JSON runnables for ``llm``."""
+        # include_raw keeps the AIMessage, whose usage metadata has the token counts
+        structured_llm = llm.with_structured_output(self.output_schema, include_raw=True)
+        # Same JSON-schema constrained output as raw text, for streaming
+        json_llm = llm.bind(
+            response_mime_type="application/json",
+            response_json_schema=self.output_schema.model_json_schema(),
+        )
+        return structured_llm, json_llm
+
+    def _routes_to_fast_tier(self, prompt: str) -> bool:
+        """Whether ``prompt`` is simple enough to try on the fast tier first."""
+        return (
+            self.fast_model is not None
+            and estimate_tokens(prompt) <= settings.fast_model_max_prompt_tokens
         )
-        self.structured_llm = self.llm.with_structured_output(output_schema)
 
     @abstractmethod
     def get_prompt(self, **kwargs: Any) -> str:
         """Build the prompt for this agent. Subclasses must implement."""
         ...
 
-    def run(self, **kwargs: Any) -> BaseModel:
-        """Execute the agent and return structured output."""
-        prompt = self.get_prompt(**kwargs)
-        logger.info(f"Running {self.__class__.__name__}...")
-        result = self.structured_llm.invoke(prompt)
-        logger.info(f"{self.__class__.__name__} completed.")
-        return result
+    def _pack_context(
+        self, chunks: list[dict], queries: list[str], budget_tokens: int
+    ) -> str:
+        """Fit retrieved chunks into this agent's context budget and log the saving."""
+        packed = pack_context(chunks, queries, budget_tokens)
+        logger.info(
+            f"{self.__class__.__name__} context: {packed.tokens_used} tokens from "
+            f"{packed.chunks_used}/{packed.chunks_total} chunks "
+            f"({packed.tokens_saved} tokens saved)"
+        )
+        return packed.text
+
+    def _cache_key(self, prompt: str) -> str:
+        raw = f"{self.llm.model}\0{self.fast_model}\0{self._schema_json}\0{prompt}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _cached(self, prompt: str) -> BaseModel | None:
+        """Previous validated answer to ``prompt``, if the response cache is on."""
+        if not (settings.llm_cache_enabled and response_cache.enabled):
+            return None
+        key = self._cache_key(prompt)
+        cached = response_cache.get_many([key]).get(key)
+        if cached is None:
+            return None
+        logger.info(
+            f"{self.__class__.__name__} answered from cache "
+            f"(hit rate {response_cache.hit_rate:.0%})."
+        )
+        return self.output_schema.model_validate_json(cached)
+
+    def _remember(self, prompt: str, result: BaseModel | None) -> None:
+        if settings.llm_cache_enabled and response_cache.enabled and result is not None:
+            response_cache.set_many(
+                {self._cache_key(prompt): result.model_dump_json().encode("utf-8")}
+            )
+
+    def _parse(self, response: dict, metrics: AgentCallMetrics) -> BaseModel:
+        """Record token usage and return the validated output."""
+        metrics.add_usage(getattr(response["raw"], "usage_metadata", None))
+        if response.get("parsing_error"):
+            raise response["parsing_error"]
+        if response.get("parsed") is None:
+            raise ValueError(f"{self.__class__.__name__} returned no structured output")
+        return response["parsed"]
+
+    def _reservation(self, prompt: str) -> int:
+        return estimate_tokens(prompt) + _COMPLETION_TOKEN_ESTIMATE
+
+    def _settle(self, reserved: int, response: dict) -> None:
+        usage = getattr(response.get("raw"), "usage_metadata", None)
+        if usage:
+            get_rate_limiter().record_usage(reserved, usage.get("total_tokens", reserved))
+
+    def _retry_delay(
+        self, error: Exception, attempt: int, metrics: AgentCallMetrics
+    ) -> float | None:
+        """Seconds to wait before retrying a failed call, or None to give up.
+
+        Rate-limit (429) and server (5xx) errors are retried with jittered
+        exponential backoff, or after the server's retry hint when it gives
+        one. A 429 also pauses every other caller sharing the quota.
+        """
+        status = status_code(error)
+        if status not in RETRYABLE_STATUSES or attempt >= settings.llm_max_retries:
+            return None
+
+        delay = backoff_delay(attempt, settings.llm_backoff_base, settings.llm_backoff_max)
+        hint = retry_after(error)
+        if hint is not None:
+            delay = hint + delay / 4
+        if status == 429:
+            get_rate_limiter().pause(delay)
+
+        metrics.retries += 1
+        logger.warning(
+            f"{self.__class__.__name__} got HTTP {status}; retry "
+            f"{attempt + 1}/{settings.llm_max_retries} in {delay:.1f}s"
+        )
+        return delay
+
+    def _finish_stream(self, message, text: str) -> dict:
+        """Validate streamed JSON, shaped like a structured_llm response."""
+        try:
+            parsed = self.output_schema.model_validate_json(text)
+        except ValidationError as e:
+            return {"raw": message, "parsed": None, "parsing_error": e}
+        return {"raw": message, "parsed": parsed, "parsing_error": None}
+
+    def _stream(self, json_llm, prompt: str, on_partial: Callable[[dict], None]) -> dict:
+        """Stream the JSON response, passing each newly parsed partial object on."""
+        message, text, last = None, "", None
+        for chunk in json_llm.stream(prompt):
+            message = chunk if message is None else message + chunk
+            text += chunk.text
+            partial = _parse_partial(text)
+            if partial and partial != last:
+                on_partial(partial)
+                last = partial
+        return self._finish_stream(message, text)
+
+    async def _astream(
+        self, json_llm, prompt: str, on_partial: Callable[[dict], None]
+    ) -> dict:
+        """Async ``_stream``."""
+        message, text, last = None, "", None
+        async for chunk in json_llm.astream(prompt):
+            message = chunk if message is None else message + chunk
+            text += chunk.text
+            partial = _parse_partial(text)
+            if partial and partial != last:
+                on_partial(partial)
+                last = partial
+        return self._finish_stream(message, text)
+
+    def _runnables(self, fast: bool) -> tuple:
+        if fast:
+            return self._fast_structured_llm, self._fast_json_llm
+        return self.structured_llm, self.json_llm
+
+    def _escalate(self, response: dict, metrics: AgentCallMetrics) -> bool:
+        """Record a fast tier answer; True if it failed validation and must be redone."""
+        if not (response.get("parsing_error") or response.get("parsed") is None):
+            return False
+        metrics.add_usage(getattr(response["raw"], "usage_metadata", None))
+        logger.warning(
+            f"{self.__class__.__name__}: {self.fast_model} output failed validation; "
+            f"escalating to {self.llm.model}"
+        )
+        metrics.model = self.llm.model
+        metrics.escalated = True
+        return True
+
+    def _invoke(
+        self,
+        prompt: str,
+        metrics: AgentCallMetrics,
+        on_partial: Callable[[dict], None] | None = None,
+        fast: bool = False,
+    ) -> dict:
+        """Call the LLM within the shared rate limits, retrying transient errors.
+
+        Args:
+            fast: Call the fast tier model instead of the agent's model.
+        """
+        structured_llm, json_llm = self._runnables(fast)
+        limiter = get_rate_limiter()
+        reserved = self._reservation(prompt)
+        attempt = 0
+        while True:
+            limiter.acquire(reserved)
+            try:
+                if on_partial:
+                    response = self._stream(json_llm, prompt, on_partial)
+                else:
+                    response = structured_llm.invoke(prompt)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, metrics)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._settle(reserved, response)
+            return response
+
+    async def _ainvoke(
+        self,
+        prompt: str,
+        metrics: AgentCallMetrics,
+        on_partial: Callable[[dict], None] | None = None,
+        fast: bool = False,
+    ) -> dict:
+        """Async ``_invoke``: waits for quota and backoff without blocking."""
+        structured_llm, json_llm = self._runnables(fast)
+        limiter = get_rate_limiter()
+        reserved = self._reservation(prompt)
+        attempt = 0
+        while True:
+            await limiter.aacquire(reserved)
+            try:
+                if on_partial:
+                    response = await self._astream(json_llm, prompt, on_partial)
+                else:
+                    response = await structured_llm.ainvoke(prompt)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, metrics)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._settle(reserved, response)
+            return response
+
+    def run(
+        self, *, on_partial: Callable[[dict], None] | None = None, **kwargs: Any
+    ) -> BaseModel:
+        """Execute the agent and return structured output.
+
+        With ``settings.llm_cache_enabled`` a previous validated answer to the
+        same model, output schema and prompt is returned without calling the LLM.
+
+        Args:
+            on_partial: If given, the response is streamed and this is called
+                with the partially generated output (a dict) as it grows. The
+                complete output is still validated against the schema.
+
+        Agents built with ``fast_tier`` send short prompts to
+        ``settings.fast_model`` first and repeat the call on their own model
+        only if the fast tier's output fails validation.
+        """
+        with track_agent_call(self.__class__.__name__, self.llm.model) as metrics:
+            prompt = self.get_prompt(**kwargs)
+            cached = self._cached(prompt)
+            if cached is not None:
+                metrics.cached = True
+                return cached
+
+            fast = self._routes_to_fast_tier(prompt)
+            if fast:
+                metrics.model = self.fast_model
+            logger.info(f"Running {self.__class__.__name__} on {metrics.model}...")
+            response = self._invoke(prompt, metrics, on_partial, fast)
+            if fast and self._escalate(response, metrics):
+                response = self._invoke(prompt, metrics, on_partial)
+            result = self._parse(response, metrics)
+            self._remember(prompt, result)
+            logger.info(f"{self.__class__.__name__} completed.")
+            return result
+
+    async def arun(
+        self, *, on_partial: Callable[[dict], None] | None = None, **kwargs: Any
+    ) -> BaseModel:
+        """Async ``run``: awaits the LLM instead of blocking a thread.
+
+        Building the prompt (which may embed queries and search the vector
+        store) and cache access run in a worker thread.
+        """
+        with track_agent_call(self.__class__.__name__, self.llm.model) as metrics:
+            prompt = await asyncio.to_thread(self.get_prompt, **kwargs)
+            cached = await asyncio.to_thread(self._cached, prompt)
+            if cached is not None:
+                metrics.cached = True
+                return cached
+
+            fast = self._routes_to_fast_tier(prompt)
+            if fast:
+                metrics.model = self.fast_model
+            logger.info(f"Running {self.__class__.__name__} on {metrics.model}...")
+            response = await self._ainvoke(prompt, metrics, on_partial, fast)
+            if fast and self._escalate(response, metrics):
+                response = await self._ainvoke(prompt, metrics, on_partial)
+            result = self._parse(response, metrics)
+            await asyncio.to_thread(self._remember, prompt, result)
+            logger.info(f"{self.__class__.__name__} completed.")
+            return result
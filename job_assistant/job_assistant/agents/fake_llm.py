@@ -0,0 +1,230 @@
+"""Deterministic offline chat model for tests, benchmarks and load tests.
+
+``FakeChatModel`` answers structured-output requests with schema-valid JSON
+generated from the requested JSON schema. The output is seeded by the
+prompt, so the same prompt always gets the same answer. Latency and
+failures can be injected to exercise timeouts, retries and concurrency
+without network access or an API key.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from pydantic import BaseModel, PrivateAttr, ValidationError
+
+_WORDS = (
+    "experience delivering reporting improvements across finance teams with "
+    "strong stakeholder management and hands-on analysis of budgets forecasts "
+    "and operational data to support clear decisions and measurable results"
+).split()
+
+# Characters per streamed chunk, roughly a few tokens
+_CHUNK_CHARS = 24
+
+
+class FakeLLMError(Exception):
+    """Injected failure; carries an HTTP status code like real API errors."""
+
+    def __init__(self, code: int):
+        super().__init__(f"{code} injected failure from the fake LLM provider")
+        self.code = code
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _fake_string(schema: dict, name: str, rng: random.Random) -> str:
+    description = schema.get("description", "").lower()
+    if "paragraph" in description:
+        return "\n\n".join(
+            " ".join(_sentence(rng, rng.randint(10, 18)) for _ in range(4))
+            for _ in range(3)
+        )
+    if "sentence" in description:
+        return " ".join(_sentence(rng, rng.randint(10, 18)) for _ in range(2))
+    return f"{schema.get('title', name)} {rng.randint(1, 99)}"
+
+
+def fake_value(schema: dict, root: dict, rng: random.Random, name: str = "value") -> Any:
+    """Generate a value that validates against a (Pydantic-style) JSON schema."""
+    if "$ref" in schema:
+        schema = root["$defs"][schema["$ref"].rsplit("/", 1)[-1]]
+    if "anyOf" in schema:
+        options = [s for s in schema["anyOf"] if s.get("type") != "null"]
+        schema = options[0] if options else {"type": "null"}
+    if "enum" in schema:
+        return rng.choice(schema["enum"])
+
+    kind = schema.get("type")
+    if kind == "object":
+        return {
+            key: fake_value(prop, root, rng, key)
+            for key, prop in schema.get("properties", {}).items()
+        }
+    if kind == "array":
+        return [
+            fake_value(schema.get("items", {}), root, rng, name)
+            for _ in range(rng.randint(2, 4))
+        ]
+    if kind == "integer":
+        return rng.randint(schema.get("minimum", 0), schema.get("maximum", 100))
+    if kind == "number":
+        return rng.uniform(schema.get("minimum", 0.0), schema.get("maximum", 1.0))
+    if kind == "boolean":
+        return rng.random() < 0.5
+    if kind == "null":
+        return None
+    return _fake_string(schema, name, rng)
+
+
+class FakeChatModel(BaseChatModel):
+    """Offline stand-in for the Gemini chat model.
+
+    With a ``response_json_schema`` bound (as structured output and
+    streaming do) it answers with JSON valid for that schema; otherwise
+    with a short sentence. ``latency_ms`` is spent per call (spread over
+    the chunks when streaming), and ``failure_rate`` of calls raise a
+    ``FakeLLMError`` with ``failure_status`` (503 by default, so they are
+    retried like real transient errors). Failures are drawn from a
+    generator seeded with ``seed`` and are reproducible for a given call
+    order.
+    """
+
+    model: str = "fake"
+    latency_ms: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    seed: int = 0
+
+    _failure_rng: random.Random = PrivateAttr()
+    _failure_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._failure_rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _maybe_fail(self) -> None:
+        with self._failure_lock:
+            failed = self._failure_rng.random() < self.failure_rate
+        if failed:
+            raise FakeLLMError(self.failure_status)
+
+    def _respond(self, messages: list[BaseMessage], **kwargs: Any) -> AIMessage:
+        prompt = "\n".join(m.text for m in messages)
+        digest = hashlib.sha256(f"{self.seed}\0{self.model}\0{prompt}".encode("utf-8"))
+        rng = random.Random(digest.digest())
+
+        schema = kwargs.get("response_json_schema")
+        if schema is None:
+            text = _sentence(rng, 12)
+        else:
+            text = json.dumps(fake_value(schema, schema, rng))
+
+        input_tokens = max(len(prompt) // 4, 1)
+        output_tokens = max(len(text) // 4, 1)
+        return AIMessage(
+            content=text,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self._maybe_fail()
+        time.sleep(self.latency_ms / 1000)
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages, **kwargs))])
+
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self._maybe_fail()
+        await asyncio.sleep(self.latency_ms / 1000)
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages, **kwargs))])
+
+    def _chunks(self, message: AIMessage) -> list[AIMessageChunk]:
+        text = message.text
+        pieces = [text[i:i + _CHUNK_CHARS] for i in range(0, len(text), _CHUNK_CHARS)] or [""]
+        chunks = [AIMessageChunk(content=piece) for piece in pieces]
+        chunks[-1].usage_metadata = message.usage_metadata
+        return chunks
+
+    def _stream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ChatGenerationChunk]:
+        self._maybe_fail()
+        chunks = self._chunks(self._respond(messages, **kwargs))
+        for chunk in chunks:
+            time.sleep(self.latency_ms / 1000 / len(chunks))
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        self._maybe_fail()
+        chunks = self._chunks(self._respond(messages, **kwargs))
+        for chunk in chunks:
+            await asyncio.sleep(self.latency_ms / 1000 / len(chunks))
+            yield ChatGenerationChunk(message=chunk)
+
+    def with_structured_output(
+        self, schema: type[BaseModel], *, include_raw: bool = False, **kwargs: Any
+    ) -> Runnable:
+        """Mirror the Gemini client: JSON-schema output parsed into ``schema``."""
+        bound = self.bind(
+            response_mime_type="application/json",
+            response_json_schema=schema.model_json_schema(),
+        )
+
+        def parse(message: AIMessage) -> Any:
+            try:
+                parsed, error = schema.model_validate_json(message.text), None
+            except ValidationError as e:
+                parsed, error = None, e
+            if include_raw:
+                return {"raw": message, "parsed": parsed, "parsing_error": error}
+            if error:
+                raise error
+            return parsed
+
+        return bound | RunnableLambda(parse)
@@ -1,27 +1,52 @@
-"""Skill Matcher Agent - matches candidate skills to job requirements using RAG."""
+"""Skill Matcher Agent - matches candidate skills to job requirements using RAG.
 
+``settings.matcher_mode`` selects how:
+
+- "llm": the LLM matches every skill against multi-query RAG context.
+- "draft": skills are pre-scored locally (``rag.prescore``) and the LLM
+  reviews that draft, with a smaller context for the responsibilities.
+- "local": the local pre-score is the result; no LLM call is made.
+"""
+
+import asyncio
 from typing import Any
 
+from pydantic import BaseModel
+
 from job_assistant.agents.base import BaseAgent
+from job_assistant.config import settings
+from job_assistant.rag.prescore import draft_match_analysis, prescore_skills, skill_query
 from job_assistant.rag.retriever import multi_query_retrieve
 from job_assistant.schemas.models import JobAnalysis, MatchAnalysis
 from job_assistant.utils.logger import get_logger
-from job_assistant.utils.prompts import MATCHER_PROMPT
+from job_assistant.utils.metrics import track_agent_call, track_retrieval
+from job_assistant.utils.prompts import MATCHER_DRAFT_PROMPT, MATCHER_PROMPT
 
 logger = get_logger(__name__)
 
+MATCHER_MODES = ("llm", "draft", "local")
+
 
 class SkillMatcherAgent(BaseAgent):
     def __init__(self):
-        super().__init__(output_schema=MatchAnalysis)
+        super().__init__(output_schema=MatchAnalysis, model=settings.matcher_model)
+
+    @staticmethod
+    def _mode() -> str:
+        if settings.matcher_mode not in MATCHER_MODES:
+            raise ValueError(
+                f"Unknown matcher mode '{settings.matcher_mode}'. "
+                f"Expected one of: {', '.join(MATCHER_MODES)}"
+            )
+        return settings.matcher_mode
 
     def _build_rag_queries(self, analysis: JobAnalysis) -> list[str]:
         """Build one RAG query per requirement for comprehensive retrieval."""
         queries = []
         for skill in analysis.required_skills:
-            queries.append(f"experience with {skill}")
+            queries.append(skill_query(skill))
         for skill in analysis.preferred_skills:
-            queries.append(f"experience with {skill}")
+            queries.append(skill_query(skill))
         for resp in analysis.responsibilities[:5]:
             queries.append(resp)
         return queries
@@ -30,12 +55,34 @@ class SkillMatcherAgent(BaseAgent):
         """Retrieve relevant knowledge base chunks via multi-query RAG."""
         queries = self._build_rag_queries(analysis)
         logger.info(f"Running {len(queries)} RAG queries for skill matching")
-        results = multi_query_retrieve(queries)
-        context_parts = [r["text"] for r in results]
-        return "\n\n---\n\n".join(context_parts)
+        with track_retrieval():
+            results = multi_query_retrieve(queries)
+        return self._pack_context(results, queries, settings.matcher_context_tokens)
+
+    def _draft_prompt(self, analysis: JobAnalysis) -> str:
+        """Prompt asking the LLM to review the local pre-score."""
+        queries = analysis.responsibilities[:5]
+        with track_retrieval():
+            scores = prescore_skills(analysis)
+            results = multi_query_retrieve(queries) if queries else []
+        context = self._pack_context(results, queries, settings.matcher_draft_context_tokens)
+        draft = "\n".join(
+            f"- {s.skill}{'' if s.required else ' (preferred)'} | {s.strength} | {s.evidence}"
+            for s in scores
+        )
+        return MATCHER_DRAFT_PROMPT.format(
+            draft=draft,
+            context=context,
+            title=analysis.title,
+            company=analysis.company,
+            responsibilities="\n".join(f"- {r}" for r in analysis.responsibilities),
+            seniority=analysis.seniority,
+        )
 
     def get_prompt(self, **kwargs: Any) -> str:
         analysis: JobAnalysis = kwargs["job_analysis"]
+        if self._mode() == "draft":
+            return self._draft_prompt(analysis)
         context = self._retrieve_context(analysis)
         return MATCHER_PROMPT.format(
             context=context,
@@ -46,3 +93,24 @@ class SkillMatcherAgent(BaseAgent):
             responsibilities="\n".join(f"- {r}" for r in analysis.responsibilities),
             seniority=analysis.seniority,
         )
+
+    def match_locally(self, analysis: JobAnalysis) -> MatchAnalysis:
+        """Match skills from local knowledge base similarity alone (no LLM)."""
+        with track_agent_call(self.__class__.__name__, "local") as metrics:
+            with track_retrieval():
+                result = draft_match_analysis(prescore_skills(analysis))
+        logger.info(
+            f"{self.__class__.__name__} scored {len(analysis.required_skills)} required "
+            f"skills locally in {metrics.wall_ms:.0f} ms (score {result.overall_score})."
+        )
+        return result
+
+    def run(self, **kwargs: Any) -> BaseModel:
+        if self._mode() == "local":
+            return self.match_locally(kwargs["job_analysis"])
+        return super().run(**kwargs)
+
+    async def arun(self, **kwargs: Any) -> BaseModel:
+        if self._mode() == "local":
+            return await asyncio.to_thread(self.match_locally, kwargs["job_analysis"])
+        return await super().arun(**kwargs)
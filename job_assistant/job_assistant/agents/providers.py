@@ -0,0 +1,45 @@
+"""LLM provider selection."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from job_assistant.config import settings
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+LLM_PROVIDERS = ("gemini", "fake")
+
+
+def create_chat_model(model: str) -> BaseChatModel:
+    """Create a chat model client for ``settings.llm_provider``.
+
+    Providers must support ``with_structured_output(schema, include_raw=True)``
+    and streaming JSON-schema constrained output through
+    ``bind(response_mime_type=..., response_json_schema=...)``.
+    """
+    if settings.llm_provider == "gemini":
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=settings.google_api_key,
+            max_output_tokens=4096,
+            # Retries are done by BaseAgent, which honours retry hints
+            # and the shared rate limits; 1 means a single attempt.
+            max_retries=1,
+        )
+    if settings.llm_provider == "fake":
+        from job_assistant.agents.fake_llm import FakeChatModel
+
+        return FakeChatModel(
+            model=model,
+            latency_ms=settings.fake_llm_latency_ms,
+            failure_rate=settings.fake_llm_failure_rate,
+            seed=settings.fake_llm_seed,
+        )
+    raise ValueError(
+        f"Unknown LLM provider '{settings.llm_provider}'. "
+        f"Expected one of: {', '.join(LLM_PROVIDERS)}"
+    )
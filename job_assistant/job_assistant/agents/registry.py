@@ -0,0 +1,80 @@
+"""Process-wide registry of agents and the LLM client they share.
+
+Each agent is built once per process and reused by every pipeline run. All
+agents share one chat model client per model (for Gemini, one Google GenAI
+client with its pooled HTTP connections), so batch and server workloads pay
+client setup and TLS handshakes once rather than per posting.
+They also share one rate limiter, since the API quota is per key.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, TypeVar
+
+from job_assistant.agents.providers import create_chat_model
+from job_assistant.config import settings
+from job_assistant.utils.logger import get_logger
+from job_assistant.utils.rate_limit import RateLimiter
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+    from job_assistant.agents.base import BaseAgent
+
+logger = get_logger(__name__)
+
+AgentT = TypeVar("AgentT", bound="BaseAgent")
+
+_lock = threading.Lock()
+_llms: dict[str, BaseChatModel] = {}
+_agents: dict[type, BaseAgent] = {}
+_rate_limiter: RateLimiter | None = None
+
+
+def get_llm(model: str | None = None) -> BaseChatModel:
+    """Return the shared chat model client for ``model`` (default: settings).
+
+    The client comes from the provider selected by ``settings.llm_provider``.
+    """
+    model = model or settings.gemini_model
+    if model not in _llms:
+        with _lock:
+            if model not in _llms:
+                logger.debug(f"Creating shared {settings.llm_provider} client for {model}")
+                _llms[model] = create_chat_model(model)
+    return _llms[model]
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide limiter on LLM requests and tokens per minute."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter(
+                    settings.llm_requests_per_minute, settings.llm_tokens_per_minute
+                )
+    return _rate_limiter
+
+
+def get_agent(agent_cls: type[AgentT]) -> AgentT:
+    """Return the process-wide instance of ``agent_cls``, building it on first use.
+
+    Agents hold no per-run state, so one instance can serve concurrent runs.
+    """
+    if agent_cls not in _agents:
+        # Built outside the lock: the constructor takes it again via get_llm()
+        agent = agent_cls()
+        with _lock:
+            _agents.setdefault(agent_cls, agent)
+    return _agents[agent_cls]
+
+
+def clear_registry() -> None:
+    """Drop all cached agents, clients and limits, e.g. after changing settings."""
+    global _rate_limiter
+    with _lock:
+        _agents.clear()
+        _llms.clear()
+        _rate_limiter = None
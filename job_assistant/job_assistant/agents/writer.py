@@ -3,22 +3,26 @@
 from typing import Any
 
 from job_assistant.agents.base import BaseAgent
+from job_assistant.config import settings
 from job_assistant.rag.retriever import retrieve
 from job_assistant.schemas.models import JobAnalysis, MatchAnalysis, WriterOutput
+from job_assistant.utils.metrics import track_retrieval
 from job_assistant.utils.prompts import WRITER_PROMPT
 
 
 class ContentWriterAgent(BaseAgent):
     def __init__(self):
-        super().__init__(output_schema=WriterOutput)
+        super().__init__(output_schema=WriterOutput, model=settings.writer_model)
 
     def get_prompt(self, **kwargs: Any) -> str:
         analysis: JobAnalysis = kwargs["job_analysis"]
         match: MatchAnalysis = kwargs["match_analysis"]
 
         # Retrieve profile context for writing
-        context_chunks = retrieve("professional profile experience achievements", top_k=8)
-        context = "\n\n---\n\n".join(c["text"] for c in context_chunks)
+        query = "professional profile experience achievements"
+        with track_retrieval():
+            context_chunks = retrieve(query, top_k=8)
+        context = self._pack_context(context_chunks, [query], settings.writer_context_tokens)
 
         strong = ", ".join(m.skill for m in match.strong_matches)
         usps = ", ".join(match.unique_selling_points)
@@ -0,0 +1,49 @@
+"""Writer + Advisor Agent - application materials and strategy in one call.
+
+The job details, match analysis and profile context are sent once instead
+of in two prompts; ``ApplicationPackage.split()`` recovers the separate
+writer and advisor outputs.
+"""
+
+from typing import Any
+
+from job_assistant.agents.base import BaseAgent
+from job_assistant.config import settings
+from job_assistant.rag.retriever import multi_query_retrieve
+from job_assistant.schemas.models import ApplicationPackage, JobAnalysis, MatchAnalysis
+from job_assistant.utils.metrics import track_retrieval
+from job_assistant.utils.prompts import WRITER_ADVISOR_PROMPT
+
+
+class WriterAdvisorAgent(BaseAgent):
+    def __init__(self):
+        super().__init__(output_schema=ApplicationPackage, model=settings.writer_model)
+
+    def get_prompt(self, **kwargs: Any) -> str:
+        analysis: JobAnalysis = kwargs["job_analysis"]
+        match: MatchAnalysis = kwargs["match_analysis"]
+
+        # The writer's and advisor's queries, packed into the larger budget
+        queries = [
+            "professional profile experience achievements",
+            "professional profile achievements skills",
+        ]
+        with track_retrieval():
+            context_chunks = multi_query_retrieve(queries, top_k=8)
+        budget = max(settings.writer_context_tokens, settings.advisor_context_tokens)
+        context = self._pack_context(context_chunks, queries, budget)
+
+        return WRITER_ADVISOR_PROMPT.format(
+            context=context,
+            title=analysis.title,
+            company=analysis.company,
+            location=analysis.location,
+            industry=analysis.industry,
+            seniority=analysis.seniority,
+            match_score=match.overall_score,
+            strong_matches=", ".join(m.skill for m in match.strong_matches),
+            partial_matches=", ".join(m.skill for m in match.partial_matches),
+            gaps=", ".join(m.skill for m in match.gaps),
+            usps=", ".join(match.unique_selling_points),
+            match_summary=match.match_summary,
+        )
@@ -10,6 +10,12 @@ KNOWLEDGE_BASE_DIR = PROJECT_ROOT / "knowledge_base"
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 CHROMA_DB_DIR = DATA_DIR / "chroma_db"
+NUMPY_INDEX_DIR = DATA_DIR / "numpy_index"
+KB_MANIFEST_PATH = DATA_DIR / "kb_manifest.json"
+EMBEDDING_CACHE_PATH = DATA_DIR / "embedding_cache.db"
+BM25_INDEX_PATH = DATA_DIR / "bm25_index.json"
+RETRIEVAL_CACHE_PATH = DATA_DIR / "retrieval_cache.db"
+LLM_CACHE_PATH = DATA_DIR / "llm_cache.db"
 LOG_DIR = DATA_DIR / "logs"
 DB_PATH = DATA_DIR / "applications.db"
 
@@ -22,18 +28,99 @@ class Settings(BaseSettings):
     )
 
     google_api_key: str = ""
+    llm_provider: str = "gemini"  # "gemini" or "fake" (offline, deterministic)
     gemini_model: str = "gemini-2.0-flash"
     log_level: str = "INFO"
 
+    # Per-agent model overrides; empty uses gemini_model
+    analyzer_model: str = ""
+    matcher_model: str = ""
+    writer_model: str = ""
+    advisor_model: str = ""
+
+    # Fast tier for the analyzer and advisor: prompts up to the token limit go
+    # to fast_model, escalating to the agent's model if the output fails
+    # validation. Empty disables routing.
+    fast_model: str = ""
+    fast_model_max_prompt_tokens: int = 3000
+
+    # USD per million tokens (input, output) by model name, for cost
+    # estimates (list prices; Pro prices are for prompts up to 200k tokens)
+    model_prices: dict[str, tuple[float, float]] = {
+        "gemini-2.0-flash": (0.10, 0.40),
+        "gemini-2.0-flash-lite": (0.075, 0.30),
+        "gemini-2.5-flash": (0.30, 2.50),
+        "gemini-2.5-flash-lite": (0.10, 0.40),
+        "gemini-2.5-pro": (1.25, 10.00),
+    }
+    # Prices for models not in model_prices
+    llm_input_cost_per_mtok: float = 0.10
+    llm_output_cost_per_mtok: float = 0.40
+    # Fast tier prices, overriding model_prices for fast_model
+    fast_input_cost_per_mtok: float = 0.075
+    fast_output_cost_per_mtok: float = 0.30
+
+    # Gemini quota shared by all agents (defaults: free tier), 0 disables a limit
+    llm_requests_per_minute: int = 15
+    llm_tokens_per_minute: int = 1_000_000
+    # Retries on 429/5xx with jittered exponential backoff (seconds)
+    llm_max_retries: int = 5
+    llm_backoff_base: float = 2.0
+    llm_backoff_max: float = 60.0
+
+    # Fake provider: simulated latency per call and share of calls failing (503)
+    fake_llm_latency_ms: float = 0.0
+    fake_llm_failure_rate: float = 0.0
+    fake_llm_seed: int = 0
+
+    # LLM response cache (opt-in): reuse answers to identical prompts
+    llm_cache_enabled: bool = False
+    llm_cache_ttl_hours: float = 168.0
+    llm_cache_size: int = 500
+
     # Embedding model (local, free)
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_backend: str = "torch"  # "torch" or "onnx" (int8-quantized, CPU)
+    onnx_model_file: str = "onnx/model_quint8_avx2.onnx"
+    embedding_cache_size: int = 10000  # Max cached query embeddings, 0 disables
 
     # RAG settings
+    vector_backend: str = "chroma"  # "chroma" or "numpy"
     chroma_collection: str = "robbie_forest_kb"
     rag_top_k: int = 5
+    retrieval_mode: str = "hybrid"  # "vector" or "hybrid" (BM25 + vector, RRF)
+    rrf_k: int = 60
+    retrieval_cache_size: int = 1000  # Max cached query results, 0 disables
+
+    # Write the application and the strategy advice in one LLM call instead
+    # of two; falls back to the separate writer and advisor if it fails
+    fused_writer_advisor: bool = False
+
+    # Skip the writer and advisor for postings scoring below this match
+    # score (saved as "skipped-low-match"); 0 always generates
+    min_match_score: int = 0
+
+    # Postings processed at once by `run.py --batch`; LLM calls still share
+    # the rate limiter above
+    batch_concurrency: int = 4
+
+    # Skill matcher: "llm", "draft" (LLM reviews a local pre-score with a
+    # smaller context) or "local" (local pre-score only, no LLM call)
+    matcher_mode: str = "llm"
+    # Cosine similarity for a strong / partial local skill match
+    prescore_strong_similarity: float = 0.55
+    prescore_partial_similarity: float = 0.35
+
+    # Prompt context budgets (estimated tokens of retrieved knowledge base text)
+    matcher_context_tokens: int = 1500
+    matcher_draft_context_tokens: int = 600
+    writer_context_tokens: int = 1000
+    advisor_context_tokens: int = 600
 
     # Scraper settings
     request_timeout: int = 15
+    # Strip boilerplate and repeated lines from job text before analysis
+    clean_job_text: bool = True
 
 
 settings = Settings()
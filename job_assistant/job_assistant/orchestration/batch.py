@@ -0,0 +1,220 @@
+"""Batch processing of many job postings through one compiled graph.
+
+A batch is a text file of URLs (one per line, ``#`` starts a comment), a
+directory of ``.txt``/``.md`` job descriptions, or a JSONL file whose
+lines have a ``url`` or ``text`` (and optionally an ``id``). Postings run
+concurrently on one event loop, sharing the agents, LLM client and rate
+limiter. Each finished posting is appended to a JSONL result log, so a
+rerun with the same log skips postings that are already done and retries
+the ones that failed, overwriting the failed attempt's database row.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from job_assistant.orchestration.graph import astream_pipeline
+from job_assistant.schemas.state import ApplicationState
+from job_assistant.storage.database import STATUS_FAILED
+from job_assistant.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TEXT_SUFFIXES = (".txt", ".md")
+
+
+@dataclass
+class BatchItem:
+    """One posting in a batch, identified by ``item_id`` across reruns."""
+
+    item_id: str
+    job_url: str | None = None
+    job_text: str | None = None
+    db_id: int | None = None  # Row of a failed earlier attempt, to overwrite
+
+    def initial_state(self) -> ApplicationState:
+        state: ApplicationState = {}
+        if self.db_id is not None:
+            state["db_id"] = self.db_id
+        if self.job_url:
+            state["job_url"] = self.job_url
+        if self.job_text:
+            state["job_text"] = self.job_text
+        return state
+
+
+@dataclass
+class BatchProgress:
+    """Live progress of one batch item."""
+
+    item: BatchItem
+    status: str = "queued"  # queued, running, a node name, then the final status
+    started: float | None = None
+    seconds: float = 0.0
+    match_score: int | None = None
+    db_id: int | None = None
+    title: str = ""
+    company: str = ""
+    error: str = ""
+    finished_at: str = ""
+
+    @property
+    def finished(self) -> bool:
+        return bool(self.finished_at)
+
+    def finish(self, state: ApplicationState) -> None:
+        """Record the outcome from the final pipeline state."""
+        self.seconds = time.perf_counter() - self.started
+        self.finished_at = datetime.now().isoformat()
+        self.error = state.get("error", "")
+        self.status = STATUS_FAILED if self.error else state.get("status", STATUS_FAILED)
+        self.db_id = state.get("db_id", self.item.db_id)
+        if state.get("match_analysis"):
+            self.match_score = state["match_analysis"].overall_score
+        if state.get("job_analysis"):
+            self.title = state["job_analysis"].title
+            self.company = state["job_analysis"].company
+
+    def record(self) -> dict:
+        """Entry for the result log."""
+        return {
+            "item_id": self.item.item_id,
+            "status": self.status,
+            "db_id": self.db_id,
+            "match_score": self.match_score,
+            "title": self.title,
+            "company": self.company,
+            "error": self.error,
+            "seconds": round(self.seconds, 2),
+            "finished_at": self.finished_at,
+        }
+
+
+def _text_id(text: str) -> str:
+    return "text-" + hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+def load_batch(path: Path) -> list[BatchItem]:
+    """Read batch items from a URL list, a directory of texts or a JSONL file.
+
+    Raises:
+        ValueError: If a JSONL line is not an object with a ``url`` or ``text``.
+    """
+    if path.is_dir():
+        items = [
+            BatchItem(item_id=f.name, job_text=f.read_text(encoding="utf-8"))
+            for f in sorted(path.iterdir())
+            if f.is_file() and f.suffix.lower() in TEXT_SUFFIXES
+        ]
+    elif path.suffix.lower() == ".jsonl":
+        items = []
+        lines = path.read_text(encoding="utf-8").splitlines()
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or not (entry.get("url") or entry.get("text")):
+                raise ValueError(f"{path}:{line_no}: expected an object with 'url' or 'text'")
+            item_id = entry.get("id") or entry.get("url") or _text_id(entry["text"])
+            items.append(
+                BatchItem(item_id=str(item_id), job_url=entry.get("url"), job_text=entry.get("text"))
+            )
+    else:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        urls = [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+        items = [BatchItem(item_id=url, job_url=url) for url in urls]
+
+    unique: dict[str, BatchItem] = {}
+    for item in items:
+        if item.item_id in unique:
+            logger.warning(f"Skipping duplicate batch item: {item.item_id}")
+            continue
+        unique[item.item_id] = item
+    return list(unique.values())
+
+
+class BatchLog:
+    """Append-only JSONL log of finished batch items."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def latest(self) -> dict[str, dict]:
+        """The most recent record of every logged item."""
+        if not self.path.exists():
+            return {}
+        latest: dict[str, dict] = {}
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A line cut short by a crash; that item is simply redone
+                continue
+            latest[record["item_id"]] = record
+        return latest
+
+    def pending(self, items: list[BatchItem]) -> list[BatchItem]:
+        """Items still to run: never logged, or failed last time.
+
+        A failed item keeps its earlier ``db_id`` so the retry overwrites
+        that row instead of adding another.
+        """
+        latest = self.latest()
+        pending = []
+        for item in items:
+            record = latest.get(item.item_id)
+            if record is None:
+                pending.append(item)
+            elif record["status"] == STATUS_FAILED:
+                item.db_id = record.get("db_id")
+                pending.append(item)
+        return pending
+
+    def append(self, record: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+async def arun_batch(
+    items: list[BatchItem],
+    graph,
+    concurrency: int,
+    log: BatchLog,
+    on_update: Callable[[BatchProgress], None] | None = None,
+) -> list[BatchProgress]:
+    """Run ``items`` through ``graph`` with at most ``concurrency`` at once.
+
+    Each item is logged as soon as it finishes. Pipeline errors are recorded
+    as failed items rather than stopping the batch.
+
+    Args:
+        on_update: Called with an item's progress whenever it changes.
+    """
+    notify = on_update or (lambda progress: None)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    progress = [BatchProgress(item) for item in items]
+
+    async def run_one(p: BatchProgress) -> None:
+        async with semaphore:
+            p.status, p.started = "running", time.perf_counter()
+            notify(p)
+            state: ApplicationState = {}
+            try:
+                async for node_name, state in astream_pipeline(p.item.initial_state(), graph):
+                    p.status = node_name
+                    notify(p)
+            except Exception as e:
+                logger.error(f"Batch item {p.item.item_id} failed: {e}")
+                state = {**state, "error": str(e)}
+            p.finish(state)
+            log.append(p.record())
+            notify(p)
+
+    await asyncio.gather(*(run_one(p) for p in progress))
+    return progress
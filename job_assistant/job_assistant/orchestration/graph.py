@@ -1,14 +1,28 @@
-"""LangGraph StateGraph builder for the application pipeline."""
+"""LangGraph StateGraph builder and drivers for the application pipeline."""
 
-from langgraph.graph import END, StateGraph
+from collections.abc import AsyncIterator, Callable
 
+from job_assistant.config import settings
 from job_assistant.orchestration.nodes import (
     advise_strategy,
+    advise_strategy_async,
     analyze_job,
+    analyze_job_async,
+    below_match_threshold,
     generate_content,
+    generate_content_async,
     match_skills,
+    match_skills_async,
+    preprocess_job_text,
+    preprocess_job_text_async,
+    save_generated,
+    save_generated_async,
     save_results,
+    save_results_async,
     scrape_or_validate,
+    scrape_or_validate_async,
+    write_and_advise,
+    write_and_advise_async,
 )
 from job_assistant.schemas.state import ApplicationState
 from job_assistant.utils.logger import get_logger
@@ -23,23 +37,89 @@ def _has_error(state: ApplicationState) -> str:
     return "continue"
 
 
+def _generation(state: ApplicationState) -> str | list[str]:
+    """Run writer and advisor in parallel, or as one fused call if configured."""
+    if settings.fused_writer_advisor:
+        return "write_and_advise"
+    return ["generate_content", "advise_strategy"]
+
+
+def _fan_out(state: ApplicationState) -> str | list[str]:
+    """Conditional edge after matching: generate, or skip to save_results.
+
+    Generation is skipped on error and for postings whose match score is
+    below ``settings.min_match_score``.
+    """
+    if state.get("error"):
+        return "save_results"
+    if below_match_threshold(state):
+        logger.info(
+            f"Match score {state['match_analysis'].overall_score} is below "
+            f"{settings.min_match_score}; skipping writing and advice"
+        )
+        return "save_results"
+    return _generation(state)
+
+
+def _add_generation_nodes(graph, save_node: str) -> None:
+    """Add the writer, advisor and fused nodes, all joining at ``save_node``."""
+    from langchain_core.runnables import RunnableLambda
+
+    graph.add_node(
+        "generate_content",
+        RunnableLambda(generate_content, afunc=generate_content_async),
+    )
+    graph.add_node(
+        "advise_strategy",
+        RunnableLambda(advise_strategy, afunc=advise_strategy_async),
+    )
+    graph.add_node(
+        "write_and_advise",
+        RunnableLambda(write_and_advise, afunc=write_and_advise_async),
+    )
+
+    # Join: save_node waits for both parallel branches
+    graph.add_edge(["generate_content", "advise_strategy"], save_node)
+    graph.add_edge("write_and_advise", save_node)
+
+
 def build_graph():
     """Build and compile the LangGraph pipeline.
 
-    Pipeline: scrape_or_validate → analyze_job → match_skills →
-              generate_content → advise_strategy → save_results → END
+    Pipeline: scrape_or_validate → preprocess_job_text → analyze_job →
+              match_skills → (generate_content ∥ advise_strategy) →
+              save_results → END
 
-    Each node has a conditional edge: if error is set, skip to save_results.
+    The writer and advisor only read the job and match analyses, so they run
+    as parallel branches that join before save_results, or as a single
+    write_and_advise node when ``settings.fused_writer_advisor`` is set
+    (falling back to two calls if the fused one fails). Up to match_skills,
+    each node has a conditional edge: if error is set, skip to save_results.
+    Errors from the parallel branches are merged and saved after the join.
+    Postings scoring below ``settings.min_match_score`` also go straight
+    from match_skills to save_results and are stored as skipped-low-match;
+    ``build_generation_graph`` can generate their content later.
+    Nodes carry both a sync and an async implementation, so the compiled
+    graph can be driven with ``stream`` or ``astream``.
     """
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import END, StateGraph
+
     graph = StateGraph(ApplicationState)
 
     # Add nodes
-    graph.add_node("scrape_or_validate", scrape_or_validate)
-    graph.add_node("analyze_job", analyze_job)
-    graph.add_node("match_skills", match_skills)
-    graph.add_node("generate_content", generate_content)
-    graph.add_node("advise_strategy", advise_strategy)
-    graph.add_node("save_results", save_results)
+    graph.add_node(
+        "scrape_or_validate",
+        RunnableLambda(scrape_or_validate, afunc=scrape_or_validate_async),
+    )
+    graph.add_node(
+        "preprocess_job_text",
+        RunnableLambda(preprocess_job_text, afunc=preprocess_job_text_async),
+    )
+    graph.add_node("analyze_job", RunnableLambda(analyze_job, afunc=analyze_job_async))
+    graph.add_node("match_skills", RunnableLambda(match_skills, afunc=match_skills_async))
+    graph.add_node("save_results", RunnableLambda(save_results, afunc=save_results_async))
+    _add_generation_nodes(graph, "save_results")
 
     # Set entry point
     graph.set_entry_point("scrape_or_validate")
@@ -48,6 +128,11 @@ def build_graph():
     graph.add_conditional_edges(
         "scrape_or_validate",
         _has_error,
+        {"save_results": "save_results", "continue": "preprocess_job_text"},
+    )
+    graph.add_conditional_edges(
+        "preprocess_job_text",
+        _has_error,
         {"save_results": "save_results", "continue": "analyze_job"},
     )
     graph.add_conditional_edges(
@@ -57,18 +142,8 @@ def build_graph():
     )
     graph.add_conditional_edges(
         "match_skills",
-        _has_error,
-        {"save_results": "save_results", "continue": "generate_content"},
-    )
-    graph.add_conditional_edges(
-        "generate_content",
-        _has_error,
-        {"save_results": "save_results", "continue": "advise_strategy"},
-    )
-    graph.add_conditional_edges(
-        "advise_strategy",
-        _has_error,
-        {"save_results": "save_results", "continue": "save_results"},
+        _fan_out,
+        ["save_results", "generate_content", "advise_strategy", "write_and_advise"],
     )
 
     # save_results → END
@@ -77,3 +152,71 @@ def build_graph():
     app = graph.compile()
     logger.info("LangGraph pipeline compiled successfully")
     return app
+
+
+def build_generation_graph():
+    """Build the graph that generates content for an already stored application.
+
+    Pipeline: (generate_content ∥ advise_strategy, or write_and_advise) →
+              save_generated → END
+
+    The initial state needs ``db_id`` plus the stored ``job_analysis`` and
+    ``match_analysis`` (see ``storage.database.get_application``). Used to
+    force generation for postings skipped for a low match score.
+    """
+    from langchain_core.runnables import RunnableLambda
+    from langgraph.graph import END, START, StateGraph
+
+    graph = StateGraph(ApplicationState)
+    graph.add_node(
+        "save_generated", RunnableLambda(save_generated, afunc=save_generated_async)
+    )
+    _add_generation_nodes(graph, "save_generated")
+    graph.add_conditional_edges(
+        START, _generation, ["generate_content", "advise_strategy", "write_and_advise"]
+    )
+    graph.add_edge("save_generated", END)
+    return graph.compile()
+
+
+async def astream_pipeline(
+    initial_state: ApplicationState,
+    graph=None,
+    on_custom: Callable[[dict], None] | None = None,
+) -> AsyncIterator[tuple[str, ApplicationState]]:
+    """Run the pipeline on the current event loop.
+
+    Yields ``(node_name, state)`` as each node finishes, where ``state`` is
+    the merged pipeline state after that step (parallel branches finish in
+    the same step). Many postings can be processed
+    concurrently by running several of these on one loop. Keep to a single
+    event loop per process: the shared LLM client's async connections are
+    bound to the loop that first used them.
+
+    Args:
+        graph: A compiled graph from ``build_graph``; built if omitted.
+        on_custom: Called with progress events that nodes publish while
+            running, e.g. ``{"cover_letter": text_so_far}`` from the writer.
+    """
+    graph = graph or build_graph()
+    finished: list[str] = []
+    # "updates" name the nodes that ran; "values" follows with the merged state
+    modes = ["updates", "values", "custom"] if on_custom else ["updates", "values"]
+    async for mode, chunk in graph.astream(initial_state, stream_mode=modes):
+        if mode == "custom":
+            on_custom(chunk)
+            continue
+        if mode == "updates":
+            finished.extend(chunk)
+            continue
+        for node_name in finished:
+            yield node_name, chunk
+        finished = []
+
+
+async def arun_pipeline(initial_state: ApplicationState, graph=None) -> ApplicationState:
+    """Run the pipeline to completion on the current event loop."""
+    state: ApplicationState = dict(initial_state)
+    async for _, state in astream_pipeline(initial_state, graph):
+        pass
+    return state
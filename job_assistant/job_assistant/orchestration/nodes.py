@@ -1,95 +1,235 @@
-"""LangGraph node functions wrapping each agent."""
-
-from job_assistant.agents.analyzer import JobAnalyzerAgent
-from job_assistant.agents.matcher import SkillMatcherAgent
-from job_assistant.agents.writer import ContentWriterAgent
-from job_assistant.agents.advisor import StrategyAdvisorAgent
-from job_assistant.schemas.state import ApplicationState
-from job_assistant.storage.database import save_application
+"""LangGraph node functions wrapping each agent.
+
+Agents and the scraper are imported inside each node so that importing the
+graph does not pull in LangChain, ChromaDB or the HTTP stack. Agents come
+from the registry, so each is built once per process and reused across runs.
+
+Nodes return only the state keys they set, which LangGraph merges into the
+pipeline state; this lets the writer and advisor run as parallel branches.
+
+Every node has an ``*_async`` twin used when the graph is driven with
+``astream``: agent calls await the LLM, and blocking scraping and storage
+work runs in a worker thread, so one event loop can serve many postings.
+"""
+
+import asyncio
+import functools
+import inspect
+
+from job_assistant.agents.registry import get_agent
+from job_assistant.config import settings
+from job_assistant.schemas.state import ApplicationState, merge_errors
+from job_assistant.storage.database import (
+    STATUS_FAILED,
+    STATUS_GENERATED,
+    STATUS_SKIPPED_LOW_MATCH,
+    save_agent_metrics,
+    save_application,
+    save_generated_content,
+)
 from job_assistant.storage.exporter import export_analysis
 from job_assistant.utils.logger import get_logger
-from job_assistant.utils.scraper import scrape_job_posting
+from job_assistant.utils.metrics import collect_agent_calls
 
 logger = get_logger(__name__)
 
 
+def _with_agent_metrics(node):
+    """Add the metrics of the agent calls a node makes to its state update."""
+    if inspect.iscoroutinefunction(node):
+        @functools.wraps(node)
+        async def async_wrapper(state: ApplicationState) -> ApplicationState:
+            with collect_agent_calls() as calls:
+                update = await node(state)
+            return {**update, "metrics": calls}
+
+        return async_wrapper
+
+    @functools.wraps(node)
+    def wrapper(state: ApplicationState) -> ApplicationState:
+        with collect_agent_calls() as calls:
+            update = node(state)
+        return {**update, "metrics": calls}
+
+    return wrapper
+
+
+def _cover_letter_streamer():
+    """Callback publishing the partial cover letter on LangGraph's custom stream."""
+    from langgraph.config import get_stream_writer
+
+    write = get_stream_writer()
+
+    def on_partial(partial: dict) -> None:
+        if partial.get("cover_letter"):
+            write({"cover_letter": partial["cover_letter"]})
+
+    return on_partial
+
+
 def scrape_or_validate(state: ApplicationState) -> ApplicationState:
     """Scrape job URL or validate provided text."""
     try:
         if state.get("job_text"):
             logger.info("Using provided job text")
-            return state
+            return {}
 
         url = state.get("job_url")
         if not url:
-            return {**state, "error": "No job URL or text provided."}
+            return {"error": "No job URL or text provided."}
+
+        from job_assistant.utils.scraper import scrape_job_posting
 
         logger.info(f"Scraping job posting from: {url}")
         text = scrape_job_posting(url)
-        return {**state, "job_text": text}
+        return {"job_text": text}
     except Exception as e:
         logger.error(f"Scrape/validate failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
+
+
+def preprocess_job_text(state: ApplicationState) -> ApplicationState:
+    """Strip boilerplate and repeated lines from the job text before analysis."""
+    if not settings.clean_job_text:
+        return {}
+    try:
+        from job_assistant.utils.job_text import clean_job_text
+
+        cleaned = clean_job_text(state["job_text"])
+        # Keep the original if cleaning left almost nothing to analyse
+        if cleaned.chars_after < min(200, cleaned.chars_before // 4):
+            logger.warning("Job text cleaning removed too much; using the original text")
+            return {}
+        logger.info(
+            f"Cleaned job text: {cleaned.chars_before} -> {cleaned.chars_after} chars "
+            f"({cleaned.reduction:.0%} less, {cleaned.tokens_saved} tokens saved)"
+        )
+        return {"job_text": cleaned.text, "job_text_stats": cleaned.stats()}
+    except Exception as e:
+        logger.error(f"Job text preprocessing failed: {e}")
+        return {"error": str(e)}
 
 
+@_with_agent_metrics
 def analyze_job(state: ApplicationState) -> ApplicationState:
     """Run the Job Analyzer agent."""
     try:
-        agent = JobAnalyzerAgent()
+        from job_assistant.agents.analyzer import JobAnalyzerAgent
+
+        agent = get_agent(JobAnalyzerAgent)
         result = agent.run(job_text=state["job_text"])
-        return {**state, "job_analysis": result}
+        return {"job_analysis": result}
     except Exception as e:
         logger.error(f"Job analysis failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
 
 
+@_with_agent_metrics
 def match_skills(state: ApplicationState) -> ApplicationState:
     """Run the Skill Matcher agent with RAG."""
     try:
-        agent = SkillMatcherAgent()
+        from job_assistant.agents.matcher import SkillMatcherAgent
+
+        agent = get_agent(SkillMatcherAgent)
         result = agent.run(job_analysis=state["job_analysis"])
-        return {**state, "match_analysis": result}
+        return {"match_analysis": result}
     except Exception as e:
         logger.error(f"Skill matching failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
 
 
+@_with_agent_metrics
 def generate_content(state: ApplicationState) -> ApplicationState:
-    """Run the Content Writer agent."""
+    """Run the Content Writer agent, streaming the cover letter as it is written."""
     try:
-        agent = ContentWriterAgent()
+        from job_assistant.agents.writer import ContentWriterAgent
+
+        agent = get_agent(ContentWriterAgent)
         result = agent.run(
             job_analysis=state["job_analysis"],
             match_analysis=state["match_analysis"],
+            on_partial=_cover_letter_streamer(),
         )
-        return {**state, "writer_output": result}
+        return {"writer_output": result}
     except Exception as e:
         logger.error(f"Content generation failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
 
 
+@_with_agent_metrics
 def advise_strategy(state: ApplicationState) -> ApplicationState:
     """Run the Strategy Advisor agent."""
     try:
-        agent = StrategyAdvisorAgent()
+        from job_assistant.agents.advisor import StrategyAdvisorAgent
+
+        agent = get_agent(StrategyAdvisorAgent)
         result = agent.run(
             job_analysis=state["job_analysis"],
             match_analysis=state["match_analysis"],
         )
-        return {**state, "advisor_output": result}
+        return {"advisor_output": result}
     except Exception as e:
         logger.error(f"Strategy advising failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
+
+
+def _merge_branches(writer: ApplicationState, advisor: ApplicationState) -> ApplicationState:
+    """Combine writer and advisor updates as the parallel-branch join would."""
+    update = {**writer, **advisor}
+    if writer.get("error") or advisor.get("error"):
+        update["error"] = merge_errors(writer.get("error"), advisor.get("error"))
+    return update
+
+
+@_with_agent_metrics
+def write_and_advise(state: ApplicationState) -> ApplicationState:
+    """Run the fused Writer + Advisor agent, falling back to separate calls."""
+    try:
+        from job_assistant.agents.writer_advisor import WriterAdvisorAgent
+
+        agent = get_agent(WriterAdvisorAgent)
+        package = agent.run(
+            job_analysis=state["job_analysis"],
+            match_analysis=state["match_analysis"],
+            on_partial=_cover_letter_streamer(),
+        )
+        writer_output, advisor_output = package.split()
+        return {"writer_output": writer_output, "advisor_output": advisor_output}
+    except Exception as e:
+        logger.warning(f"Fused writing and advising failed ({e}); using separate agents")
+    # Undecorated nodes, so their agent calls are collected by this one
+    return _merge_branches(
+        generate_content.__wrapped__(state), advise_strategy.__wrapped__(state)
+    )
+
+
+def below_match_threshold(state: ApplicationState) -> bool:
+    """Whether the match score is below ``settings.min_match_score``."""
+    match_analysis = state.get("match_analysis")
+    if match_analysis is None:
+        return False
+    return match_analysis.overall_score < settings.min_match_score
 
 
 def save_results(state: ApplicationState) -> ApplicationState:
-    """Save results to database and export JSON."""
+    """Save results to database and export JSON.
+
+    If the state already has a ``db_id`` (a batch retrying a failed posting),
+    that row is overwritten rather than a new one inserted.
+    """
     try:
         job_analysis = state.get("job_analysis")
         match_analysis = state.get("match_analysis")
         writer_output = state.get("writer_output")
         advisor_output = state.get("advisor_output")
 
+        if state.get("error"):
+            status = STATUS_FAILED
+        elif not writer_output and below_match_threshold(state):
+            status = STATUS_SKIPPED_LOW_MATCH
+        else:
+            status = STATUS_GENERATED
+
         # Export JSON
         filepath = export_analysis(
             job_analysis=job_analysis,
@@ -97,6 +237,7 @@ def save_results(state: ApplicationState) -> ApplicationState:
             writer_output=writer_output,
             advisor_output=advisor_output,
             job_url=state.get("job_url"),
+            status=status,
         )
 
         # Save to database
@@ -106,9 +247,141 @@ def save_results(state: ApplicationState) -> ApplicationState:
             match_analysis=match_analysis,
             writer_output=writer_output,
             advisor_output=advisor_output,
+            status=status,
+            row_id=state.get("db_id"),
         )
+        save_agent_metrics(db_id, state.get("metrics", []))
 
-        return {**state, "output_path": str(filepath), "db_id": db_id}
+        return {"output_path": str(filepath), "db_id": db_id, "status": status}
     except Exception as e:
         logger.error(f"Saving results failed: {e}")
-        return {**state, "error": str(e)}
+        return {"error": str(e)}
+
+
+def save_generated(state: ApplicationState) -> ApplicationState:
+    """Store content generated later for the stored application ``db_id``."""
+    try:
+        save_agent_metrics(state["db_id"], state.get("metrics", []))
+        if state.get("error"):
+            return {}
+
+        filepath = export_analysis(
+            job_analysis=state["job_analysis"],
+            match_analysis=state["match_analysis"],
+            writer_output=state.get("writer_output"),
+            advisor_output=state.get("advisor_output"),
+            job_url=state.get("job_url"),
+            status=STATUS_GENERATED,
+        )
+        save_generated_content(
+            state["db_id"], state.get("writer_output"), state.get("advisor_output")
+        )
+        return {"output_path": str(filepath), "status": STATUS_GENERATED}
+    except Exception as e:
+        logger.error(f"Saving generated content failed: {e}")
+        return {"error": str(e)}
+
+
+async def scrape_or_validate_async(state: ApplicationState) -> ApplicationState:
+    """Async scrape_or_validate (the HTTP request runs in a worker thread)."""
+    return await asyncio.to_thread(scrape_or_validate, state)
+
+
+async def preprocess_job_text_async(state: ApplicationState) -> ApplicationState:
+    """Async preprocess_job_text (fast, CPU-only, so it runs on the loop)."""
+    return preprocess_job_text(state)
+
+
+@_with_agent_metrics
+async def analyze_job_async(state: ApplicationState) -> ApplicationState:
+    """Run the Job Analyzer agent without blocking the event loop."""
+    try:
+        from job_assistant.agents.analyzer import JobAnalyzerAgent
+
+        agent = get_agent(JobAnalyzerAgent)
+        result = await agent.arun(job_text=state["job_text"])
+        return {"job_analysis": result}
+    except Exception as e:
+        logger.error(f"Job analysis failed: {e}")
+        return {"error": str(e)}
+
+
+@_with_agent_metrics
+async def match_skills_async(state: ApplicationState) -> ApplicationState:
+    """Run the Skill Matcher agent with RAG without blocking the event loop."""
+    try:
+        from job_assistant.agents.matcher import SkillMatcherAgent
+
+        agent = get_agent(SkillMatcherAgent)
+        result = await agent.arun(job_analysis=state["job_analysis"])
+        return {"match_analysis": result}
+    except Exception as e:
+        logger.error(f"Skill matching failed: {e}")
+        return {"error": str(e)}
+
+
+@_with_agent_metrics
+async def generate_content_async(state: ApplicationState) -> ApplicationState:
+    """Run the Content Writer agent without blocking the event loop."""
+    try:
+        from job_assistant.agents.writer import ContentWriterAgent
+
+        agent = get_agent(ContentWriterAgent)
+        result = await agent.arun(
+            job_analysis=state["job_analysis"],
+            match_analysis=state["match_analysis"],
+            on_partial=_cover_letter_streamer(),
+        )
+        return {"writer_output": result}
+    except Exception as e:
+        logger.error(f"Content generation failed: {e}")
+        return {"error": str(e)}
+
+
+@_with_agent_metrics
+async def advise_strategy_async(state: ApplicationState) -> ApplicationState:
+    """Run the Strategy Advisor agent without blocking the event loop."""
+    try:
+        from job_assistant.agents.advisor import StrategyAdvisorAgent
+
+        agent = get_agent(StrategyAdvisorAgent)
+        result = await agent.arun(
+            job_analysis=state["job_analysis"],
+            match_analysis=state["match_analysis"],
+        )
+        return {"advisor_output": result}
+    except Exception as e:
+        logger.error(f"Strategy advising failed: {e}")
+        return {"error": str(e)}
+
+
+@_with_agent_metrics
+async def write_and_advise_async(state: ApplicationState) -> ApplicationState:
+    """Run the fused Writer + Advisor agent without blocking the event loop."""
+    try:
+        from job_assistant.agents.writer_advisor import WriterAdvisorAgent
+
+        agent = get_agent(WriterAdvisorAgent)
+        package = await agent.arun(
+            job_analysis=state["job_analysis"],
+            match_analysis=state["match_analysis"],
+            on_partial=_cover_letter_streamer(),
+        )
+        writer_output, advisor_output = package.split()
+        return {"writer_output": writer_output, "advisor_output": advisor_output}
+    except Exception as e:
+        logger.warning(f"Fused writing and advising failed ({e}); using separate agents")
+    writer, advisor = await asyncio.gather(
+        generate_content_async.__wrapped__(state), advise_strategy_async.__wrapped__(state)
+    )
+    return _merge_branches(writer, advisor)
+
+
+async def save_results_async(state: ApplicationState) -> ApplicationState:
+    """Async save_results (database and file writes run in a worker thread)."""
+    return await asyncio.to_thread(save_results, state)
+
+
+async def save_generated_async(state: ApplicationState) -> ApplicationState:
+    """Async save_generated (database and file writes run in a worker thread)."""
+    return await asyncio.to_thread(save_generated, state)
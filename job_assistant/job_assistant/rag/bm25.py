@@ -0,0 +1,117 @@
+"""Compact BM25 inverted index over knowledge base chunks.
+
+Skill names such as "SQL", "IFRS" or "Power BI" are exact-match terms that
+small embedding models often rank poorly. This index scores them lexically
+so the retriever can fuse both rankings.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+
+from job_assistant.config import BM25_INDEX_PATH
+
+# Keep tokens like "c++", "c#", ".net" and "power-bi" intact
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[.\-][a-z0-9+#]+)*")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or that the "
+    "this to was were will with".split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens with stopwords removed."""
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in _STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 inverted index supporting incremental add/remove.
+
+    Persisted as JSON holding each chunk's term frequencies; document
+    lengths and postings lists are derived from those on load.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._doc_lengths: dict[str, int] = {}
+        self._doc_terms: dict[str, dict[str, int]] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_lengths)
+
+    def add(self, chunks: list[dict]) -> None:
+        """Index chunks (dicts with keys: id, text)."""
+        for chunk in chunks:
+            self._add_terms(chunk["id"], Counter(tokenize(chunk["text"])))
+
+    def _add_terms(self, chunk_id: str, terms: dict[str, int]) -> None:
+        if chunk_id in self._doc_lengths:
+            self.remove([chunk_id])
+        length = sum(terms.values())
+        self._doc_lengths[chunk_id] = length
+        self._doc_terms[chunk_id] = dict(terms)
+        self._total_length += length
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[chunk_id] = tf
+
+    def remove(self, chunk_ids: list[str]) -> None:
+        """Drop chunks from the index. Unknown IDs are ignored."""
+        for chunk_id in chunk_ids:
+            if chunk_id not in self._doc_lengths:
+                continue
+            self._total_length -= self._doc_lengths.pop(chunk_id)
+            for term in self._doc_terms.pop(chunk_id):
+                postings = self._postings[term]
+                del postings[chunk_id]
+                if not postings:
+                    del self._postings[term]
+
+    def search(self, query: str, k: int) -> list[tuple[str, float]]:
+        """Return up to ``k`` (chunk_id, score) pairs, best first.
+
+        Only chunks sharing at least one term with the query are returned.
+        """
+        n_docs = len(self._doc_lengths)
+        if not n_docs:
+            return []
+        avg_length = self._total_length / n_docs
+
+        scores: dict[str, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for chunk_id, tf in postings.items():
+                length_ratio = self._doc_lengths[chunk_id] / avg_length
+                norm = self.k1 * (1 - self.b + self.b * length_ratio)
+                score = idf * tf * (self.k1 + 1) / (tf + norm)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + score
+
+        return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+
+    def save(self) -> None:
+        """Atomically persist the index to BM25_INDEX_PATH."""
+        BM25_INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = BM25_INDEX_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"docs": self._doc_terms}), encoding="utf-8")
+        tmp_path.replace(BM25_INDEX_PATH)
+
+    @classmethod
+    def load(cls) -> BM25Index | None:
+        """Load the persisted index, or None if it is missing or unreadable."""
+        try:
+            data = json.loads(BM25_INDEX_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        index = cls()
+        for chunk_id, terms in data["docs"].items():
+            index._add_terms(chunk_id, terms)
+        return index
@@ -0,0 +1,117 @@
+"""ChromaDB persistent vector store backend."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Sequence
+
+import chromadb
+
+from job_assistant.config import CHROMA_DB_DIR
+from job_assistant.rag.vector_store import VectorStore
+
+if TYPE_CHECKING:
+    from chromadb.api.models.Collection import Collection
+
+# Embeddings are passed in explicitly, so collections are opened without an
+# embedding function and always use cosine distance.
+_COLLECTION_METADATA = {"hnsw:space": "cosine"}
+
+
+class ChromaVectorStore(VectorStore):
+    """Vector store backed by a ChromaDB persistent collection."""
+
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+        self._lock = threading.Lock()
+        self._client: chromadb.PersistentClient | None = None
+        self._collection: Collection | None = None
+
+    @property
+    def client(self) -> chromadb.PersistentClient:
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
+                    self._client = chromadb.PersistentClient(path=str(CHROMA_DB_DIR))
+        return self._client
+
+    @property
+    def collection(self) -> Collection:
+        """Cached collection handle. Raises if the collection does not exist."""
+        if self._collection is None:
+            client = self.client
+            with self._lock:
+                if self._collection is None:
+                    self._collection = client.get_collection(
+                        name=self.collection_name,
+                        embedding_function=None,
+                    )
+        return self._collection
+
+    def count(self) -> int:
+        try:
+            return self.collection.count()
+        except Exception:
+            return 0  # Collection doesn't exist yet
+
+    def ids(self) -> set[str]:
+        return set(self.collection.get(include=[])["ids"])
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        self.collection.add(
+            ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas,
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        self.collection.delete(ids=ids)
+
+    def rebuild(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        try:
+            self.client.delete_collection(self.collection_name)
+        except Exception:
+            pass  # Collection doesn't exist yet
+        self._collection = self.client.create_collection(
+            name=self.collection_name,
+            embedding_function=None,
+            metadata=_COLLECTION_METADATA,
+        )
+        self.add(ids, embeddings, documents, metadatas)
+
+    def get(self, ids: list[str]) -> list[dict]:
+        results = self.collection.get(ids=ids, include=["documents", "metadatas"])
+        return [
+            {"id": chunk_id, "text": text, "metadata": metadata}
+            for chunk_id, text, metadata in zip(
+                results["ids"], results["documents"], results["metadatas"]
+            )
+        ]
+
+    def query(
+        self, embeddings: Sequence[Sequence[float]], k: int
+    ) -> list[list[dict]]:
+        results = self.collection.query(query_embeddings=embeddings, n_results=k)
+        return [
+            [
+                {
+                    "id": results["ids"][q][i],
+                    "text": results["documents"][q][i],
+                    "metadata": results["metadatas"][q][i],
+                    "distance": results["distances"][q][i],
+                }
+                for i in range(len(results["ids"][q]))
+            ]
+            for q in range(len(results["ids"]))
+        ]
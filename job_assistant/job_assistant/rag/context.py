@@ -0,0 +1,147 @@
+"""Token-budgeted context assembly for agent prompts.
+
+Retrieved chunks are selected with maximal marginal relevance (MMR) so the
+context is both relevant and non-redundant, then trimmed to their most
+relevant lines until the agent's token budget is spent.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+
+from job_assistant.rag.bm25 import tokenize
+
+CONTEXT_SEPARATOR = "\n\n---\n\n"
+
+# Trade-off between relevance (1.0) and diversity (0.0) in MMR selection
+MMR_LAMBDA = 0.7
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token for English text)."""
+    return math.ceil(len(text) / 4)
+
+
+@dataclass
+class PackedContext:
+    """Assembled prompt context and how much of the retrieved text it kept."""
+
+    text: str
+    chunks_used: int
+    chunks_total: int
+    tokens_used: int
+    tokens_total: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_total - self.tokens_used
+
+
+def _cosine(a: Counter, b: Counter) -> float:
+    if not a or not b:
+        return 0.0
+    dot = sum(count * b[term] for term, count in a.items() if term in b)
+    norm_a = math.sqrt(sum(v * v for v in a.values()))
+    norm_b = math.sqrt(sum(v * v for v in b.values()))
+    return dot / (norm_a * norm_b)
+
+
+def _relevance(chunks: list[dict]) -> list[float]:
+    """Normalize retrieval relevance to [0, 1], best chunk first = 1."""
+    if all("score" in c for c in chunks):
+        raw = [c["score"] for c in chunks]
+    else:
+        raw = [-(c.get("distance") or 0.0) for c in chunks]
+    low, high = min(raw), max(raw)
+    if high == low:
+        return [1.0] * len(chunks)
+    return [(r - low) / (high - low) for r in raw]
+
+
+def _mmr_order(chunks: list[dict], terms: list[Counter]) -> list[int]:
+    """Order chunk indices by maximal marginal relevance."""
+    relevance = _relevance(chunks)
+    remaining = list(range(len(chunks)))
+    order: list[int] = []
+    while remaining:
+        def mmr(i: int) -> float:
+            redundancy = max((_cosine(terms[i], terms[j]) for j in order), default=0.0)
+            return MMR_LAMBDA * relevance[i] - (1 - MMR_LAMBDA) * redundancy
+
+        best = max(remaining, key=mmr)
+        order.append(best)
+        remaining.remove(best)
+    return order
+
+
+def _trim(text: str, query_terms: set[str], budget: int) -> str:
+    """Keep the heading plus the lines sharing most terms with the queries.
+
+    Lines keep their original order. Returns "" if not even the heading and
+    the best line fit in ``budget`` tokens.
+    """
+    lines = [line for line in text.splitlines() if line.strip()]
+    heading = lines[0] if lines and lines[0].startswith("#") else None
+    body = lines[1:] if heading else lines
+
+    ranked = sorted(
+        range(len(body)),
+        key=lambda i: len(query_terms & set(tokenize(body[i]))),
+        reverse=True,
+    )
+    used = estimate_tokens(heading) if heading else 0
+    keep: set[int] = set()
+    for i in ranked:
+        cost = estimate_tokens(body[i]) + 1
+        if used + cost <= budget:
+            keep.add(i)
+            used += cost
+    if not keep:
+        return ""
+
+    kept = [body[i] for i in sorted(keep)]
+    return "\n".join([heading, *kept] if heading else kept)
+
+
+def pack_context(
+    chunks: list[dict], queries: list[str], budget_tokens: int
+) -> PackedContext:
+    """Assemble retrieved chunks into a prompt context within a token budget.
+
+    Args:
+        chunks: Retrieval results (dicts with text and distance or score),
+            most relevant first.
+        queries: The queries the chunks were retrieved for; used to pick the
+            most relevant lines when a chunk has to be trimmed.
+        budget_tokens: Maximum estimated tokens for the joined context.
+    """
+    if not chunks:
+        return PackedContext("", 0, 0, 0, 0)
+    tokens_total = estimate_tokens(CONTEXT_SEPARATOR.join(c["text"] for c in chunks))
+
+    terms = [Counter(tokenize(c["text"])) for c in chunks]
+    query_terms = {t for q in queries for t in tokenize(q)}
+    separator_cost = estimate_tokens(CONTEXT_SEPARATOR)
+
+    parts: list[str] = []
+    used = 0
+    for i in _mmr_order(chunks, terms):
+        remaining = budget_tokens - used - (separator_cost if parts else 0)
+        if remaining <= 0:
+            break
+        text = chunks[i]["text"]
+        if estimate_tokens(text) > remaining:
+            text = _trim(text, query_terms, remaining)
+            if not text:
+                continue
+        used += estimate_tokens(text) + (separator_cost if parts else 0)
+        parts.append(text)
+
+    context = CONTEXT_SEPARATOR.join(parts)
+    return PackedContext(
+        text=context,
+        chunks_used=len(parts),
+        chunks_total=len(chunks),
+        tokens_used=estimate_tokens(context),
+        tokens_total=tokens_total,
+    )
@@ -1,16 +1,129 @@
-"""SentenceTransformer embedding wrapper for ChromaDB."""
+"""SentenceTransformer embedding wrapper and persistent query-embedding cache."""
 
-from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+from __future__ import annotations
 
-from job_assistant.config import settings
+import hashlib
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+
+from job_assistant.config import EMBEDDING_CACHE_PATH, settings
+from job_assistant.utils.cache import SQLiteCache
 from job_assistant.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+
 logger = get_logger(__name__)
 
+EMBEDDING_BACKENDS = ("torch", "onnx")
+
+
+def embedding_signature() -> str:
+    """Identify the vectors the configured model and backend produce.
+
+    Quantized ONNX vectors are close to, but not identical with, the torch
+    ones, so anything persisted alongside embeddings is keyed by this.
+    """
+    return f"{settings.embedding_model}:{settings.embedding_backend}"
+
 
 def get_embedding_function() -> SentenceTransformerEmbeddingFunction:
-    """Get the SentenceTransformer embedding function for ChromaDB."""
-    logger.info(f"Loading embedding model: {settings.embedding_model}")
+    """Get the SentenceTransformer embedding function for ChromaDB.
+
+    With ``settings.embedding_backend == "onnx"`` the model runs on ONNX
+    Runtime using the int8-quantized weights named by
+    ``settings.onnx_model_file`` instead of PyTorch.
+
+    Loads the model, so callers should only ask for it once embeddings are
+    actually needed.
+    """
+    from chromadb.utils.embedding_functions import SentenceTransformerEmbeddingFunction
+
+    if settings.embedding_backend not in EMBEDDING_BACKENDS:
+        raise ValueError(
+            f"Unknown embedding backend '{settings.embedding_backend}'. "
+            f"Expected one of: {', '.join(EMBEDDING_BACKENDS)}"
+        )
+
+    logger.info(
+        f"Loading embedding model: {settings.embedding_model} "
+        f"({settings.embedding_backend})"
+    )
+    if settings.embedding_backend == "onnx":
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            raise ValueError(
+                "The ONNX embedding backend needs onnxruntime. "
+                "Please install it with `pip install optimum[onnxruntime]`"
+            )
+        return SentenceTransformerEmbeddingFunction(
+            model_name=settings.embedding_model,
+            backend="onnx",
+            model_kwargs={"file_name": settings.onnx_model_file},
+        )
     return SentenceTransformerEmbeddingFunction(
         model_name=settings.embedding_model,
     )
+
+
+def normalize_query(text: str) -> str:
+    """Collapse whitespace so trivially different spellings share an entry."""
+    return " ".join(text.split())
+
+
+class CachedEmbeddingFunction:
+    """Disk-backed LRU cache in front of an embedding function.
+
+    Entries are keyed by the embedding signature plus the normalized text and
+    stored in SQLite under DATA_DIR, so repeated queries skip the transformer
+    forward pass across processes and restarts. The wrapped embedding
+    function is only created on the first cache miss.
+    """
+
+    def __init__(
+        self,
+        embedding_fn_factory: Callable[[], Callable[[list[str]], list]],
+        max_entries: int | None = None,
+    ):
+        self._embedding_fn_factory = embedding_fn_factory
+        self._cache = SQLiteCache(
+            EMBEDDING_CACHE_PATH,
+            "query_embeddings_lru",
+            settings.embedding_cache_size if max_entries is None else max_entries,
+        )
+
+    @staticmethod
+    def _key(text: str) -> str:
+        raw = f"{embedding_signature()}\0{normalize_query(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def __call__(self, texts: list[str]) -> list[np.ndarray]:
+        if not texts:
+            return []
+        if not self._cache.enabled:
+            return list(self._embedding_fn_factory()(texts))
+
+        keys = [self._key(t) for t in texts]
+        cached = {
+            key: np.frombuffer(blob, dtype=np.float32)
+            for key, blob in self._cache.get_many(keys).items()
+        }
+
+        # Embed each distinct miss once, in a single batch
+        misses = {key: text for key, text in zip(keys, texts) if key not in cached}
+        if misses:
+            vectors = self._embedding_fn_factory()(list(misses.values()))
+            computed = {
+                key: np.asarray(vector, dtype=np.float32)
+                for key, vector in zip(misses, vectors)
+            }
+            self._cache.set_many({key: v.tobytes() for key, v in computed.items()})
+            cached.update(computed)
+
+        logger.debug(
+            f"Query embeddings: {len(texts) - len(misses)} cached, "
+            f"{len(misses)} computed"
+        )
+        return [cached[key] for key in keys]
@@ -1,5 +1,6 @@
 """Markdown loader and section-based chunker for knowledge base files."""
 
+import hashlib
 from pathlib import Path
 
 from job_assistant.config import KNOWLEDGE_BASE_DIR
@@ -19,10 +20,32 @@ def _categorize_file(filename: str) -> str:
     return filename.replace(".md", "")
 
 
+def chunk_id(source: str, section: str, text: str) -> str:
+    """Stable chunk ID derived from the chunk's source, section and content.
+
+    Editing one section only changes that section's ID, so re-indexing can
+    tell exactly which chunks were added, changed or removed.
+    """
+    digest = hashlib.sha256(f"{source}\0{section}\0{text}".encode("utf-8"))
+    return digest.hexdigest()[:32]
+
+
+def _make_chunk(text: str, source: str, category: str, section: str) -> dict:
+    return {
+        "id": chunk_id(source, section, text),
+        "text": text,
+        "metadata": {
+            "source": source,
+            "category": category,
+            "section": section,
+        },
+    }
+
+
 def chunk_markdown(filepath: Path) -> list[dict]:
     """Split a markdown file into chunks by ## headers.
 
-    Returns a list of dicts with keys: text, metadata (source, category, section).
+    Returns a list of dicts with keys: id, text, metadata (source, category, section).
     """
     text = filepath.read_text(encoding="utf-8")
     filename = filepath.stem
@@ -37,14 +60,7 @@ def chunk_markdown(filepath: Path) -> list[dict]:
             # Save previous section if it has content
             content = "\n".join(current_lines).strip()
             if content:
-                chunks.append({
-                    "text": content,
-                    "metadata": {
-                        "source": filename,
-                        "category": category,
-                        "section": current_section,
-                    },
-                })
+                chunks.append(_make_chunk(content, filename, category, current_section))
             current_section = line.lstrip("# ").strip()
             current_lines = [line]
         else:
@@ -53,14 +69,7 @@ def chunk_markdown(filepath: Path) -> list[dict]:
     # Don't forget the last section
     content = "\n".join(current_lines).strip()
     if content:
-        chunks.append({
-            "text": content,
-            "metadata": {
-                "source": filename,
-                "category": category,
-                "section": current_section,
-            },
-        })
+        chunks.append(_make_chunk(content, filename, category, current_section))
 
     return chunks
 
@@ -68,7 +77,7 @@ def chunk_markdown(filepath: Path) -> list[dict]:
 def load_knowledge_base() -> list[dict]:
     """Load and chunk all markdown files in the knowledge base directory.
 
-    Returns a list of dicts with keys: text, metadata.
+    Returns a list of dicts with keys: id, text, metadata.
     """
     all_chunks = []
     md_files = sorted(KNOWLEDGE_BASE_DIR.glob("*.md"))
@@ -84,3 +93,28 @@ def load_knowledge_base() -> list[dict]:
 
     logger.info(f"Total knowledge base chunks: {len(all_chunks)}")
     return all_chunks
+
+
+def fingerprint_files(previous: dict | None = None) -> dict[str, dict]:
+    """Fingerprint every markdown file in the knowledge base directory.
+
+    Returns a mapping of filename to {mtime_ns, size, sha256}. Files whose
+    mtime and size match the ``previous`` fingerprint reuse its hash instead
+    of being read again, so an unchanged knowledge base costs one stat() per
+    file.
+    """
+    previous = previous or {}
+    fingerprints = {}
+    for filepath in sorted(KNOWLEDGE_BASE_DIR.glob("*.md")):
+        stat = filepath.stat()
+        old = previous.get(filepath.name)
+        if old and old["mtime_ns"] == stat.st_mtime_ns and old["size"] == stat.st_size:
+            sha256 = old["sha256"]
+        else:
+            sha256 = hashlib.sha256(filepath.read_bytes()).hexdigest()
+        fingerprints[filepath.name] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+        }
+    return fingerprints
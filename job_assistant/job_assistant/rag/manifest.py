@@ -0,0 +1,109 @@
+"""On-disk manifest describing what is currently in the vector index."""
+
+import hashlib
+import json
+
+from job_assistant.config import KB_MANIFEST_PATH, settings
+from job_assistant.rag.embeddings import embedding_signature
+from job_assistant.rag.vector_store import vector_store_dir
+from job_assistant.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def load_manifest() -> dict | None:
+    """Load the index manifest, or None if it is missing or unreadable.
+
+    The manifest has keys: collection, vector_backend, embedding (the
+    ``embedding_signature``), files (fingerprints
+    from ``fingerprint_files``) and chunks (a mapping of chunk ID to its
+    source and section).
+    """
+    if not KB_MANIFEST_PATH.exists():
+        return None
+    try:
+        return json.loads(KB_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable index manifest: {e}")
+        return None
+
+
+def manifest_mtime() -> int | None:
+    """Modification time (ns) of the index manifest, or None if it is missing."""
+    try:
+        return KB_MANIFEST_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def save_manifest(manifest: dict) -> None:
+    """Atomically write the index manifest."""
+    KB_MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = KB_MANIFEST_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp_path.replace(KB_MANIFEST_PATH)
+
+
+def build_manifest(chunks: list[dict], files: dict[str, dict]) -> dict:
+    """Build a manifest for the given indexed chunks and source files."""
+    return {
+        "collection": settings.chroma_collection,
+        "vector_backend": settings.vector_backend,
+        "embedding": embedding_signature(),
+        "files": files,
+        "chunks": {
+            c["id"]: {
+                "source": c["metadata"]["source"],
+                "section": c["metadata"]["section"],
+            }
+            for c in chunks
+        },
+    }
+
+
+def is_same_index(manifest: dict | None) -> bool:
+    """Whether the manifest was built with the configured store and embeddings.
+
+    If not, existing vectors cannot be reused and the index must be rebuilt.
+    """
+    return (
+        manifest is not None
+        and manifest.get("vector_backend", "chroma") == settings.vector_backend
+        and manifest.get("embedding") == embedding_signature()
+    )
+
+
+def is_index_current(manifest: dict | None, files: dict[str, dict]) -> bool:
+    """Check whether the indexed collection still matches the knowledge base.
+
+    Compares content hashes only, so touching a file without editing it does
+    not count as a change. Needs neither the embedding model nor the vector store.
+    """
+    if manifest is None or not vector_store_dir().exists():
+        return False
+    if manifest.get("collection") != settings.chroma_collection:
+        return False
+    if not is_same_index(manifest):
+        return False
+    recorded = manifest.get("files", {})
+    return {name: f["sha256"] for name, f in recorded.items()} == {
+        name: f["sha256"] for name, f in files.items()
+    }
+
+
+def index_version(manifest: dict | None) -> str | None:
+    """Hash identifying the indexed content, or None if nothing is indexed.
+
+    Changes whenever a chunk is added, edited or removed, or the store or
+    embeddings change, so it can key anything derived from query results.
+    """
+    if manifest is None:
+        return None
+    raw = "\0".join(
+        [
+            manifest.get("vector_backend", "chroma"),
+            manifest.get("embedding", ""),
+            *sorted(manifest.get("chunks", {})),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
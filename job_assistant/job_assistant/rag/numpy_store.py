@@ -0,0 +1,174 @@
+"""In-process NumPy vector store backend.
+
+Stores L2-normalized embeddings in a memory-mapped ``.npy`` matrix next to a
+JSON sidecar holding the IDs, documents and metadata. Queries are an exact
+top-k search: one matrix multiply plus ``argpartition``. For a knowledge
+base of a few hundred chunks this is sub-millisecond and needs no database.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Sequence
+
+import numpy as np
+
+from job_assistant.config import NUMPY_INDEX_DIR
+from job_assistant.rag.vector_store import VectorStore
+
+
+def _normalize(vectors: Sequence[Sequence[float]]) -> np.ndarray:
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+class NumpyVectorStore(VectorStore):
+    """Vector store backed by a memory-mapped NumPy matrix."""
+
+    def __init__(self, collection_name: str):
+        self.matrix_path = NUMPY_INDEX_DIR / f"{collection_name}.npy"
+        self.sidecar_path = NUMPY_INDEX_DIR / f"{collection_name}.json"
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._matrix: np.ndarray | None = None
+        self._ids: list[str] = []
+        self._documents: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+
+    def _load(self) -> None:
+        """Map the matrix and read the sidecar on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self.matrix_path.exists() and self.sidecar_path.exists():
+                sidecar = json.loads(self.sidecar_path.read_text(encoding="utf-8"))
+                matrix = np.load(self.matrix_path, mmap_mode="r")
+                if matrix.shape[0] != len(sidecar["ids"]):
+                    raise ValueError(
+                        f"NumPy index is inconsistent: {matrix.shape[0]} vectors "
+                        f"but {len(sidecar['ids'])} IDs. Run with --reindex."
+                    )
+                self._matrix = matrix
+                self._ids = sidecar["ids"]
+                self._documents = sidecar["documents"]
+                self._metadatas = sidecar["metadatas"]
+            self._loaded = True
+
+    def _write(
+        self,
+        matrix: np.ndarray,
+        ids: list[str],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Persist the index atomically and re-map it."""
+        NUMPY_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_matrix = self.matrix_path.with_suffix(".tmp.npy")
+        tmp_sidecar = self.sidecar_path.with_suffix(".tmp.json")
+        np.save(tmp_matrix, np.ascontiguousarray(matrix, dtype=np.float32))
+        tmp_sidecar.write_text(
+            json.dumps({"ids": ids, "documents": documents, "metadatas": metadatas}),
+            encoding="utf-8",
+        )
+
+        # Drop the current mapping first: Windows cannot replace a mapped file
+        with self._lock:
+            self._matrix = None
+            self._loaded = False
+        os.replace(tmp_matrix, self.matrix_path)
+        os.replace(tmp_sidecar, self.sidecar_path)
+        self._load()
+
+    def count(self) -> int:
+        self._load()
+        return len(self._ids)
+
+    def ids(self) -> set[str]:
+        self._load()
+        return set(self._ids)
+
+    def add(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        self._load()
+        new = _normalize(embeddings)
+        matrix = new if self._matrix is None else np.vstack([self._matrix, new])
+        self._write(
+            matrix,
+            self._ids + list(ids),
+            self._documents + list(documents),
+            self._metadatas + list(metadatas),
+        )
+
+    def delete(self, ids: list[str]) -> None:
+        self._load()
+        if self._matrix is None:
+            return
+        drop = set(ids)
+        keep = [i for i, chunk_id in enumerate(self._ids) if chunk_id not in drop]
+        self._write(
+            self._matrix[keep],
+            [self._ids[i] for i in keep],
+            [self._documents[i] for i in keep],
+            [self._metadatas[i] for i in keep],
+        )
+
+    def rebuild(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        self._write(_normalize(embeddings), list(ids), list(documents), list(metadatas))
+
+    def get(self, ids: list[str]) -> list[dict]:
+        self._load()
+        positions = {chunk_id: i for i, chunk_id in enumerate(self._ids)}
+        return [
+            {
+                "id": chunk_id,
+                "text": self._documents[positions[chunk_id]],
+                "metadata": self._metadatas[positions[chunk_id]],
+            }
+            for chunk_id in ids
+            if chunk_id in positions
+        ]
+
+    def query(
+        self, embeddings: Sequence[Sequence[float]], k: int
+    ) -> list[list[dict]]:
+        self._load()
+        if self._matrix is None:
+            raise ValueError("NumPy index does not exist. Run with --reindex.")
+
+        queries = _normalize(embeddings)
+        k = min(k, len(self._ids))
+        if k == 0:
+            return [[] for _ in range(len(queries))]
+        scores = queries @ self._matrix.T
+
+        # argpartition finds the top k in O(n); only those k get sorted
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        results = []
+        for row, candidates in zip(scores, top):
+            ranked = candidates[np.argsort(-row[candidates])]
+            results.append([
+                {
+                    "id": self._ids[i],
+                    "text": self._documents[i],
+                    "metadata": self._metadatas[i],
+                    "distance": float(1.0 - row[i]),
+                }
+                for i in ranked
+            ])
+        return results
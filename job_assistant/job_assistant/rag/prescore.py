@@ -0,0 +1,148 @@
+"""Local skill pre-scoring against the knowledge base, without an LLM.
+
+Each required and preferred skill is retrieved against the indexed chunks
+(one embedding batch, sharing the retrieval cache with the skill matcher's
+queries) and classified as strong, partial or gap from the best cosine
+similarity, plus whether the skill's words appear verbatim in a retrieved
+chunk. The result is a complete ``MatchAnalysis`` in milliseconds: good
+enough for triage, or as a draft for the LLM matcher to review.
+"""
+
+from dataclasses import dataclass
+
+from job_assistant.config import settings
+from job_assistant.rag.bm25 import tokenize
+from job_assistant.rag.retriever import batch_retrieve
+from job_assistant.schemas.models import JobAnalysis, MatchAnalysis, SkillMatch
+
+# Weight of a required vs a preferred skill in the overall score
+_REQUIRED_WEIGHT = 2.0
+_PREFERRED_WEIGHT = 1.0
+_STRENGTH_VALUE = {"strong": 1.0, "partial": 0.5, "gap": 0.0}
+
+_MAX_EVIDENCE_CHARS = 200
+
+
+@dataclass
+class SkillScore:
+    """Local evidence for one skill."""
+
+    skill: str
+    required: bool
+    similarity: float  # Best cosine similarity of a retrieved chunk (0-1)
+    lexical: bool  # All of the skill's words appear in a retrieved chunk
+    strength: str  # "strong", "partial" or "gap"
+    evidence: str
+    source: str
+
+
+def skill_query(skill: str) -> str:
+    """Retrieval query for a skill (the same wording the LLM matcher uses)."""
+    return f"experience with {skill}"
+
+
+def _classify(similarity: float, lexical: bool) -> str:
+    if similarity >= settings.prescore_strong_similarity or (
+        lexical and similarity >= settings.prescore_partial_similarity
+    ):
+        return "strong"
+    if lexical or similarity >= settings.prescore_partial_similarity:
+        return "partial"
+    return "gap"
+
+
+def _evidence_line(text: str, terms: set[str]) -> str:
+    """The chunk line sharing most words with the skill, headings skipped."""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    body = [line for line in lines if not line.startswith("#")] or lines
+    best = max(body, key=lambda line: len(terms & set(tokenize(line))), default="")
+    best = best.lstrip("-*• ").strip()
+    if len(best) > _MAX_EVIDENCE_CHARS:
+        best = best[: _MAX_EVIDENCE_CHARS - 3].rstrip() + "..."
+    return best
+
+
+def _score(skill: str, required: bool, results: list[dict]) -> SkillScore:
+    terms = set(tokenize(skill))
+    similarity, closest, mention = 0.0, None, None
+    for r in results:
+        if r.get("distance") is not None and 1.0 - r["distance"] > similarity:
+            similarity, closest = 1.0 - r["distance"], r
+        if mention is None and terms and terms <= set(tokenize(r["text"])):
+            mention = r
+
+    # A verbatim mention is the most convincing evidence
+    chunk = mention or closest
+    # No chunk to cite is a gap, whatever the thresholds
+    strength = _classify(similarity, mention is not None) if chunk else "gap"
+    if strength == "gap":
+        evidence, source = "No close match in the knowledge base", ""
+    else:
+        evidence = _evidence_line(chunk["text"], terms)
+        source = chunk.get("metadata", {}).get("source", "")
+    return SkillScore(
+        skill=skill,
+        required=required,
+        similarity=similarity,
+        lexical=mention is not None,
+        strength=strength,
+        evidence=evidence,
+        source=source,
+    )
+
+
+def prescore_skills(analysis: JobAnalysis) -> list[SkillScore]:
+    """Score every required and preferred skill against the knowledge base."""
+    skills: dict[str, tuple[str, bool]] = {}
+    for skill in analysis.required_skills:
+        skills.setdefault(skill.casefold().strip(), (skill.strip(), True))
+    for skill in analysis.preferred_skills:
+        skills.setdefault(skill.casefold().strip(), (skill.strip(), False))
+    if not skills:
+        return []
+
+    names = list(skills.values())
+    results = batch_retrieve([skill_query(skill) for skill, _ in names])
+    return [
+        _score(skill, required, per_skill)
+        for (skill, required), per_skill in zip(names, results)
+    ]
+
+
+def overall_score(scores: list[SkillScore]) -> int:
+    """Weighted share of skills matched, 0-100 (required skills count double)."""
+    if not scores:
+        return 0
+    weights = [_REQUIRED_WEIGHT if s.required else _PREFERRED_WEIGHT for s in scores]
+    earned = sum(w * _STRENGTH_VALUE[s.strength] for w, s in zip(weights, scores))
+    return round(100 * earned / sum(weights))
+
+
+def draft_match_analysis(scores: list[SkillScore]) -> MatchAnalysis:
+    """Build a ``MatchAnalysis`` from local skill scores alone."""
+    by_strength: dict[str, list[SkillMatch]] = {"strong": [], "partial": [], "gap": []}
+    for s in scores:
+        evidence = f"{s.evidence} ({s.source})" if s.source else s.evidence
+        by_strength[s.strength].append(
+            SkillMatch(skill=s.skill, evidence=evidence, strength=s.strength)
+        )
+
+    strongest = sorted(
+        (s for s in scores if s.strength == "strong"),
+        key=lambda s: (s.required, s.similarity),
+        reverse=True,
+    )
+    counts = {k: len(v) for k, v in by_strength.items()}
+    return MatchAnalysis(
+        overall_score=overall_score(scores),
+        strong_matches=by_strength["strong"],
+        partial_matches=by_strength["partial"],
+        gaps=by_strength["gap"],
+        transferable_skills=[m.skill for m in by_strength["partial"]],
+        unique_selling_points=[f"Direct experience with {s.skill}" for s in strongest[:3]],
+        match_summary=(
+            f"Local pre-score from knowledge base similarity: {counts['strong']} strong, "
+            f"{counts['partial']} partial and {counts['gap']} gap(s) across "
+            f"{len(scores)} skills. Not reviewed by the LLM."
+        ),
+    )
@@ -1,125 +1,438 @@
-"""ChromaDB persistent retriever for the knowledge base."""
+"""Knowledge base retriever over a pluggable vector store."""
 
 from __future__ import annotations
 
-import chromadb
+import hashlib
+import json
+import threading
 
-from job_assistant.config import CHROMA_DB_DIR, settings
-from job_assistant.rag.embeddings import get_embedding_function
-from job_assistant.rag.knowledge_base import load_knowledge_base
+from job_assistant.config import RETRIEVAL_CACHE_PATH, settings
+from job_assistant.rag.bm25 import BM25Index
+from job_assistant.rag.embeddings import (
+    CachedEmbeddingFunction,
+    get_embedding_function,
+    normalize_query,
+)
+from job_assistant.rag.knowledge_base import fingerprint_files, load_knowledge_base
+from job_assistant.rag.manifest import (
+    build_manifest,
+    index_version,
+    is_index_current,
+    is_same_index,
+    load_manifest,
+    manifest_mtime,
+    save_manifest,
+)
+from job_assistant.rag.vector_store import VectorStore, get_vector_store
+from job_assistant.utils.cache import SQLiteCache
+from job_assistant.utils.locks import ReadWriteLock
 from job_assistant.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-_client: chromadb.PersistentClient | None = None
-_embedding_fn = None
+RETRIEVAL_MODES = ("vector", "hybrid")
 
+# In hybrid mode each ranking contributes this many times top_k candidates
+_HYBRID_POOL_FACTOR = 4
 
-def _get_client() -> chromadb.PersistentClient:
-    global _client
-    if _client is None:
-        CHROMA_DB_DIR.mkdir(parents=True, exist_ok=True)
-        _client = chromadb.PersistentClient(path=str(CHROMA_DB_DIR))
-    return _client
 
+def _reciprocal_rank_fusion(
+    vector_results: list[dict], lexical_hits: list[tuple[str, float]], k: int
+) -> list[tuple[str, float]]:
+    """Fuse a vector and a lexical ranking into the top ``k`` (id, score) pairs."""
+    scores: dict[str, float] = {}
+    for rank, r in enumerate(vector_results):
+        scores[r["id"]] = scores.get(r["id"], 0.0) + 1 / (settings.rrf_k + rank + 1)
+    for rank, (chunk_id, _) in enumerate(lexical_hits):
+        scores[chunk_id] = scores.get(chunk_id, 0.0) + 1 / (settings.rrf_k + rank + 1)
+    return sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
 
-def _get_embedding_fn():
-    global _embedding_fn
-    if _embedding_fn is None:
-        _embedding_fn = get_embedding_function()
-    return _embedding_fn
 
+class KnowledgeBaseRetriever:
+    """Thread-safe retriever over the knowledge base vector store.
 
-def index_knowledge_base(force: bool = False) -> int:
-    """Index all knowledge base chunks into ChromaDB.
-
-    Args:
-        force: If True, delete existing collection and re-index.
+    The vector store and embedding function are created on first use and
+    reused for every later query. Chunks and queries are embedded here rather
+    than by the store, so opening the store never loads the embedding model.
+    Query embeddings go through a persistent cache, so repeated queries do
+    not load the model at all. Whole query results are cached too, keyed by
+    the knowledge base version, so a repeated query (such as the writer's
+    and advisor's fixed profile queries) does no embedding or store work
+    until the knowledge base is re-indexed. A BM25 index is maintained next
+    to the vector store for hybrid retrieval.
 
-    Returns:
-        Number of chunks indexed.
+    Queries hold the read lock. Re-indexing embeds chunks before taking the
+    write lock and holds it only while the store is rebuilt or patched, so
+    in-flight queries never fail or see a half-built index.
     """
-    client = _get_client()
-    ef = _get_embedding_fn()
-
-    # Check if collection exists and has data
-    try:
-        collection = client.get_collection(
-            name=settings.chroma_collection,
-            embedding_function=ef,
+
+    def __init__(self):
+        self._setup_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        self._rw_lock = ReadWriteLock()
+        self._store: VectorStore | None = None
+        self._lexical: BM25Index | None = None
+        self._embedding_fn = None
+        self._query_embedding_fn = CachedEmbeddingFunction(lambda: self.embedding_fn)
+        self._kb_version: str | None = None
+        self._manifest_mtime: int | None = None
+        self._version_read = False
+        self._result_cache = SQLiteCache(
+            RETRIEVAL_CACHE_PATH, "query_results", settings.retrieval_cache_size
         )
-        if collection.count() > 0 and not force:
-            logger.info(
-                f"Collection '{settings.chroma_collection}' already has "
-                f"{collection.count()} documents. Use --reindex to force."
+
+    @property
+    def store(self) -> VectorStore:
+        if self._store is None:
+            with self._setup_lock:
+                if self._store is None:
+                    self._store = get_vector_store()
+        return self._store
+
+    @property
+    def lexical(self) -> BM25Index:
+        """The BM25 index, loaded from disk or built from the files if missing."""
+        if self._lexical is None:
+            with self._setup_lock:
+                if self._lexical is None:
+                    lexical = BM25Index.load()
+                    if lexical is None:
+                        lexical = BM25Index()
+                        lexical.add(load_knowledge_base())
+                        lexical.save()
+                    self._lexical = lexical
+        return self._lexical
+
+    @property
+    def embedding_fn(self):
+        if self._embedding_fn is None:
+            with self._setup_lock:
+                if self._embedding_fn is None:
+                    self._embedding_fn = get_embedding_function()
+        return self._embedding_fn
+
+    @property
+    def kb_version(self) -> str | None:
+        """Version of the indexed knowledge base (None if never indexed).
+
+        Re-read whenever the manifest file changes, so a re-index by another
+        process (``run.py --reindex`` while Streamlit is running) is picked
+        up: the store and BM25 index are reopened and cached results are
+        keyed on the new version.
+        """
+        mtime = manifest_mtime()
+        if not self._version_read or mtime != self._manifest_mtime:
+            version = index_version(load_manifest())
+            if self._version_read and version != self._kb_version:
+                logger.info("Knowledge base re-indexed elsewhere; reloading the index")
+                with self._rw_lock.write():
+                    self._store = None
+                    self._lexical = None
+            self._kb_version, self._manifest_mtime = version, mtime
+            self._version_read = True
+        return self._kb_version
+
+    def _record_version(self, manifest: dict) -> None:
+        """Note the version of a manifest this process just wrote or checked."""
+        self._kb_version = index_version(manifest)
+        self._manifest_mtime = manifest_mtime()
+        self._version_read = True
+
+    def index(self, force: bool = False) -> int:
+        """Index all knowledge base chunks into the vector store.
+
+        When the manifest's file hashes match the knowledge base directory
+        the index is known to be current and neither the embedding model nor
+        the vector store is loaded. Otherwise chunk IDs are content hashes,
+        so only the chunks that were added or changed are embedded and the
+        ones that are gone are deleted. The store is rebuilt from scratch only
+        when it is empty or the backend or embedding model changed. Cached
+        query results are dropped whenever the indexed content changes.
+
+        Args:
+            force: If True, skip the manifest check and sync the store with
+                the knowledge base files.
+
+        Returns:
+            Number of chunks indexed.
+        """
+        with self._index_lock:
+            manifest = load_manifest()
+            files = fingerprint_files(manifest.get("files") if manifest else None)
+
+            if not force and is_index_current(manifest, files):
+                if files != manifest["files"]:
+                    # Same content, new mtimes: record them to keep the check stat-only
+                    save_manifest({**manifest, "files": files})
+                count = len(manifest["chunks"])
+                self._record_version(manifest)
+                logger.info(
+                    f"Knowledge base unchanged: {count} chunks already indexed. "
+                    f"Use --reindex to force."
+                )
+                return count
+
+            # Content-hash IDs make identical chunks collapse to one entry
+            chunks = list({c["id"]: c for c in load_knowledge_base()}.values())
+            if not chunks:
+                logger.warning("No chunks to index.")
+                return 0
+
+            with self._rw_lock.read():
+                count = self.store.count()
+
+            if count == 0 or not is_same_index(manifest):
+                self._rebuild(chunks)
+            else:
+                self._sync(chunks)
+
+            new_manifest = build_manifest(chunks, files)
+            save_manifest(new_manifest)
+
+            if index_version(new_manifest) != index_version(manifest):
+                self._result_cache.clear()
+            self._record_version(new_manifest)
+            return len(chunks)
+
+    def _rebuild(self, chunks: list[dict]) -> None:
+        """Embed every chunk and replace the store's contents."""
+        # Queries keep using the current index while the chunks are embedded
+        embeddings = self.embedding_fn([c["text"] for c in chunks])
+
+        lexical = BM25Index()
+        lexical.add(chunks)
+
+        with self._rw_lock.write():
+            self.store.rebuild(
+                ids=[c["id"] for c in chunks],
+                embeddings=embeddings,
+                documents=[c["text"] for c in chunks],
+                metadatas=[c["metadata"] for c in chunks],
             )
-            return collection.count()
-        # Force re-index: delete and recreate
-        client.delete_collection(settings.chroma_collection)
-    except Exception:
-        pass  # Collection doesn't exist yet
+            lexical.save()
+            self._lexical = lexical
 
-    collection = client.get_or_create_collection(
-        name=settings.chroma_collection,
-        embedding_function=ef,
-    )
+        logger.info(f"Indexed {len(chunks)} chunks into the {settings.vector_backend} store.")
 
-    chunks = load_knowledge_base()
-    if not chunks:
-        logger.warning("No chunks to index.")
-        return 0
+    def _sync(self, chunks: list[dict]) -> None:
+        """Embed only added/changed chunks and delete removed ones."""
+        with self._rw_lock.read():
+            existing = self.store.ids()
+        wanted = {c["id"] for c in chunks}
+        added = [c for c in chunks if c["id"] not in existing]
+        removed = [chunk_id for chunk_id in existing if chunk_id not in wanted]
 
-    ids = [f"chunk_{i}" for i in range(len(chunks))]
-    documents = [c["text"] for c in chunks]
-    metadatas = [c["metadata"] for c in chunks]
+        if not added and not removed:
+            logger.info(f"Knowledge base unchanged ({len(chunks)} chunks).")
+            return
 
-    collection.add(ids=ids, documents=documents, metadatas=metadatas)
-    logger.info(f"Indexed {len(chunks)} chunks into ChromaDB.")
-    return len(chunks)
+        # Embed outside the write lock so queries are only blocked for the patch
+        embeddings = self.embedding_fn([c["text"] for c in added]) if added else None
 
+        with self._rw_lock.write():
+            if added:
+                self.store.add(
+                    ids=[c["id"] for c in added],
+                    embeddings=embeddings,
+                    documents=[c["text"] for c in added],
+                    metadatas=[c["metadata"] for c in added],
+                )
+            if removed:
+                self.store.delete(removed)
+            self.lexical.remove(removed)
+            self.lexical.add(added)
+            self.lexical.save()
 
-def retrieve(query: str, top_k: int | None = None) -> list[dict]:
-    """Retrieve relevant chunks for a single query.
+        logger.info(
+            f"Re-indexed knowledge base: {len(added)} chunks embedded, "
+            f"{len(removed)} removed."
+        )
+
+    def _query(
+        self, queries: list[str], k: int, mode: str | None = None
+    ) -> list[list[dict]]:
+        """Answer queries from the result cache, searching only the misses.
+
+        In hybrid mode the vector and BM25 rankings of each query are fused
+        with reciprocal rank fusion; results then also carry a ``score``
+        (higher = more relevant) and ``distance`` is None for chunks that
+        only the lexical side found.
+        """
+        mode = mode or settings.retrieval_mode
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(
+                f"Unknown retrieval mode '{mode}'. "
+                f"Expected one of: {', '.join(RETRIEVAL_MODES)}"
+            )
+
+        version = self.kb_version
+        if version is None or not self._result_cache.enabled:
+            return self._search(queries, k, mode)
+
+        keys = [self._result_key(version, q, k, mode) for q in queries]
+        cached = {
+            key: json.loads(value)
+            for key, value in self._result_cache.get_many(keys).items()
+        }
+
+        # Search each distinct miss once, in a single batch
+        misses = {key: q for key, q in zip(keys, queries) if key not in cached}
+        if misses:
+            computed = dict(zip(misses, self._search(list(misses.values()), k, mode)))
+            self._result_cache.set_many(
+                {key: json.dumps(r).encode("utf-8") for key, r in computed.items()}
+            )
+            cached.update(computed)
 
-    Returns list of dicts with keys: text, metadata, distance.
+        logger.debug(
+            f"Retrieval results: {len(queries) - len(misses)} cached, "
+            f"{len(misses)} searched"
+        )
+        return [cached[key] for key in keys]
+
+    @staticmethod
+    def _result_key(version: str, query: str, k: int, mode: str) -> str:
+        raw = f"{version}\0{mode}\0{k}\0{settings.rrf_k}\0{normalize_query(query)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _search(self, queries: list[str], k: int, mode: str) -> list[list[dict]]:
+        """Embed all queries in one batch and run one store query."""
+        embeddings = self._query_embedding_fn(queries)
+        with self._rw_lock.read():
+            if mode == "vector":
+                return self.store.query(embeddings, k)
+
+            pool = k * _HYBRID_POOL_FACTOR
+            vector_results = self.store.query(embeddings, pool)
+            fused = [
+                _reciprocal_rank_fusion(v, self.lexical.search(q, pool), k)
+                for q, v in zip(queries, vector_results)
+            ]
+
+            found = {r["id"]: r for results in vector_results for r in results}
+            lexical_only = {cid for f in fused for cid, _ in f if cid not in found}
+            if lexical_only:
+                for r in self.store.get(list(lexical_only)):
+                    found[r["id"]] = {**r, "distance": None}
+
+        return [
+            [{**found[cid], "score": score} for cid, score in f if cid in found]
+            for f in fused
+        ]
+
+    def retrieve(
+        self, query: str, top_k: int | None = None, mode: str | None = None
+    ) -> list[dict]:
+        """Retrieve relevant chunks for a single query.
+
+        Args:
+            mode: "vector" or "hybrid"; defaults to ``settings.retrieval_mode``.
+
+        Returns list of dicts with keys: id, text, metadata, distance (plus
+        score in hybrid mode), most relevant first.
+        """
+        return self._query([query], top_k or settings.rag_top_k, mode)[0]
+
+    def batch_retrieve(
+        self, queries: list[str], top_k: int | None = None, mode: str | None = None
+    ) -> list[list[dict]]:
+        """Retrieve relevant chunks for each query, embedded in one batch.
+
+        Unlike ``multi_query_retrieve`` the results are kept per query: one
+        list (most relevant first) for each query, in order.
+        """
+        if not queries:
+            return []
+        return self._query(list(queries), top_k or settings.rag_top_k, mode)
+
+    def multi_query_retrieve(
+        self, queries: list[str], top_k: int | None = None, mode: str | None = None
+    ) -> list[dict]:
+        """Retrieve relevant chunks for multiple queries, deduplicated.
+
+        All queries are embedded in a single batch and sent to the vector
+        store in one query.
+        Returns deduplicated list of chunks, most relevant first: by best
+        (lowest) distance in vector mode, by best fused score in hybrid mode.
+        """
+        if not queries:
+            return []
+
+        mode = mode or settings.retrieval_mode
+        results = self._query(list(queries), top_k or settings.rag_top_k, mode)
+
+        if mode == "hybrid":
+            best: dict[str, dict] = {}
+            for r in (r for per_query in results for r in per_query):
+                if r["text"] not in best or r["score"] > best[r["text"]]["score"]:
+                    best[r["text"]] = r
+            return sorted(best.values(), key=lambda x: x["score"], reverse=True)
+
+        seen_texts: set[str] = set()
+        all_results: list[dict] = []
+
+        for per_query in results:
+            for r in per_query:
+                if r["text"] not in seen_texts:
+                    seen_texts.add(r["text"])
+                    all_results.append(r)
+
+        # Sort by distance (lower = more relevant)
+        all_results.sort(key=lambda x: x["distance"])
+        return all_results
+
+
+_retriever: KnowledgeBaseRetriever | None = None
+_retriever_lock = threading.Lock()
+
+
+def get_retriever() -> KnowledgeBaseRetriever:
+    """Return the process-wide retriever, creating it on first use."""
+    global _retriever
+    if _retriever is None:
+        with _retriever_lock:
+            if _retriever is None:
+                _retriever = KnowledgeBaseRetriever()
+    return _retriever
+
+
+def index_knowledge_base(force: bool = False) -> int:
+    """Index all knowledge base chunks into the vector store.
+
+    Args:
+        force: If True, skip the manifest check and sync the store with the
+            knowledge base files. Only changed chunks are re-embedded.
+
+    Returns:
+        Number of chunks indexed.
     """
-    k = top_k or settings.rag_top_k
-    client = _get_client()
-    ef = _get_embedding_fn()
+    return get_retriever().index(force=force)
 
-    collection = client.get_collection(
-        name=settings.chroma_collection,
-        embedding_function=ef,
-    )
 
-    results = collection.query(query_texts=[query], n_results=k)
+def retrieve(
+    query: str, top_k: int | None = None, mode: str | None = None
+) -> list[dict]:
+    """Retrieve relevant chunks for a single query.
+
+    Returns list of dicts with keys: id, text, metadata, distance (plus score
+    in hybrid mode), most relevant first.
+    """
+    return get_retriever().retrieve(query, top_k=top_k, mode=mode)
+
 
-    retrieved = []
-    for i in range(len(results["ids"][0])):
-        retrieved.append({
-            "text": results["documents"][0][i],
-            "metadata": results["metadatas"][0][i],
-            "distance": results["distances"][0][i],
-        })
-    return retrieved
+def batch_retrieve(
+    queries: list[str], top_k: int | None = None, mode: str | None = None
+) -> list[list[dict]]:
+    """Retrieve relevant chunks for each query; one result list per query."""
+    return get_retriever().batch_retrieve(queries, top_k=top_k, mode=mode)
 
 
-def multi_query_retrieve(queries: list[str], top_k: int | None = None) -> list[dict]:
+def multi_query_retrieve(
+    queries: list[str], top_k: int | None = None, mode: str | None = None
+) -> list[dict]:
     """Retrieve relevant chunks for multiple queries, deduplicated.
 
     Builds one query per job requirement for comprehensive RAG coverage.
-    Returns deduplicated list of chunks sorted by best (lowest) distance.
+    Returns deduplicated list of chunks, most relevant first.
     """
-    seen_texts: set[str] = set()
-    all_results: list[dict] = []
-
-    for query in queries:
-        results = retrieve(query, top_k=top_k)
-        for r in results:
-            if r["text"] not in seen_texts:
-                seen_texts.add(r["text"])
-                all_results.append(r)
-
-    # Sort by distance (lower = more relevant)
-    all_results.sort(key=lambda x: x["distance"])
-    return all_results
+    return get_retriever().multi_query_retrieve(queries, top_k=top_k, mode=mode)
@@ -0,0 +1,95 @@
+"""Vector store interface and backend selection."""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Sequence
+
+from job_assistant.config import CHROMA_DB_DIR, NUMPY_INDEX_DIR, settings
+
+VECTOR_BACKENDS = ("chroma", "numpy")
+
+
+class VectorStore(ABC):
+    """Abstract store of pre-computed chunk embeddings.
+
+    Stores never embed text themselves; the retriever passes embeddings in.
+    Stores are not thread-safe for writes: the retriever serializes access
+    with its read/write lock.
+    """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Number of stored chunks (0 if the store does not exist yet)."""
+        ...
+
+    @abstractmethod
+    def ids(self) -> set[str]:
+        """IDs of every stored chunk."""
+        ...
+
+    @abstractmethod
+    def add(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add chunks to the store."""
+        ...
+
+    @abstractmethod
+    def delete(self, ids: list[str]) -> None:
+        """Delete chunks by ID."""
+        ...
+
+    @abstractmethod
+    def rebuild(
+        self,
+        ids: list[str],
+        embeddings: Sequence[Sequence[float]],
+        documents: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Replace the entire contents of the store."""
+        ...
+
+    @abstractmethod
+    def get(self, ids: list[str]) -> list[dict]:
+        """Fetch stored chunks by ID as dicts with keys: id, text, metadata.
+
+        Unknown IDs are skipped.
+        """
+        ...
+
+    @abstractmethod
+    def query(
+        self, embeddings: Sequence[Sequence[float]], k: int
+    ) -> list[list[dict]]:
+        """Return the ``k`` nearest chunks for each query embedding.
+
+        Each result is a dict with keys: id, text, metadata, distance
+        (cosine distance, lower = more relevant), ordered nearest first.
+        """
+        ...
+
+
+def vector_store_dir() -> Path:
+    """Directory holding the configured backend's data on disk."""
+    return NUMPY_INDEX_DIR if settings.vector_backend == "numpy" else CHROMA_DB_DIR
+
+
+def get_vector_store() -> VectorStore:
+    """Create the vector store selected by ``settings.vector_backend``."""
+    if settings.vector_backend == "chroma":
+        from job_assistant.rag.chroma_store import ChromaVectorStore
+
+        return ChromaVectorStore(settings.chroma_collection)
+    if settings.vector_backend == "numpy":
+        from job_assistant.rag.numpy_store import NumpyVectorStore
+
+        return NumpyVectorStore(settings.chroma_collection)
+    raise ValueError(
+        f"Unknown vector backend '{settings.vector_backend}'. "
+        f"Expected one of: {', '.join(VECTOR_BACKENDS)}"
+    )
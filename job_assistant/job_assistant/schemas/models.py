@@ -107,3 +107,18 @@ class AdvisorOutput(BaseModel):
     confidence_level: str = Field(
         description="Overall confidence: High / Medium / Low"
     )
+
+
+# --- Fused Writer + Advisor Output ---
+
+# Flat schema; base order puts the writer fields (and the cover letter) first
+class ApplicationPackage(AdvisorOutput, WriterOutput):
+    """Application materials and strategic advice, generated in one call."""
+
+    def split(self) -> tuple[WriterOutput, AdvisorOutput]:
+        """Split into the separate writer and advisor outputs."""
+        data = self.model_dump()
+        return (
+            WriterOutput.model_validate({k: data[k] for k in WriterOutput.model_fields}),
+            AdvisorOutput.model_validate({k: data[k] for k in AdvisorOutput.model_fields}),
+        )
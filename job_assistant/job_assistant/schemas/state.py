@@ -1,6 +1,7 @@
 """LangGraph application state definition."""
 
-from typing import TypedDict
+import operator
+from typing import Annotated, TypedDict
 
 from job_assistant.schemas.models import (
     AdvisorOutput,
@@ -10,6 +11,11 @@ from job_assistant.schemas.models import (
 )
 
 
+def merge_errors(left: str | None, right: str | None) -> str:
+    """Reducer for ``error``: keep both messages when parallel nodes fail."""
+    return "; ".join(e for e in (left, right) if e)
+
+
 class ApplicationState(TypedDict, total=False):
     """State passed through the LangGraph pipeline.
 
@@ -19,6 +25,8 @@ class ApplicationState(TypedDict, total=False):
     # Input
     job_url: str
     job_text: str
+    # Preprocessing summary (chars/tokens before and after, lines removed)
+    job_text_stats: dict
 
     # Pipeline outputs
     job_analysis: JobAnalysis
@@ -27,8 +35,12 @@ class ApplicationState(TypedDict, total=False):
     advisor_output: AdvisorOutput
 
     # Error handling
-    error: str
+    error: Annotated[str, merge_errors]
 
     # Metadata
+    status: str  # Stored application status, see storage.database
     output_path: str
     db_id: int
+
+    # Per-agent call metrics (dicts from utils.metrics), appended by each node
+    metrics: Annotated[list[dict], operator.add]
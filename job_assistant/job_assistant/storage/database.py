@@ -15,6 +15,11 @@ from job_assistant.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Application statuses set by the pipeline (users may set others)
+STATUS_GENERATED = "generated"
+STATUS_SKIPPED_LOW_MATCH = "skipped-low-match"
+STATUS_FAILED = "failed"  # The run ended with an error; content may be missing
+
 CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS applications (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -39,55 +44,98 @@ CREATE TABLE IF NOT EXISTS applications (
 )
 """
 
+CREATE_METRICS_TABLE = """
+CREATE TABLE IF NOT EXISTS agent_metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INTEGER NOT NULL REFERENCES applications(id),
+    created_at TEXT NOT NULL,
+    agent TEXT NOT NULL,
+    model TEXT,
+    wall_ms REAL,
+    retrieval_ms REAL,
+    prompt_tokens INTEGER,
+    completion_tokens INTEGER,
+    cost_usd REAL,
+    retries INTEGER,
+    cached INTEGER,
+    started_at REAL,
+    escalated INTEGER DEFAULT 0
+)
+"""
+
 
 def _get_connection() -> sqlite3.Connection:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(str(DB_PATH))
     conn.row_factory = sqlite3.Row
     conn.execute(CREATE_TABLE)
+    conn.execute(CREATE_METRICS_TABLE)
     conn.commit()
     return conn
 
 
+_APPLICATION_COLUMNS = (
+    "created_at", "job_url", "job_title", "company", "location", "industry",
+    "seniority", "match_score", "recommendation", "confidence",
+    "cover_letter", "application_email",
+    "job_analysis_json", "match_analysis_json",
+    "writer_output_json", "advisor_output_json", "status",
+)
+
+
 def save_application(
     job_url: str | None,
     job_analysis: JobAnalysis | None,
     match_analysis: MatchAnalysis | None,
     writer_output: WriterOutput | None,
     advisor_output: AdvisorOutput | None,
+    status: str = STATUS_GENERATED,
+    row_id: int | None = None,
 ) -> int:
     """Save a complete application analysis to the database.
 
-    Returns the inserted row ID.
+    Pass ``row_id`` to overwrite that row (e.g. a failed earlier attempt at
+    the same posting) instead of inserting a new one.
+
+    Returns the row ID.
     """
+    values = (
+        datetime.now().isoformat(),
+        job_url,
+        job_analysis.title if job_analysis else None,
+        job_analysis.company if job_analysis else None,
+        job_analysis.location if job_analysis else None,
+        job_analysis.industry if job_analysis else None,
+        job_analysis.seniority if job_analysis else None,
+        match_analysis.overall_score if match_analysis else None,
+        advisor_output.overall_recommendation if advisor_output else None,
+        advisor_output.confidence_level if advisor_output else None,
+        writer_output.cover_letter if writer_output else None,
+        writer_output.application_email if writer_output else None,
+        job_analysis.model_dump_json() if job_analysis else None,
+        match_analysis.model_dump_json() if match_analysis else None,
+        writer_output.model_dump_json() if writer_output else None,
+        advisor_output.model_dump_json() if advisor_output else None,
+        status,
+    )
     conn = _get_connection()
     try:
+        if row_id is not None:
+            assignments = ", ".join(f"{column} = ?" for column in _APPLICATION_COLUMNS)
+            cursor = conn.execute(
+                f"UPDATE applications SET {assignments} WHERE id = ?", (*values, row_id)
+            )
+            if cursor.rowcount:
+                conn.commit()
+                logger.info(f"Updated application #{row_id} in database")
+                return row_id
+            logger.warning(f"Application #{row_id} no longer exists; inserting a new row")
+
+        placeholders = ", ".join("?" for _ in _APPLICATION_COLUMNS)
         cursor = conn.execute(
-            """INSERT INTO applications (
-                created_at, job_url, job_title, company, location, industry,
-                seniority, match_score, recommendation, confidence,
-                cover_letter, application_email,
-                job_analysis_json, match_analysis_json,
-                writer_output_json, advisor_output_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                datetime.now().isoformat(),
-                job_url,
-                job_analysis.title if job_analysis else None,
-                job_analysis.company if job_analysis else None,
-                job_analysis.location if job_analysis else None,
-                job_analysis.industry if job_analysis else None,
-                job_analysis.seniority if job_analysis else None,
-                match_analysis.overall_score if match_analysis else None,
-                advisor_output.overall_recommendation if advisor_output else None,
-                advisor_output.confidence_level if advisor_output else None,
-                writer_output.cover_letter if writer_output else None,
-                writer_output.application_email if writer_output else None,
-                job_analysis.model_dump_json() if job_analysis else None,
-                match_analysis.model_dump_json() if match_analysis else None,
-                writer_output.model_dump_json() if writer_output else None,
-                advisor_output.model_dump_json() if advisor_output else None,
-            ),
+            f"INSERT INTO applications ({', '.join(_APPLICATION_COLUMNS)}) "
+            f"VALUES ({placeholders})",
+            values,
         )
         conn.commit()
         row_id = cursor.lastrowid
@@ -110,6 +158,65 @@ def update_status(row_id: int, status: str, notes: str | None = None) -> None:
         conn.close()
 
 
+def get_application(row_id: int) -> dict | None:
+    """Load a stored application with its analyses parsed back into models.
+
+    Returns None if there is no such row. The ``job_analysis``,
+    ``match_analysis``, ``writer_output`` and ``advisor_output`` keys hold
+    the models (or None).
+    """
+    conn = _get_connection()
+    try:
+        row = conn.execute("SELECT * FROM applications WHERE id = ?", (row_id,)).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        return None
+
+    application = dict(row)
+    for key, model in (
+        ("job_analysis", JobAnalysis),
+        ("match_analysis", MatchAnalysis),
+        ("writer_output", WriterOutput),
+        ("advisor_output", AdvisorOutput),
+    ):
+        raw = application.pop(f"{key}_json")
+        application[key] = model.model_validate_json(raw) if raw else None
+    return application
+
+
+def save_generated_content(
+    row_id: int,
+    writer_output: WriterOutput | None,
+    advisor_output: AdvisorOutput | None,
+    status: str = STATUS_GENERATED,
+) -> None:
+    """Store application materials generated later for an existing row."""
+    conn = _get_connection()
+    try:
+        conn.execute(
+            """UPDATE applications SET
+                recommendation = ?, confidence = ?, cover_letter = ?,
+                application_email = ?, writer_output_json = ?,
+                advisor_output_json = ?, status = ?
+               WHERE id = ?""",
+            (
+                advisor_output.overall_recommendation if advisor_output else None,
+                advisor_output.confidence_level if advisor_output else None,
+                writer_output.cover_letter if writer_output else None,
+                writer_output.application_email if writer_output else None,
+                writer_output.model_dump_json() if writer_output else None,
+                advisor_output.model_dump_json() if advisor_output else None,
+                status,
+                row_id,
+            ),
+        )
+        conn.commit()
+        logger.info(f"Saved generated content for application #{row_id}")
+    finally:
+        conn.close()
+
+
 def list_applications() -> list[dict]:
     """List all applications with summary info."""
     conn = _get_connection()
@@ -122,3 +229,55 @@ def list_applications() -> list[dict]:
         return [dict(r) for r in rows]
     finally:
         conn.close()
+
+
+def save_agent_metrics(application_id: int, metrics: list[dict]) -> None:
+    """Save per-agent call metrics (see utils.metrics) for an application."""
+    if not metrics:
+        return
+    now = datetime.now().isoformat()
+    conn = _get_connection()
+    try:
+        conn.executemany(
+            """INSERT INTO agent_metrics (
+                application_id, created_at, agent, model, wall_ms, retrieval_ms,
+                prompt_tokens, completion_tokens, cost_usd, retries, cached,
+                started_at, escalated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
+                (
+                    application_id,
+                    now,
+                    m["agent"],
+                    m["model"],
+                    m["wall_ms"],
+                    m["retrieval_ms"],
+                    m["prompt_tokens"],
+                    m["completion_tokens"],
+                    m["cost_usd"],
+                    m["retries"],
+                    int(m["cached"]),
+                    m.get("started_at"),
+                    int(m.get("escalated", False)),
+                )
+                for m in metrics
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def list_agent_metrics() -> list[dict]:
+    """List every recorded agent call, oldest first."""
+    conn = _get_connection()
+    try:
+        rows = conn.execute(
+            """SELECT application_id, created_at, agent, model, wall_ms,
+                      retrieval_ms, prompt_tokens, completion_tokens, cost_usd,
+                      retries, cached, started_at, escalated
+               FROM agent_metrics ORDER BY id"""
+        ).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
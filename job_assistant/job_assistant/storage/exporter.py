@@ -22,6 +22,7 @@ def export_analysis(
     writer_output: WriterOutput | None,
     advisor_output: AdvisorOutput | None,
     job_url: str | None = None,
+    status: str | None = None,
 ) -> Path:
     """Export a complete analysis to a timestamped JSON file.
 
@@ -42,6 +43,7 @@ def export_analysis(
     data = {
         "exported_at": datetime.now().isoformat(),
         "job_url": job_url,
+        "status": status,
         "job_analysis": job_analysis.model_dump() if job_analysis else None,
         "match_analysis": match_analysis.model_dump() if match_analysis else None,
         "writer_output": writer_output.model_dump() if writer_output else None,
@@ -0,0 +1,194 @@
+"""Size-bounded LRU key/value cache persisted in SQLite."""
+
+import atexit
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+# Deferred last-used times are written once this many have accumulated
+_TOUCH_FLUSH_SIZE = 64
+
+
+class SQLiteCache:
+    """LRU cache of bytes values in a SQLite table, shared across processes.
+
+    Recently used entries are also kept in an in-memory LRU of up to
+    ``memory_entries``, so repeated lookups in a process never touch SQLite.
+    Keys are expected to be content hashes: a value never changes under a
+    key, so the memory layer cannot go stale (``clear`` empties both).
+
+    Reads record the entry's last-used time in memory; those times are
+    written in batches (with the next write, every few dozen reads, or at
+    exit) rather than committed per read. Writes evict the least recently
+    used entries beyond ``max_entries`` and, if ``ttl_seconds`` is set,
+    entries older than that, which reads also ignore. One connection per
+    instance is kept open and used under a lock, so instances are safe to
+    use from any thread. Hits and misses are counted per instance.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        table: str,
+        max_entries: int,
+        ttl_seconds: float | None = None,
+        memory_entries: int = 256,
+    ):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = min(memory_entries, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # key -> (value, created), most recently used last
+        self._memory: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        # key -> last-used time not yet written to SQLite
+        self._touched: dict[str, float] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of looked-up keys found so far (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def _oldest_valid(self, now: float) -> float:
+        return now - self.ttl_seconds if self.ttl_seconds else 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        """The instance's connection, opened on first use. Hold ``_lock``."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute(
+                f"""CREATE TABLE IF NOT EXISTS {self.table} (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    created REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )"""
+            )
+            conn.commit()
+            self._conn = conn
+            atexit.register(self.close)
+        return self._conn
+
+    def _remember(self, key: str, value: bytes, created: float) -> None:
+        """Add an entry to the memory LRU. Hold ``_lock``."""
+        if self.memory_entries <= 0:
+            return
+        self._memory[key] = (value, created)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self, conn: sqlite3.Connection) -> None:
+        """Write deferred last-used times (without committing). Hold ``_lock``."""
+        if self._touched:
+            conn.executemany(
+                f"UPDATE {self.table} SET last_used = ? WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()],
+            )
+            self._touched.clear()
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        """Return the cached values for whichever of ``keys`` are present."""
+        unique_keys = list(dict.fromkeys(keys))
+        if not self.enabled or not unique_keys:
+            return {}
+
+        now = time.time()
+        oldest = self._oldest_valid(now)
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for key in unique_keys:
+                entry = self._memory.get(key)
+                if entry is not None and entry[1] >= oldest:
+                    found[key] = entry[0]
+                    self._memory.move_to_end(key)
+
+            missing = [key for key in unique_keys if key not in found]
+            if missing:
+                placeholders = ",".join("?" * len(missing))
+                rows = self._connection().execute(
+                    f"SELECT key, value, created FROM {self.table} "
+                    f"WHERE key IN ({placeholders}) AND created >= ?",
+                    [*missing, oldest],
+                ).fetchall()
+                for key, value, created in rows:
+                    found[key] = value
+                    self._remember(key, value, created)
+
+            for key in found:
+                self._touched[key] = now
+            if len(self._touched) >= _TOUCH_FLUSH_SIZE:
+                conn = self._connection()
+                self._flush_touched(conn)
+                conn.commit()
+
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+
+    def set_many(self, items: dict[str, bytes]) -> None:
+        """Insert or replace entries, then evict expired and excess ones."""
+        if not self.enabled or not items:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            self._flush_touched(conn)
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {self.table} "
+                f"(key, value, created, last_used) VALUES (?, ?, ?, ?)",
+                [(key, value, now, now) for key, value in items.items()],
+            )
+            if self.ttl_seconds:
+                conn.execute(
+                    f"DELETE FROM {self.table} WHERE created < ?",
+                    (self._oldest_valid(now),),
+                )
+            conn.execute(
+                f"""DELETE FROM {self.table} WHERE key IN (
+                       SELECT key FROM {self.table}
+                       ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                   )""",
+                (self.max_entries,),
+            )
+            conn.commit()
+            for key, value in items.items():
+                self._remember(key, value, now)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            if not self.path.exists():
+                return
+            conn = self._connection()
+            conn.execute(f"DELETE FROM {self.table}")
+            conn.commit()
+
+    def close(self) -> None:
+        """Write deferred last-used times and close the connection."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_touched(self._conn)
+                self._conn.commit()
+            except sqlite3.Error:
+                # Only eviction order is lost
+                pass
+            self._conn.close()
+            self._conn = None
@@ -1,6 +1,11 @@
 """Rich console output formatting for results display."""
 
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
@@ -12,6 +17,9 @@ from job_assistant.schemas.models import (
     WriterOutput,
 )
 
+if TYPE_CHECKING:
+    from job_assistant.orchestration.batch import BatchProgress
+
 console = Console()
 
 
@@ -93,12 +101,111 @@ def display_match_analysis(match: MatchAnalysis) -> None:
     console.print(Panel(match.match_summary, title="Match Summary", border_style="blue"))
 
 
-def display_writer_output(output: WriterOutput) -> None:
-    """Display generated application materials."""
+class CoverLetterStream:
+    """Live panel showing the cover letter while the writer generates it.
+
+    Rich allows one live display at a time, so callers pause any status
+    spinner before the first ``update`` and resume it after ``close``.
+    """
+
+    def __init__(self):
+        self._live: Live | None = None
+        self._text = ""
+        self.started = False
+
+    def update(self, text: str) -> None:
+        if self._live is None:
+            console.print()
+            self._live = Live(console=console, refresh_per_second=8, vertical_overflow="visible")
+            self._live.start()
+            self.started = True
+        self._text = text
+        self._live.update(
+            Panel(text, title="Cover Letter (writing...)", border_style="green")
+        )
+
+    def close(self) -> None:
+        if self._live is not None:
+            self._live.update(Panel(self._text, title="Cover Letter", border_style="green"))
+            self._live.stop()
+            self._live = None
+
+
+class BatchProgressTable:
+    """Live table of a batch: running items, recent results and totals."""
+
+    def __init__(self, total: int, skipped: int = 0, recent: int = 8):
+        self._total = total
+        self._skipped = skipped
+        self._recent = recent
+        self._running: dict[str, "BatchProgress"] = {}
+        self._finished: list["BatchProgress"] = []
+        self._start = time.perf_counter()
+        self._live = Live(self._render(), console=console, refresh_per_second=4)
+
+    def __enter__(self) -> "BatchProgressTable":
+        self._live.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._live.update(self._render())
+        self._live.stop()
+
+    def update(self, item: "BatchProgress") -> None:
+        if item.finished:
+            self._running.pop(item.item.item_id, None)
+            self._finished.append(item)
+        else:
+            self._running[item.item.item_id] = item
+        self._live.update(self._render())
+
+    def _render(self) -> Table:
+        elapsed = time.perf_counter() - self._start
+        done = len(self._finished)
+        counts = Counter(p.status for p in self._finished)
+        rate = done / elapsed * 60 if elapsed > 0 else 0.0
+
+        table = Table(
+            title=(
+                f"Batch: {self._skipped + done}/{self._total} done "
+                f"({self._skipped} from earlier runs)"
+            ),
+            caption=(
+                f"{counts['generated']} generated, {counts['skipped-low-match']} below "
+                f"match threshold, {counts['failed']} failed | {elapsed:.0f}s, "
+                f"{rate:.1f} postings/min"
+            ),
+        )
+        table.add_column("Posting", overflow="ellipsis", max_width=48, no_wrap=True)
+        table.add_column("Stage / status")
+        table.add_column("Score", justify="right")
+        table.add_column("Seconds", justify="right")
+
+        now = time.perf_counter()
+        for p in self._running.values():
+            table.add_row(p.item.item_id, f"[cyan]{p.status}[/cyan]", "", f"{now - p.started:.0f}")
+        for p in reversed(self._finished[-self._recent:]):
+            style = {"generated": "green", "failed": "red"}.get(p.status, "yellow")
+            label = f"{p.title} at {p.company}" if p.title else p.item.item_id
+            table.add_row(
+                label,
+                f"[{style}]{p.status}[/{style}]",
+                "" if p.match_score is None else str(p.match_score),
+                f"{p.seconds:.0f}",
+            )
+        return table
+
+
+def display_writer_output(output: WriterOutput, show_cover_letter: bool = True) -> None:
+    """Display generated application materials.
+
+    Pass ``show_cover_letter=False`` if it was already streamed to the console.
+    """
     console.print()
-    console.print(
-        Panel(output.cover_letter, title="Cover Letter", border_style="green")
-    )
+    if show_cover_letter:
+        console.print(
+            Panel(output.cover_letter, title="Cover Letter", border_style="green")
+        )
     console.print(
         Panel(output.application_email, title="Application Email", border_style="cyan")
     )
@@ -182,3 +289,46 @@ def display_saved(output_path: str, db_id: int) -> None:
     console.print(f"[green]Results saved:[/green]")
     console.print(f"  JSON: {output_path}")
     console.print(f"  Database ID: {db_id}")
+
+
+def display_agent_stats(summary: list[dict]) -> None:
+    """Display per-agent latency, token and cost percentiles."""
+    if not summary:
+        console.print("[yellow]No agent metrics recorded yet.[/yellow]")
+        return
+
+    table = Table(
+        title="Agent Performance (p50 / p95)",
+        caption=(
+            "Total: per pipeline run; its wall time is elapsed time, not summed agent "
+            "time. Escalated: fast tier answers redone on the agent's model / fast "
+            "tier calls"
+        ),
+    )
+    table.add_column("Stage", style="bold cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall ms", justify="right")
+    table.add_column("Retrieval ms", justify="right")
+    table.add_column("Tokens", justify="right")
+    table.add_column("Cost $", justify="right")
+    table.add_column("Total $", justify="right")
+    table.add_column("Retries", justify="right")
+    table.add_column("Cached", justify="right")
+    table.add_column("Escalated", justify="right")
+
+    for s in summary:
+        table.add_row(
+            s["agent"].removesuffix("Agent"),
+            str(s["calls"]),
+            f"{s['wall_p50']:.0f} / {s['wall_p95']:.0f}",
+            f"{s['retrieval_p50']:.0f} / {s['retrieval_p95']:.0f}",
+            f"{s['tokens_p50']:.0f} / {s['tokens_p95']:.0f}",
+            f"{s['cost_p50']:.4f} / {s['cost_p95']:.4f}",
+            f"{s['cost_total']:.4f}",
+            str(s["retries"]),
+            str(s["cached"]),
+            f"{s['escalated']}/{s['fast_tier']}" if s["fast_tier"] else "-",
+        )
+
+    console.print()
+    console.print(table)
@@ -0,0 +1,220 @@
+"""Deterministic clean-up of job posting text before analysis.
+
+Scraped pages and pasted postings carry a lot of text the analyzer does not
+need: equal-opportunity statements, cookie banners, share/apply buttons,
+long benefits lists and lines repeated by the page layout. This module
+drops that text line by line, using the section each line sits under
+(detected from headings) to decide what is boilerplate. Requirements and
+responsibilities sections are never trimmed beyond exact duplicates and
+page furniture.
+
+Only lines marked as headings (a trailing colon, markdown ``#`` or bold,
+or all capitals) start a section, and the first line, usually the job
+title, never does: "Benefits Analyst" or "Diversity and Inclusion
+Manager" is a role, not a section.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+
+from job_assistant.rag.context import estimate_tokens
+
+# Section kinds, matched against heading lines
+_SECTION_PATTERNS = [
+    ("requirements", re.compile(
+        r"requirement|qualification|skills|experience|what you.{0,10}(bring|need|have)"
+        r"|about you|you (will )?have|the ideal|essential|desirable|criteria|who you are"
+    )),
+    ("responsibilities", re.compile(
+        r"responsibilit|duties|the role|your role|about the (role|job|position)"
+        r"|what you.{0,10}(do|be doing)|day to day|key tasks|main purpose"
+    )),
+    ("benefits", re.compile(
+        r"benefit|perks|what we offer|we offer|why (join|work)|rewards?\b|package"
+    )),
+    ("eeo", re.compile(
+        r"equal (employment )?opportunit|diversity|inclusion|accessibility"
+        r"|reasonable adjustment|eeo\b"
+    )),
+    ("apply", re.compile(r"how to apply|application process|next steps")),
+    ("about", re.compile(r"about (us|the company|the team)|who we are|our (company|mission|story)")),
+]
+
+# Sections kept only up to a few lines
+_CAPPED_SECTIONS = {"benefits": 6}
+
+# Sections where only duplicates and page furniture are removed
+_PROTECTED_SECTIONS = frozenset({"requirements", "responsibilities"})
+
+# Boilerplate found anywhere in a line, whatever the section
+_BOILERPLATE_PATTERNS = [
+    ("cookie", re.compile(
+        r"cookie|privacy (policy|notice)|terms (of use|and conditions)|all rights reserved"
+        r"|©|\(c\) \d{4}|javascript"
+    )),
+    ("eeo", re.compile(
+        r"equal opportunit|equal employment|affirmative action|regardless of (race|age|gender|sex)"
+        r"|protected characteristic|disability confident|reasonable adjustment"
+        r"|(race|religion|sexual orientation|gender identity),"
+        r"|(committed to|celebrate) (diversity|an inclusive)"
+    )),
+    ("apply", re.compile(
+        r"how to apply|click (on )?(the )?apply|apply (now|online|today|here|via|through)"
+        r"|to apply,|submit your (cv|application)|send (us )?your (cv|application)"
+    )),
+]
+
+# Short lines that are page furniture (buttons, links, navigation)
+_UI_RE = re.compile(
+    r"^(apply( now| for this job)?|save( job)?|share( this job)?|sign in|log ?in|register"
+    r"|report (this )?job|back to (search|results|jobs)|show (more|less)|see more"
+    r"|similar jobs|email me jobs like this|follow us|print|close|menu|home"
+    r"|skip to (main )?content|view all jobs|posted \d+ \w+ ago|\d+ applicants?)$"
+)
+
+# Lines that may mention pay; kept even in trimmed sections
+_SALARY_RE = re.compile(
+    r"[£$€]\s?\d|salary|per annum|\bp\.?a\b|\d+k\b|per hour|daily rate|bonus|commission|equity"
+)
+
+_BULLET_RE = re.compile(r"^[\s•·\-–—*●▪◦>]+")
+
+
+@dataclass
+class CleanedJobText:
+    """Cleaned posting text and what was removed from it."""
+
+    text: str
+    chars_before: int
+    chars_after: int
+    tokens_before: int
+    tokens_after: int
+    removed: Counter = field(default_factory=Counter)
+    sections: list[str] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.tokens_before - self.tokens_after
+
+    @property
+    def reduction(self) -> float:
+        """Share of characters removed."""
+        return 1 - self.chars_after / self.chars_before if self.chars_before else 0.0
+
+    def stats(self) -> dict:
+        """Plain-dict summary for the pipeline state and logs."""
+        return {
+            "chars_before": self.chars_before,
+            "chars_after": self.chars_after,
+            "tokens_before": self.tokens_before,
+            "tokens_after": self.tokens_after,
+            "removed_lines": dict(self.removed),
+            "sections": self.sections,
+        }
+
+
+def _normalize(line: str) -> str:
+    """Key for duplicate detection: no bullets, case or extra whitespace."""
+    return " ".join(_BULLET_RE.sub("", line).casefold().split()).rstrip(".:;")
+
+
+def _heading_kind(line: str) -> str | None:
+    """Section kind if ``line`` is marked as a heading, else None.
+
+    Headings end with a colon, are markdown headings or bold, or are all
+    capitals; unmarked short lines (such as a job title) are content.
+    """
+    marked = bool(re.match(r"#{1,6}\s", line)) or (
+        line.startswith(("**", "__")) and line.rstrip(":").endswith(("**", "__"))
+    )
+    if not marked and _BULLET_RE.match(line):
+        return None
+    bare = line.strip("#*_ ")
+    key = _normalize(bare)
+    words = key.split()
+    if not words or len(words) > 8 or len(key) > 60:
+        return None
+    has_colon = bare.endswith(":")
+    all_caps = bare == bare.upper() and re.search(r"[A-Z]{4}", bare) is not None
+    if not (marked or has_colon or all_caps):
+        return None
+    if not has_colon and re.search(r"[.;!?]", key):
+        return None
+    for kind, pattern in _SECTION_PATTERNS:
+        if pattern.search(key):
+            return kind
+    return "other"
+
+
+def _boilerplate_kind(key: str) -> str | None:
+    for kind, pattern in _BOILERPLATE_PATTERNS:
+        if pattern.search(key):
+            return kind
+    return None
+
+
+def clean_job_text(text: str) -> CleanedJobText:
+    """Remove duplicate lines and boilerplate from a job posting.
+
+    Lines are tracked under the most recent heading. Benefits sections are
+    cut to their first few lines (plus any line mentioning pay), and cookie
+    notices, equal-opportunity and how-to-apply sentences and navigation
+    lines are dropped anywhere outside requirements and responsibilities.
+    Other text under an equal-opportunity or how-to-apply heading is kept.
+    The first occurrence of a repeated line is kept.
+    """
+    seen: set[str] = set()
+    removed: Counter = Counter()
+    sections: list[str] = []
+    section: str | None = None
+    section_lines = 0
+    kept: list[str] = []
+
+    for raw in text.splitlines():
+        line = " ".join(raw.split())
+        key = _normalize(line)
+        if not re.search(r"\w", key):
+            if line:
+                removed["empty"] += 1
+            continue
+
+        if len(key) <= 40 and _UI_RE.match(key):
+            removed["ui"] += 1
+            continue
+
+        # The first line is the title, whatever words it contains
+        kind = _heading_kind(line) if kept else None
+        if kind:
+            section, section_lines = kind, 0
+            sections.append(kind)
+
+        if key in seen:
+            removed["duplicate"] += 1
+            continue
+        seen.add(key)
+
+        if not kind:
+            section_lines += 1
+            cap = _CAPPED_SECTIONS.get(section)
+            if cap and section_lines > cap and not _SALARY_RE.search(key):
+                removed[section] += 1
+                continue
+
+        boilerplate = _boilerplate_kind(key)
+        if boilerplate and section not in _PROTECTED_SECTIONS:
+            removed[boilerplate] += 1
+            continue
+
+        kept.append(line)
+
+    cleaned = "\n".join(kept)
+    return CleanedJobText(
+        text=cleaned,
+        chars_before=len(text),
+        chars_after=len(cleaned),
+        tokens_before=estimate_tokens(text),
+        tokens_after=estimate_tokens(cleaned),
+        removed=removed,
+        sections=sections,
+    )
@@ -0,0 +1,204 @@
+"""Per-agent call metrics: latency, retrieval time, token usage and cost.
+
+Agents record each LLM call with ``track_agent_call``; pipeline nodes gather
+the calls made while they run with ``collect_agent_calls``. Both use context
+variables, so concurrent pipeline runs sharing the same agents never mix
+their metrics.
+"""
+
+import math
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+
+from job_assistant.config import settings
+
+
+@dataclass
+class AgentCallMetrics:
+    """Measurements for one agent call."""
+
+    agent: str
+    model: str
+    started_at: float = 0.0  # Unix time the call started
+    wall_ms: float = 0.0
+    retrieval_ms: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+    retries: int = 0
+    cached: bool = False
+    # Answered by the agent's model after the fast tier's output failed validation
+    escalated: bool = False
+
+    def add_usage(self, usage: dict | None) -> None:
+        """Add token counts from a LangChain message's ``usage_metadata``.
+
+        Cost is priced for ``self.model``, so set that before adding usage
+        from a different model.
+        """
+        if not usage:
+            return
+        prompt_tokens = usage.get("input_tokens", 0)
+        completion_tokens = usage.get("output_tokens", 0)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost_usd += estimate_cost(prompt_tokens, completion_tokens, self.model)
+
+
+_current_call: ContextVar[AgentCallMetrics | None] = ContextVar(
+    "current_agent_call", default=None
+)
+_collected_calls: ContextVar[list[dict] | None] = ContextVar(
+    "collected_agent_calls", default=None
+)
+
+
+def estimate_cost(
+    prompt_tokens: int, completion_tokens: int, model: str | None = None
+) -> float:
+    """Estimated USD cost of a call at the configured per-token prices.
+
+    Calls to ``settings.fast_model`` use the fast tier prices, other models
+    their ``settings.model_prices`` entry, and unlisted models (or no model)
+    the default ``llm_*_cost_per_mtok`` prices.
+    """
+    # Gemini clients may report the model as "models/<name>"
+    model = model.removeprefix("models/") if model else model
+    if model and model == settings.fast_model:
+        input_cost, output_cost = (
+            settings.fast_input_cost_per_mtok, settings.fast_output_cost_per_mtok
+        )
+    elif model in settings.model_prices:
+        input_cost, output_cost = settings.model_prices[model]
+    else:
+        input_cost, output_cost = (
+            settings.llm_input_cost_per_mtok, settings.llm_output_cost_per_mtok
+        )
+    return (prompt_tokens * input_cost + completion_tokens * output_cost) / 1_000_000
+
+
+@contextmanager
+def collect_agent_calls() -> Iterator[list[dict]]:
+    """Collect the metrics (as dicts) of every agent call made in the block."""
+    calls: list[dict] = []
+    token = _collected_calls.set(calls)
+    try:
+        yield calls
+    finally:
+        _collected_calls.reset(token)
+
+
+@contextmanager
+def track_agent_call(agent: str, model: str) -> Iterator[AgentCallMetrics]:
+    """Time an agent call and hand its metrics to the enclosing collector."""
+    metrics = AgentCallMetrics(agent=agent, model=model, started_at=time.time())
+    token = _current_call.set(metrics)
+    start = time.perf_counter()
+    try:
+        yield metrics
+    finally:
+        metrics.wall_ms = (time.perf_counter() - start) * 1000
+        _current_call.reset(token)
+        calls = _collected_calls.get()
+        if calls is not None:
+            calls.append(asdict(metrics))
+
+
+@contextmanager
+def track_retrieval() -> Iterator[None]:
+    """Add the block's duration to the current agent call's retrieval time."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current_call.get()
+        if metrics is not None:
+            metrics.retrieval_ms += (time.perf_counter() - start) * 1000
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _run_wall_ms(calls: list[dict]) -> float:
+    """End-to-end wall time of one pipeline run's calls.
+
+    Parallel calls (the writer and advisor branches) overlap, so this spans
+    the first call's start to the last call's end rather than summing.
+    Rows recorded before start times were stored fall back to the sum.
+    """
+    if any(not c.get("started_at") for c in calls):
+        return sum(c["wall_ms"] or 0 for c in calls)
+    start = min(c["started_at"] for c in calls)
+    end = max(c["started_at"] + (c["wall_ms"] or 0) / 1000 for c in calls)
+    return (end - start) * 1000
+
+
+def _on_fast_tier(row: dict) -> bool:
+    """Whether a call went to the fast tier (answered there or escalated)."""
+    return bool(row.get("escalated")) or (
+        bool(settings.fast_model) and row.get("model") == settings.fast_model
+    )
+
+
+def summarize_agent_metrics(rows: list[dict]) -> list[dict]:
+    """Per-agent p50/p95 latency, tokens and cost over stored metric rows.
+
+    A final "Total" entry aggregates each pipeline run's calls (the rows
+    saved together for an application) into one: tokens, cost and
+    retrieval time are summed, wall time is the run's elapsed time.
+
+    ``escalated`` counts calls redone on the agent's model after the fast
+    tier's output failed validation, out of ``fast_tier`` calls (those
+    answered by ``settings.fast_model`` plus the escalated ones).
+    """
+    groups: dict[str, list[dict]] = defaultdict(list)
+    per_run: dict[tuple, list[dict]] = defaultdict(list)
+    for row in rows:
+        groups[row["agent"]].append(row)
+        per_run[(row["application_id"], row["created_at"])].append(row)
+    for calls in per_run.values():
+        totals = defaultdict(float)
+        for row in calls:
+            for field in ("retrieval_ms", "prompt_tokens", "completion_tokens",
+                          "cost_usd", "retries", "cached", "escalated"):
+                totals[field] += row.get(field) or 0
+        totals["wall_ms"] = _run_wall_ms(calls)
+        totals["fast_tier"] = sum(_on_fast_tier(row) for row in calls)
+        groups["Total"].append(totals)
+
+    summary = []
+    for agent, group in groups.items():
+        wall = [r["wall_ms"] for r in group]
+        retrieval = [r["retrieval_ms"] for r in group]
+        tokens = [r["prompt_tokens"] + r["completion_tokens"] for r in group]
+        cost = [r["cost_usd"] for r in group]
+        summary.append({
+            "agent": agent,
+            "calls": len(group),
+            "wall_p50": percentile(wall, 50),
+            "wall_p95": percentile(wall, 95),
+            "retrieval_p50": percentile(retrieval, 50),
+            "retrieval_p95": percentile(retrieval, 95),
+            "tokens_p50": percentile(tokens, 50),
+            "tokens_p95": percentile(tokens, 95),
+            "cost_p50": percentile(cost, 50),
+            "cost_p95": percentile(cost, 95),
+            "cost_total": sum(cost),
+            "retries": int(sum(r["retries"] for r in group)),
+            "cached": int(sum(r["cached"] for r in group)),
+            "escalated": int(sum(r.get("escalated") or 0 for r in group)),
+            "fast_tier": int(sum(
+                r["fast_tier"] if "fast_tier" in r else _on_fast_tier(r) for r in group
+            )),
+        })
+    return summary
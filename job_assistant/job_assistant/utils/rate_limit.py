@@ -0,0 +1,155 @@
+"""Request/token rate limiting and retry backoff for LLM API calls."""
+
+import asyncio
+import random
+import re
+import threading
+import time
+
+# HTTP statuses worth retrying: rate limited, or a transient server failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+_RETRY_HINT_PATTERNS = (
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)"),
+    re.compile(r"['\"]retryDelay['\"]\s*:\s*['\"](\d+(?:\.\d+)?)s['\"]"),
+    re.compile(r"retry after (\d+(?:\.\d+)?)", re.IGNORECASE),
+)
+
+
+class TokenBucket:
+    """Bucket holding up to ``per_minute`` units, refilled continuously.
+
+    The level may go negative when actual usage turns out higher than what
+    was reserved; later callers then wait until the debt is repaid.
+    """
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self.level = min(self.capacity, self.level + elapsed * self.capacity / 60)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` units are available (capped at capacity)."""
+        self._refill(now)
+        shortfall = min(amount, self.capacity) - self.level
+        return max(shortfall, 0.0) * 60 / self.capacity
+
+    def take(self, amount: float) -> None:
+        self.level -= amount
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the per-minute allowance spent recently (0.0 to 1.0+)."""
+        self._refill(time.monotonic())
+        return 1 - self.level / self.capacity
+
+
+class RateLimiter:
+    """Thread- and asyncio-safe limiter on requests and tokens per minute.
+
+    Callers reserve one request plus an estimate of its tokens before each
+    call, and report the actual token count afterwards. A rate-limit
+    response pauses every caller until its retry delay has passed, since
+    the quota is shared. A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._paused_until = 0.0
+        self.throttled_seconds = 0.0
+        self.rate_limit_errors = 0
+
+    def _try_acquire(self, tokens: int) -> float:
+        """Reserve capacity and return 0, or return how long to wait first."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self._paused_until - now,
+                self._requests.wait_time(1, now) if self._requests else 0.0,
+                self._tokens.wait_time(tokens, now) if self._tokens else 0.0,
+            )
+            if wait > 0:
+                self.throttled_seconds += wait
+                return wait
+            if self._requests:
+                self._requests.take(1)
+            if self._tokens:
+                self._tokens.take(tokens)
+            return 0.0
+
+    def acquire(self, tokens: int) -> None:
+        """Block until one request of about ``tokens`` tokens may be sent."""
+        while (wait := self._try_acquire(tokens)) > 0:
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: int) -> None:
+        """Async ``acquire``: waits without blocking the event loop."""
+        while (wait := self._try_acquire(tokens)) > 0:
+            await asyncio.sleep(wait)
+
+    def record_usage(self, reserved: int, actual: int) -> None:
+        """Settle a reservation against the tokens the call actually used."""
+        if self._tokens:
+            with self._lock:
+                self._tokens.take(actual - reserved)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` after a rate-limit response."""
+        with self._lock:
+            self.rate_limit_errors += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def usage(self) -> dict:
+        """Current share of the per-minute quotas in use, plus throttling totals."""
+        with self._lock:
+            return {
+                "requests": self._requests.utilization if self._requests else 0.0,
+                "tokens": self._tokens.utilization if self._tokens else 0.0,
+                "throttled_seconds": self.throttled_seconds,
+                "rate_limit_errors": self.rate_limit_errors,
+            }
+
+
+def status_code(exc: BaseException) -> int | None:
+    """HTTP status of an API error, looking through wrapped exceptions."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        code = getattr(exc, "code", None) or getattr(exc, "status_code", None)
+        if isinstance(code, int):
+            return code
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Server-suggested retry delay in seconds, if the error carries one."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        response = getattr(exc, "response", None)
+        headers = getattr(response, "headers", None)
+        if headers and headers.get("retry-after"):
+            try:
+                return float(headers["retry-after"])
+            except ValueError:
+                pass
+        for pattern in _RETRY_HINT_PATTERNS:
+            match = pattern.search(str(exc))
+            if match:
+                return float(match.group(1))
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
+def backoff_delay(attempt: int, base: float, maximum: float) -> float:
+    """Exponential backoff with jitter: between half and all of base * 2**attempt."""
+    ceiling = min(maximum, base * 2**attempt)
+    return ceiling / 2 + random.uniform(0, ceiling / 2)
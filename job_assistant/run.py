@@ -1,5 +1,6 @@
 """CLI entry point for the Job Application Assistant."""
 
+import asyncio
 import sys
 from pathlib import Path
 
@@ -9,10 +10,10 @@ from rich.console import Console
 # Ensure the project root is on the path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from job_assistant.config import settings
-from job_assistant.orchestration.graph import build_graph
-from job_assistant.rag.retriever import index_knowledge_base
+from job_assistant.config import OUTPUT_DIR, settings
 from job_assistant.utils.display import (
+    BatchProgressTable,
+    CoverLetterStream,
     console,
     display_advisor_output,
     display_error,
@@ -26,14 +27,30 @@ from job_assistant.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-@click.command()
+@click.group(invoke_without_command=True)
 @click.option("--url", default=None, help="URL of the job posting to analyze.")
 @click.option("--text", default=None, help="Job description text (inline).")
 @click.option("--text-file", default=None, type=click.Path(exists=True),
               help="Path to a file containing the job description.")
+@click.option("--batch", "batch_path", default=None, type=click.Path(exists=True),
+              help="Process many postings: a file of URLs, a directory of text files, "
+                   "or JSONL with url/text per line.")
+@click.option("--concurrency", type=int, default=None,
+              help="Postings processed at once in batch mode.")
+@click.option("--batch-log", default=None, type=click.Path(),
+              help="Batch result log; finished items in it are skipped on rerun.")
 @click.option("--reindex", is_flag=True, help="Force re-index the knowledge base.")
+@click.option("--cache", is_flag=True,
+              help="Reuse cached LLM answers for identical prompts.")
+@click.option("--fused", is_flag=True,
+              help="Write the application and strategy advice in one LLM call.")
+@click.option("--min-score", type=int, default=None,
+              help="Skip writing and advice below this match score (0 disables).")
+@click.option("--matcher", type=click.Choice(["llm", "draft", "local"]), default=None,
+              help="Skill matching: LLM, LLM review of a local draft, or local only.")
 @click.option("--verbose", is_flag=True, help="Enable debug logging.")
-def main(url, text, text_file, reindex, verbose):
+@click.pass_context
+def main(ctx, url, text, text_file, batch_path, concurrency, batch_log, reindex, cache, fused, min_score, matcher, verbose):
     """Multi-Agent Job Application Assistant.
 
     Analyzes job postings and generates tailored application materials
@@ -42,6 +59,21 @@ def main(url, text, text_file, reindex, verbose):
     if verbose:
         import logging
         logging.getLogger("job_assistant").setLevel(logging.DEBUG)
+    if cache:
+        settings.llm_cache_enabled = True
+    if fused:
+        settings.fused_writer_advisor = True
+    if matcher:
+        settings.matcher_mode = matcher
+    if min_score is not None:
+        settings.min_match_score = min_score
+    if ctx.invoked_subcommand:
+        return
+
+    # Heavy dependencies (langgraph, LangChain, ChromaDB) load on first use
+    from job_assistant.orchestration.graph import build_graph
+    from job_assistant.storage.database import STATUS_SKIPPED_LOW_MATCH
+    from job_assistant.rag.retriever import index_knowledge_base
 
     console.print("[bold blue]Job Application Assistant[/bold blue]")
     console.print("=" * 50)
@@ -51,7 +83,7 @@ def main(url, text, text_file, reindex, verbose):
         count = index_knowledge_base(force=reindex)
         console.print(f"Knowledge base: {count} chunks indexed")
 
-    if reindex and not url and not text and not text_file:
+    if reindex and not url and not text and not text_file and not batch_path:
         console.print("[green]Knowledge base re-indexed successfully.[/green]")
         return
 
@@ -61,21 +93,28 @@ def main(url, text, text_file, reindex, verbose):
         job_text = text
     elif text_file:
         job_text = Path(text_file).read_text(encoding="utf-8")
-    elif not url:
-        console.print("[red]Provide --url, --text, or --text-file[/red]")
+    elif not url and not batch_path:
+        console.print("[red]Provide --url, --text, --text-file or --batch[/red]")
         raise SystemExit(1)
 
-    # Validate API key
-    if not settings.google_api_key:
+    # Validate API key (the offline fake provider needs none)
+    if settings.llm_provider == "gemini" and not settings.google_api_key:
         console.print("[red]GOOGLE_API_KEY not set. Create a .env file.[/red]")
         raise SystemExit(1)
 
     # Build and run the pipeline
-    console.print(f"\nModel: [cyan]{settings.gemini_model}[/cyan]")
+    console.print(f"\nModel: [cyan]{settings.gemini_model}[/cyan] ({settings.llm_provider})")
+    if settings.fast_model:
+        console.print(f"Fast tier for simple postings: [cyan]{settings.fast_model}[/cyan]")
     console.print()
 
     graph = build_graph()
 
+    if batch_path:
+        _run_batch(graph, Path(batch_path), concurrency, batch_log)
+        _display_usage()
+        return
+
     initial_state = {}
     if url:
         initial_state["job_url"] = url
@@ -84,31 +123,23 @@ def main(url, text, text_file, reindex, verbose):
 
     steps = [
         "Scraping/validating",
+        "Cleaning job text",
         "Analyzing job posting",
         "Matching skills (RAG)",
         "Generating application materials",
         "Advising strategy",
         "Saving results",
     ]
-
-    with console.status("") as status:
-        step_idx = 0
-
-        for event in graph.stream(initial_state):
-            node_name = list(event.keys())[0]
-            state = event[node_name]
-
-            if step_idx < len(steps):
-                status.update(f"[bold green]{steps[step_idx]}...")
-            step_idx += 1
-
-            # Check for error at each step
-            if state.get("error"):
-                display_error(state["error"])
-                break
+    final_state, letter_streamed = _run_with_progress(graph, initial_state, steps)
 
     # Display results
-    final_state = state
+    text_stats = final_state.get("job_text_stats")
+    if text_stats:
+        saved = text_stats["tokens_before"] - text_stats["tokens_after"]
+        console.print(
+            f"[dim]Job text cleaned: {text_stats['chars_before']:,} -> "
+            f"{text_stats['chars_after']:,} chars, ~{saved:,} tokens saved[/dim]"
+        )
 
     if final_state.get("job_analysis"):
         display_job_analysis(final_state["job_analysis"])
@@ -116,8 +147,117 @@ def main(url, text, text_file, reindex, verbose):
     if final_state.get("match_analysis"):
         display_match_analysis(final_state["match_analysis"])
 
+    _display_generated(final_state, letter_streamed)
+
+    if final_state.get("status") == STATUS_SKIPPED_LOW_MATCH:
+        console.print(
+            f"[yellow]Match score below {settings.min_match_score}: skipped writing "
+            f"and advice. Run `py run.py generate {final_state['db_id']}` to "
+            f"generate them anyway.[/yellow]"
+        )
+
+    _display_usage()
+
+
+def _run_with_progress(graph, initial_state: dict, steps: list[str]) -> tuple[dict, bool]:
+    """Run a graph with a status spinner, streaming the cover letter as it is written.
+
+    An error is displayed as soon as a node reports it, and the run continues
+    until the graph has saved it (as a failed application).
+
+    Returns the final state and whether the cover letter was shown while streaming.
+    """
+    from job_assistant.orchestration.graph import astream_pipeline
+
+    cover_letter = CoverLetterStream()
+
+    async def run_pipeline():
+        state = initial_state
+        with console.status("") as status:
+            step_idx = 0
+            failed = False
+
+            def on_progress(event: dict) -> None:
+                # Show the cover letter as the writer generates it
+                if "cover_letter" in event:
+                    if not cover_letter.started:
+                        status.stop()
+                    cover_letter.update(event["cover_letter"])
+
+            try:
+                async for node_name, state in astream_pipeline(
+                    initial_state, graph, on_custom=on_progress
+                ):
+                    writer_done = node_name in ("generate_content", "write_and_advise")
+                    if writer_done and cover_letter.started:
+                        cover_letter.close()
+                        status.start()
+
+                    if failed:
+                        # The failed run has been saved; nothing else follows
+                        if node_name in ("save_results", "save_generated"):
+                            break
+                        continue
+
+                    # On an error the graph skips to saving the run as failed
+                    if state.get("error"):
+                        display_error(state["error"])
+                        failed = True
+                        status.update("[bold red]Saving failed run...")
+                        continue
+
+                    if step_idx < len(steps):
+                        status.update(f"[bold green]{steps[step_idx]}...")
+                    step_idx += 1
+            finally:
+                cover_letter.close()
+        return state
+
+    return asyncio.run(run_pipeline()), cover_letter.started
+
+
+def _run_batch(graph, path: Path, concurrency: int | None, log_path: str | None) -> None:
+    """Run every posting in a batch through one graph, resuming from the log."""
+    from job_assistant.orchestration.batch import BatchLog, arun_batch, load_batch
+
+    try:
+        items = load_batch(path)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1)
+    log = BatchLog(
+        Path(log_path) if log_path else OUTPUT_DIR / f"batch_{path.stem}.jsonl"
+    )
+    pending = log.pending(items)
+    concurrency = concurrency or settings.batch_concurrency
+
+    console.print(
+        f"Batch: {len(items)} postings, {len(items) - len(pending)} already done "
+        f"per {log.path}; running {len(pending)} at concurrency {concurrency}"
+    )
+    if not pending:
+        return
+
+    with BatchProgressTable(total=len(items), skipped=len(items) - len(pending)) as table:
+        results = asyncio.run(
+            arun_batch(pending, graph, concurrency, log, on_update=table.update)
+        )
+
+    console.print()
+    for p in (p for p in results if p.status == "failed"):
+        console.print(f"[red]Failed: {p.item.item_id}: {p.error}[/red]")
+    console.print(f"Results logged to {log.path}")
+
+
+def _display_generated(final_state: dict, letter_streamed: bool) -> None:
+    """Display the writer and advisor output and where results were saved.
+
+    Errors were already shown by ``_run_with_progress`` as they happened.
+    """
     if final_state.get("writer_output"):
-        display_writer_output(final_state["writer_output"])
+        display_writer_output(
+            final_state["writer_output"], show_cover_letter=not letter_streamed
+        )
 
     if final_state.get("advisor_output"):
         display_advisor_output(final_state["advisor_output"])
@@ -125,8 +265,81 @@ def main(url, text, text_file, reindex, verbose):
     if final_state.get("output_path"):
         display_saved(final_state["output_path"], final_state.get("db_id", 0))
 
-    if final_state.get("error"):
-        display_error(final_state["error"])
+
+def _display_usage() -> None:
+    """Display quota usage and, if enabled, the LLM cache hit rate."""
+    from job_assistant.agents.registry import get_rate_limiter
+
+    quota = get_rate_limiter().usage()
+    console.print(
+        f"[dim]Gemini quota in use: {quota['requests']:.0%} of requests/min, "
+        f"{quota['tokens']:.0%} of tokens/min; throttled "
+        f"{quota['throttled_seconds']:.1f}s, {quota['rate_limit_errors']} rate-limit "
+        f"errors[/dim]"
+    )
+
+    if settings.llm_cache_enabled:
+        from job_assistant.agents.base import response_cache
+
+        lookups = response_cache.hits + response_cache.misses
+        console.print(
+            f"LLM cache: {response_cache.hits}/{lookups} hits "
+            f"({response_cache.hit_rate:.0%})"
+        )
+
+
+@main.command()
+@click.argument("application_id", type=int)
+def generate(application_id):
+    """Generate materials and advice for a stored application.
+
+    Use this for postings saved as skipped-low-match, whose writing and
+    advice were skipped because the match score was below MIN_MATCH_SCORE.
+    """
+    from job_assistant.orchestration.graph import build_generation_graph
+    from job_assistant.storage.database import get_application
+
+    application = get_application(application_id)
+    if application is None:
+        console.print(f"[red]No application with ID {application_id}.[/red]")
+        raise SystemExit(1)
+    if not (application["job_analysis"] and application["match_analysis"]):
+        console.print(
+            f"[red]Application {application_id} has no job or match analysis to "
+            f"generate from.[/red]"
+        )
+        raise SystemExit(1)
+    if settings.llm_provider == "gemini" and not settings.google_api_key:
+        console.print("[red]GOOGLE_API_KEY not set. Create a .env file.[/red]")
+        raise SystemExit(1)
+
+    console.print(
+        f"Generating for #{application_id}: [bold]{application['job_title']}[/bold] at "
+        f"{application['company']} (match score {application['match_score']}, "
+        f"status {application['status']})"
+    )
+    initial_state = {
+        "db_id": application_id,
+        "job_url": application["job_url"],
+        "job_analysis": application["job_analysis"],
+        "match_analysis": application["match_analysis"],
+    }
+    steps = ["Generating application materials", "Advising strategy", "Saving results"]
+    final_state, letter_streamed = _run_with_progress(
+        build_generation_graph(), initial_state, steps
+    )
+    _display_generated(final_state, letter_streamed)
+    _display_usage()
+
+
+@main.command()
+def stats():
+    """Show p50/p95 latency, tokens and cost per pipeline stage."""
+    from job_assistant.storage.database import list_agent_metrics
+    from job_assistant.utils.display import display_agent_stats
+    from job_assistant.utils.metrics import summarize_agent_metrics
+
+    display_agent_stats(summarize_agent_metrics(list_agent_metrics()))
 
 
 if __name__ == "__main__":
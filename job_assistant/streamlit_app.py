@@ -6,13 +6,13 @@ import streamlit as st
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from job_assistant.config import settings
-from job_assistant.orchestration.graph import build_graph
 from job_assistant.schemas.models import (
     JobAnalysis,
     MatchAnalysis,
     WriterOutput,
     AdvisorOutput,
 )
+from job_assistant.storage.database import STATUS_SKIPPED_LOW_MATCH
 import os
 
 # Page configuration
@@ -34,7 +34,7 @@ with st.sidebar:
         os.environ["GOOGLE_API_KEY"] = st.secrets["GOOGLE_API_KEY"]
         settings.google_api_key = st.secrets["GOOGLE_API_KEY"]
     
-    if not settings.google_api_key:
+    if settings.llm_provider == "gemini" and not settings.google_api_key:
         st.error("GOOGLE_API_KEY not set. Please create a .env file or add to Streamlit Secrets.")
         st.stop()
     
@@ -74,6 +74,7 @@ if st.button("Analyze Job", type="primary"):
             progress_text = "Starting analysis..."
             bar = st.progress(0, text=progress_text)
             
+            from job_assistant.orchestration.graph import build_graph
             graph = build_graph()
             initial_state = {}
             if job_url:
@@ -83,6 +84,7 @@ if st.button("Analyze Job", type="primary"):
             
             steps = [
                 "scrape_or_validate",
+                "preprocess_job_text",
                 "analyze_job",
                 "match_skills",
                 "generate_content",
@@ -91,27 +93,47 @@ if st.button("Analyze Job", type="primary"):
             ]
             
             final_state = {}
+            # Cover letter preview, filled in while the writer generates it
+            letter_preview = st.empty()
             
             try:
                 step_count = 0
-                for event in graph.stream(initial_state):
+                error_shown = False
+                for mode, event in graph.stream(initial_state, stream_mode=["updates", "custom"]):
+                    if mode == "custom":
+                        if "cover_letter" in event:
+                            with letter_preview.container(border=True):
+                                st.caption("Cover letter (writing...)")
+                                st.markdown(event["cover_letter"])
+                        continue
+                    
                     node_name = list(event.keys())[0]
-                    final_state = event[node_name]
+                    # Nodes return only the keys they set
+                    final_state = {**final_state, **(event[node_name] or {})}
                     
                     # Update progress
                     step_count += 1
                     progress = min(step_count / len(steps), 1.0)
                     bar.progress(progress, text=f"Processing: {node_name}...")
                     
-                    if final_state.get("error"):
+                    # Keep going after an error so save_results records the failed run
+                    if final_state.get("error") and not error_shown:
                         st.error(f"Error in {node_name}: {final_state['error']}")
-                        break
+                        error_shown = True
                 
                 bar.progress(1.0, text="Analysis Complete!")
+                letter_preview.empty()
                 
             except Exception as e:
                 st.error(f"An error occurred: {str(e)}")
 
+        if final_state.get("status") == STATUS_SKIPPED_LOW_MATCH:
+            st.warning(
+                f"Match score is below {settings.min_match_score}, so writing and advice "
+                f"were skipped. Run `py run.py generate {final_state.get('db_id')}` "
+                f"to generate them anyway."
+            )
+
         # Display Results using Tabs
         if final_state and not final_state.get("error"):
             tab1, tab2, tab3, tab4 = st.tabs([
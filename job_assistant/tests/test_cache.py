@@ -0,0 +1,55 @@
+"""Tests for the SQLite-backed LRU cache."""
+
+import sqlite3
+
+from job_assistant.utils.cache import SQLiteCache
+
+
+def test_hits_are_served_from_memory_and_persisted(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=10)
+    cache.set_many({"a": b"1", "b": b"2"})
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"1", "b": b"2"}
+    assert (cache.hits, cache.misses) == (2, 1)
+    cache.close()
+
+    reopened = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=10)
+    assert reopened.get_many(["a"]) == {"a": b"1"}
+    reopened.close()
+
+
+def test_last_used_times_are_written_on_close(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=10)
+    cache.set_many({"a": b"1"})
+    conn = sqlite3.connect(tmp_path / "cache.db")
+    (written,) = conn.execute("SELECT last_used FROM entries").fetchone()
+
+    cache.get_many(["a"])
+    assert conn.execute("SELECT last_used FROM entries").fetchone() == (written,)
+    cache.close()
+    (used,) = conn.execute("SELECT last_used FROM entries").fetchone()
+    assert used > written
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=2, memory_entries=0)
+    cache.set_many({"a": b"1"})
+    cache.set_many({"b": b"2"})
+    cache.get_many(["a"])
+    cache.set_many({"c": b"3"})
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"1", "c": b"3"}
+    cache.close()
+
+
+def test_expired_entries_are_ignored(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=10, ttl_seconds=-1)
+    cache.set_many({"a": b"1"})
+    assert cache.get_many(["a"]) == {}
+    cache.close()
+
+
+def test_clear_empties_memory_and_disk(tmp_path):
+    cache = SQLiteCache(tmp_path / "cache.db", "entries", max_entries=10)
+    cache.set_many({"a": b"1"})
+    cache.clear()
+    assert cache.get_many(["a"]) == {}
+    cache.close()
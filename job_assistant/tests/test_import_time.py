@@ -0,0 +1,41 @@
+"""Startup budget: importing the CLI must stay fast and keep heavy imports lazy.
+
+The cumulative wall-clock budget depends on the machine, so it only runs
+when IMPORT_TIME_BUDGET_MS is set (e.g. ``IMPORT_TIME_BUDGET_MS=800``).
+"""
+
+import os
+
+import pytest
+
+from benchmarks.check_import_time import LAZY_MODULES, measure_import_times, own_import_us
+
+# Self time of run.py and job_assistant modules; about 15 ms today
+OWN_BUDGET_MS = 150
+
+
+@pytest.fixture(scope="module")
+def timings() -> dict[str, tuple[int, int]]:
+    return measure_import_times("run")
+
+
+def test_heavy_modules_load_lazily(timings):
+    leaked = sorted(m for m in LAZY_MODULES if m in timings)
+    assert not leaked, f"heavy modules imported eagerly: {', '.join(leaked)}"
+
+
+def test_own_modules_import_quickly(timings):
+    own_ms = own_import_us(timings) / 1000
+    assert own_ms <= OWN_BUDGET_MS, (
+        f"run and job_assistant modules took {own_ms:.0f} ms to import "
+        f"(budget {OWN_BUDGET_MS} ms)"
+    )
+
+
+@pytest.mark.skipif(
+    not os.environ.get("IMPORT_TIME_BUDGET_MS"), reason="IMPORT_TIME_BUDGET_MS not set"
+)
+def test_cli_import_time_within_budget(timings):
+    budget_ms = float(os.environ["IMPORT_TIME_BUDGET_MS"])
+    total_ms = timings["run"][1] / 1000
+    assert total_ms <= budget_ms, f"import run took {total_ms:.0f} ms (budget {budget_ms:.0f} ms)"
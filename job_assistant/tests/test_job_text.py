@@ -0,0 +1,79 @@
+"""Tests for job posting text clean-up."""
+
+from job_assistant.utils.job_text import clean_job_text
+
+RESPONSIBILITIES = [
+    "You will lead our workplace strategy across the UK offices.",
+    "- Design training programmes for line managers",
+    "- Report progress to the executive team each quarter",
+    "- Partner with recruitment on fair hiring practices",
+]
+
+
+def _posting(title: str) -> str:
+    return "\n".join([title, "Acme Ltd, London (hybrid)", *RESPONSIBILITIES])
+
+
+def test_title_with_section_keyword_is_kept_with_its_content():
+    for title in (
+        "Diversity and Inclusion Manager",
+        "Accessibility Specialist",
+        "Benefits Analyst",
+        "BENEFITS ANALYST",
+    ):
+        cleaned = clean_job_text(_posting(title))
+        assert cleaned.text.splitlines()[0] == title
+        for line in RESPONSIBILITIES:
+            assert line in cleaned.text
+        assert cleaned.sections == []
+
+
+def test_unmarked_keyword_line_is_not_a_heading():
+    text = "\n".join([
+        "Payroll Officer",
+        "Benefits Analyst",
+        *(f"Duty {i} for the payroll team" for i in range(10)),
+    ])
+    cleaned = clean_job_text(text)
+    assert cleaned.text == text
+    assert cleaned.sections == []
+
+
+def test_marked_headings_start_sections():
+    lines = ["Finance Analyst", "Requirements:", "## Benefits", "**How to apply**", "KEY DUTIES"]
+    cleaned = clean_job_text("\n".join(lines))
+    assert cleaned.sections == ["requirements", "benefits", "apply", "responsibilities"]
+
+
+def test_benefits_section_is_capped_but_keeps_pay():
+    perks = [f"Perk number {i}" for i in range(10)]
+    text = "\n".join(["Finance Analyst", "Benefits:", *perks, "Salary £40,000 per annum"])
+    cleaned = clean_job_text(text)
+    assert perks[5] in cleaned.text
+    assert perks[6] not in cleaned.text
+    assert "Salary £40,000 per annum" in cleaned.text
+
+
+def test_only_boilerplate_sentences_under_eeo_heading_are_dropped():
+    text = "\n".join([
+        "Finance Analyst",
+        "Equality and inclusion:",
+        "We are an equal opportunities employer.",
+        "Our inclusion network runs monthly mentoring sessions.",
+    ])
+    cleaned = clean_job_text(text)
+    assert "equal opportunities employer" not in cleaned.text
+    assert "Our inclusion network runs monthly mentoring sessions." in cleaned.text
+    assert cleaned.removed["eeo"] == 1
+
+
+def test_boilerplate_is_kept_in_requirements():
+    text = "\n".join([
+        "HR Advisor",
+        "Requirements:",
+        "Knowledge of reasonable adjustment processes",
+        "Cookie policy",
+    ])
+    cleaned = clean_job_text(text)
+    assert "Knowledge of reasonable adjustment processes" in cleaned.text
+    assert "Cookie policy" in cleaned.text
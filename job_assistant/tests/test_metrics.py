@@ -0,0 +1,60 @@
+"""Tests for agent metric summaries."""
+
+from job_assistant.config import settings
+from job_assistant.utils.metrics import estimate_cost, summarize_agent_metrics
+
+
+def _row(agent: str, started_at: float, wall_ms: float, application_id: int = 1) -> dict:
+    return {
+        "application_id": application_id,
+        "created_at": "2026-01-01T00:00:00",
+        "agent": agent,
+        "model": "test",
+        "started_at": started_at,
+        "wall_ms": wall_ms,
+        "retrieval_ms": 0.0,
+        "prompt_tokens": 100,
+        "completion_tokens": 10,
+        "cost_usd": 0.001,
+        "retries": 0,
+        "cached": 0,
+    }
+
+
+def test_total_wall_time_counts_parallel_calls_once():
+    rows = [
+        _row("JobAnalyzerAgent", 100.0, 1000),
+        _row("ContentWriterAgent", 101.0, 2000),
+        _row("StrategyAdvisorAgent", 101.0, 1500),
+    ]
+    total = summarize_agent_metrics(rows)[-1]
+    assert total["agent"] == "Total"
+    assert total["calls"] == 1
+    assert total["wall_p50"] == 3000
+    assert total["tokens_p50"] == 330
+
+
+def test_total_falls_back_to_summed_time_without_start_times():
+    rows = [_row("JobAnalyzerAgent", None, 1000), _row("ContentWriterAgent", None, 2000)]
+    assert summarize_agent_metrics(rows)[-1]["wall_p50"] == 3000
+
+
+def test_escalations_are_counted_against_fast_tier_calls(monkeypatch):
+    monkeypatch.setattr(settings, "fast_model", "fast")
+    rows = [
+        {**_row("JobAnalyzerAgent", 100.0, 500), "model": "fast", "escalated": 0},
+        {**_row("JobAnalyzerAgent", 200.0, 900, 2), "model": "test", "escalated": 1},
+        {**_row("JobAnalyzerAgent", 300.0, 900, 3), "model": "test", "escalated": 0},
+    ]
+    analyzer, total = summarize_agent_metrics(rows)
+    assert (analyzer["escalated"], analyzer["fast_tier"]) == (1, 2)
+    assert (total["escalated"], total["fast_tier"]) == (1, 2)
+
+
+def test_cost_is_priced_per_model(monkeypatch):
+    monkeypatch.setattr(settings, "fast_model", "")
+    monkeypatch.setattr(settings, "llm_input_cost_per_mtok", 0.10)
+    monkeypatch.setattr(settings, "llm_output_cost_per_mtok", 0.40)
+    assert estimate_cost(1_000_000, 0, "gemini-2.5-pro") == 1.25
+    assert estimate_cost(1_000_000, 0, "models/gemini-2.5-pro") == 1.25
+    assert estimate_cost(0, 1_000_000, "some-unlisted-model") == 0.40
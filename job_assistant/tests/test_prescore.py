@@ -0,0 +1,28 @@
+"""Tests for local skill pre-scoring."""
+
+from job_assistant.config import settings
+from job_assistant.rag.prescore import _score
+
+
+def test_no_retrieved_chunk_is_a_gap_even_with_zero_thresholds(monkeypatch):
+    monkeypatch.setattr(settings, "prescore_partial_similarity", 0.0)
+    monkeypatch.setattr(settings, "prescore_strong_similarity", 0.0)
+    far = {"id": "a", "text": "Managed payroll", "distance": 1.2, "metadata": {}}
+    for results in ([], [far]):
+        score = _score("Kubernetes", True, results)
+        assert score.strength == "gap"
+        assert score.source == ""
+
+
+def test_verbatim_mention_is_evidence():
+    chunk = {
+        "id": "a",
+        "text": "## Skills\n- Built Power BI dashboards for finance",
+        "distance": 0.7,
+        "metadata": {"source": "cv.md"},
+    }
+    score = _score("Power BI", True, [chunk])
+    assert score.lexical
+    assert score.strength == "partial"
+    assert score.evidence == "Built Power BI dashboards for finance"
+    assert score.source == "cv.md"
@@ -0,0 +1,36 @@
+"""Tests for the knowledge base retriever's index version tracking."""
+
+import os
+
+from job_assistant.rag import manifest
+from job_assistant.rag.retriever import KnowledgeBaseRetriever
+
+
+def _write_manifest(path, chunks: dict) -> None:
+    manifest.save_manifest({
+        "collection": "test",
+        "vector_backend": "numpy",
+        "embedding": "test",
+        "files": {},
+        "chunks": chunks,
+    })
+
+
+def test_reindex_by_another_process_is_picked_up(tmp_path, monkeypatch):
+    path = tmp_path / "kb_manifest.json"
+    monkeypatch.setattr(manifest, "KB_MANIFEST_PATH", path)
+    monkeypatch.setattr("job_assistant.rag.retriever.RETRIEVAL_CACHE_PATH", tmp_path / "r.db")
+    _write_manifest(path, {"a": {"source": "cv.md", "section": "Skills"}})
+
+    retriever = KnowledgeBaseRetriever()
+    before = retriever.kb_version
+    retriever._store = retriever._lexical = object()  # Stand-ins for loaded indexes
+    assert retriever.kb_version == before
+    assert retriever._store is not None
+
+    # Another process rewrites the manifest for new content
+    _write_manifest(path, {"b": {"source": "cv.md", "section": "Experience"}})
+    os.utime(path, ns=(1, 1))
+
+    assert retriever.kb_version not in (None, before)
+    assert retriever._store is None and retriever._lexical is None